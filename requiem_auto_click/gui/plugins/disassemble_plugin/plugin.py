@@ -246,9 +246,11 @@ class DisassemblePlugin(PluginInterface):
             if nk and nk not in nick_to_login:
                 nick_to_login[nk] = str(r.login or "").strip()
 
+        # активные PID по никам одним проходом вместо скана states на каждый ник
+        active_pids = login_state.active_pids_by_nickname(states)
         out: list[ClientItem] = []
         for nick in nicknames:
-            pid = int(login_state.active_pid_for_nickname(states, nick))
+            pid = int(active_pids.get(str(nick).strip(), 0))
             out.append(
                 ClientItem(
                     nickname=str(nick).strip(),
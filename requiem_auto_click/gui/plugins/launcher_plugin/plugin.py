@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 # pylint: disable=import-error,no-name-in-module,broad-exception-caught
+import functools
+import itertools
 import json
 import os
 import shlex
 import subprocess
 import threading
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QMetaObject, Qt, Q_ARG, QTimer, Slot
@@ -39,7 +43,7 @@ from ..utils.windows import (
     pid_exists,
     terminate_process,
 )
-from .ui import LaunchRowWidget, LauncherWidget
+from .ui import LaunchRowWidget, LauncherWidget, RowState
 from ....modules.login.auto_login import (
     ENTER_CHAR_TIMEOUT_S_DEFAULT,
     LOGIN_TIMEOUT_S_DEFAULT,
@@ -51,8 +55,53 @@ from ....modules.login.auto_login import (
 )
 
 
+try:
+    # orjson (C-расширение) заметно быстрее stdlib json; зависимость необязательная
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
 WINDOW_TITLE = "Requiem"
 
+# специализация с фиксированным заголовком — дешевле в горячем 5 Гц-опросе автологина
+_find_requiem_hwnd = functools.partial(find_hwnd_by_pid_and_exact_title, title=WINDOW_TITLE)
+
+
+@dataclass(slots=True)
+class _AutologinSettings:
+    """Снимок настроек автологина вкладки (читается одним заходом)."""
+
+    wait_hwnd_timeout_s: float
+    login_timeout_s: float
+    select_server_timeout_s: float
+    enter_char_timeout_s: float
+    pin_block_timeout_s: float
+    pin_digit_timeout_s: float
+    pin_delay_ms: float
+
+
+@dataclass(slots=True)
+class _LaunchRowState:
+    """Состояние одной строки запуска (вместо набора параллельных dict'ов)."""
+
+    login: str = ""
+    password: str = ""
+    slot: int = 1
+    nickname: str = ""
+    pin: str = ""
+    selected: bool = False
+    pid: int = 0
+    proc: subprocess.Popen | None = None
+    autologin_cancel: threading.Event | None = None
+    autologin_done: threading.Event | None = None
+    autologin_ok: bool = False
+    autologin_thread: threading.Thread | None = None
+
 
 class LauncherPlugin(PluginInterface):
     """Плагин: запуск новых окон и мониторинг активных окон Requiem."""
@@ -66,31 +115,47 @@ class LauncherPlugin(PluginInterface):
         self._ui_bridge: dict[str, QObject] = {}
 
         self._row_ids: dict[str, list[str]] = {}
-        self._row_login: dict[str, str] = {}
-        self._row_password: dict[str, str] = {}
-        self._row_slot: dict[str, int] = {}
-        self._row_nickname: dict[str, str] = {}
-        self._row_pin: dict[str, str] = {}
-        self._row_selected: dict[str, bool] = {}
+        # всё состояние строки в одном объекте (один dict-lookup вместо 8+)
+        self._rows: dict[str, _LaunchRowState] = {}
+        # обратный индекс pid -> row_id per tab (O(1) вместо скана строк)
+        self._pid_to_row: dict[str, dict[int, str]] = {}
+        # инкрементальный индекс ник -> row_ids (для O(1) проверки уникальности)
+        self._nick_index: dict[str, dict[str, set[str]]] = {}
         # sequential multi-start (UI-thread via QTimer)
         self._seq_timer: dict[str, QTimer] = {}
         self._seq_queue: dict[str, list[str]] = {}
         self._seq_current: dict[str, str] = {}
         self._seq_deadline_ts: dict[str, float] = {}
         self._seq_attempt: dict[str, int] = {}
-        self._row_autologin_done: dict[str, threading.Event] = {}
-        self._row_autologin_ok: dict[str, bool] = {}
-        self._row_proc: dict[str, subprocess.Popen] = {}
-        self._row_pid: dict[str, int] = {}
-
-        # auto-login workers per row (best-effort)
-        self._row_autologin_cancel: dict[str, threading.Event] = {}
-        self._row_autologin_thread: dict[str, threading.Thread] = {}
 
         # multi-start UI mode per tab: off | select | running
         self._multi_mode: dict[str, str] = {}
+        # монотонные счётчики row_id per tab (без time() и без коллизий)
+        self._row_counter: dict[str, itertools.count] = {}
+        # подавление промежуточных синков UI при пакетных изменениях
+        self._batch_depth: dict[str, int] = {}
+        self._batch_dirty: set[str] = set()
+        # инкрементально поддерживаемые наборы выбранных ников/логинов per tab
+        self._selected_nicks: dict[str, set[str]] = {}
+        self._selected_logins: dict[str, set[str]] = {}
+        # счётчик выбранных строк per tab (O(1) вместо any(...) по всем строкам)
+        self._selected_count: dict[str, int] = {}
+        # вкладки, чьи строки менялись с прошлого тика мониторинга
+        self._rows_mutated_since_tick: set[str] = set()
+        # адаптивный интервал опроса per tab (растёт в простое, сбрасывается при изменениях)
+        self._current_interval: dict[str, float] = {}
+        # подпись последнего списка "неопределённых" окон, отправленного в UI
+        self._last_items_sig: dict[str, int] = {}
+        # событие немедленного пробуждения цикла мониторинга per tab
+        self._monitor_wake: dict[str, threading.Event] = {}
+        # видимость виджета per tab: скрытая вкладка опрашивается в 5 раз реже
+        self._widget_visible: dict[str, bool] = {}
         # cached refresh interval (to avoid reading QSettings from worker thread)
         self._refresh_interval_seconds_cache: dict[str, int] = {}
+        # подпись последнего снимка окон (чтобы не сериализовать без изменений)
+        self._last_windows_sig: dict[str, int] = {}
+        # разобранная команда запуска per tab: (raw_cmd, argv, exe_path)
+        self._cmd_cache: dict[str, tuple[str, list[str], Path]] = {}
 
     def get_key(self) -> str:
         return "launcher_plugin"
@@ -192,6 +257,7 @@ class LauncherPlugin(PluginInterface):
         )
         self._widgets[tab_id] = w
         self._multi_mode.setdefault(tab_id, "off")
+        w.visibility_changed.connect(lambda vis, tid=tab_id: self._on_visibility_changed(tid, bool(vis)))
         # Cache refresh interval in UI thread
         try:
             self._refresh_interval_seconds_cache[tab_id] = int(self._get_refresh_interval_seconds(tab_id))
@@ -203,6 +269,19 @@ class LauncherPlugin(PluginInterface):
         ctx = tab_context
 
         class _UiBridge(QObject):
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                # коалесценция persist'ов: несколько сбросов PID за тик — одна запись QSettings
+                self._persist_timer = QTimer(self)
+                self._persist_timer.setSingleShot(True)
+                self._persist_timer.setInterval(400)
+                self._persist_timer.timeout.connect(self.persist_rows)
+
+            @Slot()
+            def mark_persist_dirty(self) -> None:
+                if not self._persist_timer.isActive():
+                    self._persist_timer.start()
+
             @Slot(str)
             def save_windows_snapshot_json(self, payload: str) -> None:
                 try:
@@ -218,6 +297,24 @@ class LauncherPlugin(PluginInterface):
                 except Exception:
                     pass
 
+            @Slot(object)
+            def apply_tick_update(self, update: object) -> None:
+                """Один queued-вызов на тик мониторинга вместо трёх отдельных."""
+                if not isinstance(update, dict):
+                    return
+                payload = update.get("snapshot_json")
+                if payload:
+                    self.save_windows_snapshot_json(str(payload))
+                if update.get("persist"):
+                    self.mark_persist_dirty()
+                items = update.get("windows")
+                if items is not None:
+                    try:
+                        # pylint: disable=protected-access
+                        w._set_windows(items)
+                    except Exception:
+                        pass
+
         self._ui_bridge[tab_id] = _UiBridge(parent=w)
 
         # timer lives in UI thread (parent = widget)
@@ -276,14 +373,12 @@ class LauncherPlugin(PluginInterface):
         if not isinstance(data, list):
             return
         self._row_ids[tab_id] = []
+        self._nick_index[tab_id] = {}
         for i, item in enumerate(data):
             if not isinstance(item, dict):
                 continue
             row_id = f"{tab_id}_row_{i}"
             self._row_ids[tab_id].append(row_id)
-            self._row_login[row_id] = str(item.get("login", "") or "").strip()
-            # пароль сохраняем по запросу пользователя (осторожно: хранится в QSettings как текст)
-            self._row_password[row_id] = str(item.get("password", "") or "")
             try:
                 slot = int(item.get("slot", 1) or 1)
             except Exception:
@@ -292,15 +387,25 @@ class LauncherPlugin(PluginInterface):
                 slot = 1
             if slot > 8:
                 slot = 8
-            self._row_slot[row_id] = slot
-            self._row_nickname[row_id] = str(item.get("nickname", "") or "").strip()
-            self._row_pin[row_id] = str(item.get("pin", "") or "").strip()[:4]
-            # selection is session-only (do not persist) to avoid UI lag
-            self._row_selected[row_id] = False
             try:
-                self._row_pid[row_id] = int(item.get("pid", 0) or 0)
+                pid = int(item.get("pid", 0) or 0)
             except Exception:
-                self._row_pid[row_id] = 0
+                pid = 0
+            row = _LaunchRowState(
+                login=str(item.get("login", "") or "").strip(),
+                # пароль сохраняем по запросу пользователя (осторожно: хранится в QSettings как текст)
+                password=str(item.get("password", "") or ""),
+                slot=slot,
+                nickname=str(item.get("nickname", "") or "").strip(),
+                pin=str(item.get("pin", "") or "").strip()[:4],
+                # selection is session-only (do not persist) to avoid UI lag
+                selected=False,
+                pid=pid,
+            )
+            self._rows[row_id] = row
+            self._nick_index_add(tab_id, row_id, row.nickname)
+            if row.pid > 0:
+                self._pid_to_row.setdefault(tab_id, {})[row.pid] = row_id
 
     def _persist_rows_to_settings(self, tab_id: str) -> None:
         ctx = self._tab_contexts.get(tab_id)
@@ -308,14 +413,15 @@ class LauncherPlugin(PluginInterface):
             return
         rows = []
         for row_id in self._row_ids.get(tab_id, []):
+            row = self._row(row_id)
             rows.append(
                 {
-                    "login": str(self._row_login.get(row_id, "") or "").strip(),
-                    "password": str(self._row_password.get(row_id, "") or ""),
-                    "slot": int(self._row_slot.get(row_id, 1) or 1),
-                    "nickname": str(self._row_nickname.get(row_id, "") or "").strip(),
-                    "pin": str(self._row_pin.get(row_id, "") or "").strip()[:4],
-                    "pid": int(self._row_pid.get(row_id, 0) or 0),
+                    "login": row.login,
+                    "password": row.password,
+                    "slot": int(row.slot or 1),
+                    "nickname": row.nickname,
+                    "pin": row.pin,
+                    "pid": int(row.pid or 0),
                 }
             )
         try:
@@ -329,6 +435,47 @@ class LauncherPlugin(PluginInterface):
     # -----------------
     # Helpers
     # -----------------
+    def _set_row_pid(self, tab_id: str, row_id: str, pid: int) -> None:
+        """Записывает pid строки и поддерживает обратный индекс pid -> row_id."""
+        row = self._rows.get(row_id)
+        if row is None:
+            return
+        index = self._pid_to_row.setdefault(tab_id, {})
+        old = int(row.pid or 0)
+        if old > 0 and index.get(old) == row_id:
+            index.pop(old, None)
+        row.pid = int(pid or 0)
+        if row.pid > 0:
+            index[row.pid] = row_id
+        self._rows_mutated_since_tick.add(tab_id)
+
+    def _row(self, row_id: str) -> _LaunchRowState:
+        """Состояние строки; для неизвестного row_id — свежие значения по умолчанию."""
+        row = self._rows.get(row_id)
+        if row is None:
+            return _LaunchRowState()
+        return row
+
+    def _nick_index_add(self, tab_id: str, row_id: str, nick: str) -> None:
+        nick = str(nick or "").strip()
+        if not nick:
+            return
+        self._nick_index.setdefault(tab_id, {}).setdefault(nick, set()).add(row_id)
+
+    def _nick_index_remove(self, tab_id: str, row_id: str, nick: str) -> None:
+        nick = str(nick or "").strip()
+        if not nick:
+            return
+        by_nick = self._nick_index.get(tab_id)
+        if by_nick is None:
+            return
+        ids = by_nick.get(nick)
+        if ids is None:
+            return
+        ids.discard(row_id)
+        if not ids:
+            by_nick.pop(nick, None)
+
     @staticmethod
     def _parse_command(cmd: str) -> list[str]:
         return shlex.split(cmd, posix=False)
@@ -410,55 +557,84 @@ class LauncherPlugin(PluginInterface):
             return 1
         return int(v)
 
+    def _autologin_settings_snapshot(self, tab_id: str) -> _AutologinSettings:
+        """Читает все настройки автологина вкладки за один заход."""
+        get = self._get_tab_int_setting
+        return _AutologinSettings(
+            wait_hwnd_timeout_s=float(
+                get(tab_id, key=AUTOLOGIN_WAIT_HWND_TIMEOUT_SECONDS_SETTING_KEY, default_v=90, min_v=0)
+            ),
+            login_timeout_s=float(
+                get(tab_id, key=AUTOLOGIN_LOGIN_TIMEOUT_SECONDS_SETTING_KEY, default_v=int(LOGIN_TIMEOUT_S_DEFAULT), min_v=0)
+            ),
+            select_server_timeout_s=float(
+                get(
+                    tab_id,
+                    key=AUTOLOGIN_SELECT_SERVER_TIMEOUT_SECONDS_SETTING_KEY,
+                    default_v=int(SELECT_SERVER_TIMEOUT_S_DEFAULT),
+                    min_v=0,
+                )
+            ),
+            enter_char_timeout_s=float(
+                get(
+                    tab_id,
+                    key=AUTOLOGIN_ENTER_CHAR_TIMEOUT_SECONDS_SETTING_KEY,
+                    default_v=int(ENTER_CHAR_TIMEOUT_S_DEFAULT),
+                    min_v=0,
+                )
+            ),
+            pin_block_timeout_s=float(
+                get(
+                    tab_id,
+                    key=AUTOLOGIN_PIN_BLOCK_TIMEOUT_SECONDS_SETTING_KEY,
+                    default_v=int(PIN_BLOCK_TIMEOUT_S_DEFAULT),
+                    min_v=0,
+                )
+            ),
+            pin_digit_timeout_s=float(
+                get(
+                    tab_id,
+                    key=AUTOLOGIN_PIN_DIGIT_TIMEOUT_SECONDS_SETTING_KEY,
+                    default_v=int(PIN_DIGIT_TIMEOUT_S_DEFAULT),
+                    min_v=0,
+                )
+            ),
+            pin_delay_ms=float(
+                get(
+                    tab_id,
+                    key=AUTOLOGIN_PIN_DELAY_MS_SETTING_KEY,
+                    default_v=int(float(PIN_AFTER_DIGIT_MOVE_DELAY_S) * 1000.0),
+                    min_v=0,
+                )
+            ),
+        )
+
     def _seq_deadline_seconds(self, tab_id: str) -> float:
         """
         Best-effort deadline for sequential start of one row.
         If any stage timeout is 0 (infinite), returns 0.0 (no deadline).
         """
-        wait_hwnd = float(
-            self._get_tab_int_setting(tab_id, key=AUTOLOGIN_WAIT_HWND_TIMEOUT_SECONDS_SETTING_KEY, default_v=90, min_v=0)
-        )
-        login_to = float(
-            self._get_tab_int_setting(
-                tab_id, key=AUTOLOGIN_LOGIN_TIMEOUT_SECONDS_SETTING_KEY, default_v=int(LOGIN_TIMEOUT_S_DEFAULT), min_v=0
-            )
+        s = self._autologin_settings_snapshot(tab_id)
+        stages = (
+            s.wait_hwnd_timeout_s,
+            s.login_timeout_s,
+            s.select_server_timeout_s,
+            s.enter_char_timeout_s,
+            s.pin_block_timeout_s,
+            s.pin_digit_timeout_s,
         )
-        srv_to = float(
-            self._get_tab_int_setting(
-                tab_id,
-                key=AUTOLOGIN_SELECT_SERVER_TIMEOUT_SECONDS_SETTING_KEY,
-                default_v=int(SELECT_SERVER_TIMEOUT_S_DEFAULT),
-                min_v=0,
-            )
-        )
-        char_to = float(
-            self._get_tab_int_setting(
-                tab_id,
-                key=AUTOLOGIN_ENTER_CHAR_TIMEOUT_SECONDS_SETTING_KEY,
-                default_v=int(ENTER_CHAR_TIMEOUT_S_DEFAULT),
-                min_v=0,
-            )
-        )
-        pin_block_to = float(
-            self._get_tab_int_setting(
-                tab_id,
-                key=AUTOLOGIN_PIN_BLOCK_TIMEOUT_SECONDS_SETTING_KEY,
-                default_v=int(PIN_BLOCK_TIMEOUT_S_DEFAULT),
-                min_v=0,
-            )
-        )
-        pin_digit_to = float(
-            self._get_tab_int_setting(
-                tab_id,
-                key=AUTOLOGIN_PIN_DIGIT_TIMEOUT_SECONDS_SETTING_KEY,
-                default_v=int(PIN_DIGIT_TIMEOUT_S_DEFAULT),
-                min_v=0,
-            )
-        )
-        if any(x <= 0.0 for x in (wait_hwnd, login_to, srv_to, char_to, pin_block_to, pin_digit_to)):
+        if any(x <= 0.0 for x in stages):
             return 0.0
         # 4 digits worst-case + small buffer
-        total = wait_hwnd + login_to + srv_to + char_to + pin_block_to + (4.0 * pin_digit_to) + 30.0
+        total = (
+            s.wait_hwnd_timeout_s
+            + s.login_timeout_s
+            + s.select_server_timeout_s
+            + s.enter_char_timeout_s
+            + s.pin_block_timeout_s
+            + (4.0 * s.pin_digit_timeout_s)
+            + 30.0
+        )
         if total < 30.0:
             return 30.0
         return float(total)
@@ -466,22 +642,23 @@ class LauncherPlugin(PluginInterface):
     def _rows_state(self, tab_id: str) -> list[login_state.LoginRowState]:
         out: list[login_state.LoginRowState] = []
         for row_id in self._row_ids.get(tab_id, []):
+            row = self._row(row_id)
             out.append(
                 login_state.LoginRowState(
                     row_id=row_id,
-                    login=str(self._row_login.get(row_id, "") or "").strip(),
-                    nickname=str(self._row_nickname.get(row_id, "") or "").strip(),
-                    pid=int(self._row_pid.get(row_id, 0) or 0),
+                    login=row.login,
+                    nickname=row.nickname,
+                    pid=int(row.pid or 0),
                 )
             )
         return out
 
     def _row_password_value(self, row_id: str) -> str:
-        return str(self._row_password.get(row_id, "") or "")
+        return self._row(row_id).password
 
     def _row_slot_value(self, row_id: str) -> int:
         try:
-            v = int(self._row_slot.get(row_id, 1) or 1)
+            v = int(self._row(row_id).slot or 1)
         except Exception:
             v = 1
         if v < 1:
@@ -491,22 +668,32 @@ class LauncherPlugin(PluginInterface):
         return v
 
     def _row_nickname_value(self, row_id: str) -> str:
-        return str(self._row_nickname.get(row_id, "") or "").strip()
+        return self._row(row_id).nickname
 
     def _row_pin_value(self, row_id: str) -> str:
-        raw = str(self._row_pin.get(row_id, "") or "")
+        raw = str(self._row(row_id).pin or "")
         digits = "".join([c for c in raw if c.isdigit()])
         return digits[:4]
 
     def _cancel_autologin(self, row_id: str) -> None:
-        ev = self._row_autologin_cancel.get(row_id)
-        if ev is not None:
-            ev.set()
+        row = self._rows.get(row_id)
+        if row is None:
+            return
+        if row.autologin_cancel is not None:
+            row.autologin_cancel.set()
         # если последовательный запуск ждёт завершения — размораживаем
-        done = self._row_autologin_done.get(row_id)
-        if done is not None:
-            self._row_autologin_ok[row_id] = False
-            done.set()
+        if row.autologin_done is not None:
+            row.autologin_ok = False
+            row.autologin_done.set()
+
+    def _clear_autologin_state(self, row_id: str) -> None:
+        """Отпускает Event/Thread завершённого autologin-worker'а (иначе копятся)."""
+        row = self._rows.get(row_id)
+        if row is None:
+            return
+        row.autologin_cancel = None
+        row.autologin_done = None
+        row.autologin_thread = None
 
     def _cancel_all_autologin_for_tab(self, tab_id: str) -> None:
         for rid in list(self._row_ids.get(tab_id, [])):
@@ -543,7 +730,7 @@ class LauncherPlugin(PluginInterface):
             self._console(tab_id, "[WARN] Сначала нажмите Run (мониторинг должен быть активен).")
             return
 
-        selected_ids = [rid for rid in self._row_ids.get(tab_id, []) if bool(self._row_selected.get(rid, False))]
+        selected_ids = [rid for rid in self._row_ids.get(tab_id, []) if self._row(rid).selected]
         if not selected_ids:
             self._console(tab_id, "[WARN] Мультизапуск: ничего не выбрано.")
             return
@@ -555,11 +742,16 @@ class LauncherPlugin(PluginInterface):
         t = self._seq_timer.get(tab_id)
         if t is not None and not t.isActive():
             t.start()
-        # run first tick immediately
+        # run first tick immediately (промежуточные синки подавляются батчем)
         self._seq_tick(tab_id)
 
     def _seq_tick(self, tab_id: str) -> None:
         # Runs in UI thread (QTimer parented to widget).
+        # Запуск строки дёргает persist/sync несколько раз — схлопываем в один sync.
+        with self._batch_ui(tab_id):
+            self._seq_tick_impl(tab_id)
+
+    def _seq_tick_impl(self, tab_id: str) -> None:
         if not self._monitoring_active.get(tab_id, False):
             self._seq_stop(tab_id)
             return
@@ -573,11 +765,13 @@ class LauncherPlugin(PluginInterface):
         # If currently waiting for a row to finish autologin
         cur = self._seq_current.get(tab_id, "")
         if cur:
-            ev = self._row_autologin_done.get(cur)
+            cur_row = self._row(cur)
+            ev = cur_row.autologin_done
             if ev is not None and ev.is_set():
-                ok = bool(self._row_autologin_ok.get(cur, False))
+                ok = bool(cur_row.autologin_ok)
                 if ok:
                     self._console(tab_id, f"[OK] Мультизапуск: nick={self._row_nickname_value(cur)!r} ok=True")
+                    self._clear_autologin_state(cur)
                     self._seq_current.pop(tab_id, None)
                     self._seq_deadline_ts.pop(tab_id, None)
                     self._seq_attempt.pop(tab_id, None)
@@ -585,6 +779,7 @@ class LauncherPlugin(PluginInterface):
                 # ok=False -> apply policy
                 if self._seq_handle_failure(tab_id, cur, reason="ok=false"):
                     return
+                self._clear_autologin_state(cur)
                 self._seq_current.pop(tab_id, None)
                 self._seq_deadline_ts.pop(tab_id, None)
                 self._seq_attempt.pop(tab_id, None)
@@ -596,6 +791,7 @@ class LauncherPlugin(PluginInterface):
                 self._cancel_autologin(cur)
                 if self._seq_handle_failure(tab_id, cur, reason="deadline"):
                     return
+                self._clear_autologin_state(cur)
                 self._seq_current.pop(tab_id, None)
                 self._seq_deadline_ts.pop(tab_id, None)
                 self._seq_attempt.pop(tab_id, None)
@@ -610,12 +806,12 @@ class LauncherPlugin(PluginInterface):
             # persist shortened queue
             self._seq_queue[tab_id] = list(queue)
 
-            if int(self._row_pid.get(rid, 0) or 0) > 0:
+            if self._row(rid).pid > 0:
                 continue  # already running
-            lg = str(self._row_login.get(rid, "") or "").strip()
+            lg = self._row(rid).login
             if lg and (lg in active_logins):
                 continue  # login already running elsewhere
-            nk = str(self._row_nickname.get(rid, "") or "").strip()
+            nk = self._row(rid).nickname
             if nk and (nk in active_nicks):
                 continue  # nickname already running elsewhere
 
@@ -623,8 +819,7 @@ class LauncherPlugin(PluginInterface):
             self._launch_new_window(tab_id, rid)
 
             # if autologin not started (invalid fields) -> continue
-            ev = self._row_autologin_done.get(rid)
-            if ev is None:
+            if self._row(rid).autologin_done is None:
                 continue
             self._seq_current[tab_id] = rid
             self._seq_attempt[tab_id] = 1
@@ -636,7 +831,22 @@ class LauncherPlugin(PluginInterface):
         self._console(tab_id, "[OK] Мультизапуск: завершён")
         self._seq_stop(tab_id)
 
+    @contextmanager
+    def _batch_ui(self, tab_id: str):
+        """Откладывает _sync_ui_state/_sync_multistart_ui до выхода из блока."""
+        self._batch_depth[tab_id] = self._batch_depth.get(tab_id, 0) + 1
+        try:
+            yield
+        finally:
+            self._batch_depth[tab_id] -= 1
+            if self._batch_depth[tab_id] <= 0 and tab_id in self._batch_dirty:
+                self._batch_dirty.discard(tab_id)
+                self._sync_ui_state(tab_id)
+
     def _sync_ui_state(self, tab_id: str) -> None:
+        if self._batch_depth.get(tab_id, 0) > 0:
+            self._batch_dirty.add(tab_id)
+            return
         widget = self._widgets.get(tab_id)
         if widget is None or not hasattr(widget, "_row_widgets_by_id"):
             return
@@ -650,8 +860,10 @@ class LauncherPlugin(PluginInterface):
         for r in rows:
             if r.is_active and not pid_exists(int(r.pid)):
                 self._console(tab_id, f"[WARN] PID={r.pid} (login={r.login!r}) не существует -> сброс.")
-                self._row_pid[r.row_id] = 0
-                self._row_proc.pop(r.row_id, None)
+                row = self._rows.get(r.row_id)
+                if row is not None:
+                    self._set_row_pid(tab_id, r.row_id, 0)
+                    row.proc = None
                 self._cancel_autologin(r.row_id)
                 changed = True
         if changed:
@@ -664,22 +876,12 @@ class LauncherPlugin(PluginInterface):
         # nick uniqueness among all rows
         nick_counts: dict[str, int] = {}
         for r in rows:
-            n = str(r.nickname or "").strip()
+            n = r.nickname
             if n:
                 nick_counts[n] = nick_counts.get(n, 0) + 1
 
         multi_mode = str(self._multi_mode.get(tab_id, "off") or "off")
         multistart_select = monitoring_on and (multi_mode == "select")
-        selected_nicks: set[str] = set()
-        selected_logins: set[str] = set()
-        for rid in self._row_ids.get(tab_id, []):
-            if bool(self._row_selected.get(rid, False)):
-                nk = str(self._row_nickname.get(rid, "") or "").strip()
-                if nk:
-                    selected_nicks.add(nk)
-                lg = str(self._row_login.get(rid, "") or "").strip()
-                if lg:
-                    selected_logins.add(lg)
         ordered_ids = list(self._row_ids.get(tab_id, []))
         row_widgets_by_id: dict[str, LaunchRowWidget] = getattr(widget, "_row_widgets_by_id")
 
@@ -687,12 +889,12 @@ class LauncherPlugin(PluginInterface):
             row_w = row_widgets_by_id.get(row_id)
             if row_w is None:
                 continue
-            login = str(self._row_login.get(row_id, "") or "").strip()
+            login = self._row(row_id).login
             password = self._row_password_value(row_id)
             slot = self._row_slot_value(row_id)
             pin = self._row_pin_value(row_id)
             nick = self._row_nickname_value(row_id)
-            pid = int(self._row_pid.get(row_id, 0) or 0)
+            pid = self._row(row_id).pid
             is_active = pid > 0
 
             same_login_active_elsewhere = (not is_active) and bool(login) and (login in active_logins)
@@ -722,47 +924,75 @@ class LauncherPlugin(PluginInterface):
             move_up_enabled = (not monitoring_on) and (idx > 0)
             move_down_enabled = (not monitoring_on) and (idx < (len(ordered_ids) - 1))
 
-            row_w.set_state(
+            row_w.set_state(RowState(
                 select_visible=bool(multistart_select),
-                selected=bool(self._row_selected.get(row_id, False)),
+                selected=bool(self._row(row_id).selected),
                 select_enabled=False,  # managed отдельно в _sync_multistart_ui()
                 nickname_ok=bool(nick) and bool(nick_unique),
-                pid=pid,
-                is_active=is_active,
-                start_enabled=start_enabled,
-                terminate_enabled=terminate_enabled,
-                check_enabled=check_enabled,
-                focus_toggle_enabled=focus_toggle_enabled,
-                allow_edit=allow_edit,
-                allow_delete=allow_delete,
-                move_up_enabled=move_up_enabled,
-                move_down_enabled=move_down_enabled,
-            )
+                pid=int(pid),
+                is_active=bool(is_active),
+                start_enabled=bool(start_enabled),
+                terminate_enabled=bool(terminate_enabled),
+                check_enabled=bool(check_enabled),
+                focus_toggle_enabled=bool(focus_toggle_enabled),
+                allow_edit=bool(allow_edit),
+                allow_delete=bool(allow_delete),
+                move_up_enabled=bool(move_up_enabled),
+                move_down_enabled=bool(move_down_enabled),
+            ))
 
         # available nicknames for monitor rows: only those not already active
         # UI показывает "ник (логин)", но внутреннее значение должно оставаться "ник".
         nicknames = login_state.unique_nicknames_in_order(rows)
         nick_to_login: dict[str, str] = {}
         for r in rows:
-            nk = str(r.nickname or "").strip()
+            nk = r.nickname
             if nk and nk not in nick_to_login:
-                nick_to_login[nk] = str(r.login or "").strip()
+                nick_to_login[nk] = r.login
         available = [
-            {"nickname": nk, "login": str(nick_to_login.get(nk, "") or "").strip()}
+            {"nickname": nk, "login": nick_to_login.get(nk, "")}
             for nk in nicknames
             if nk not in active_nicks
         ]
         widget.logins_changed.emit(available)  # signal name kept for compatibility
-        self._sync_multistart_ui(tab_id)
+        # rows/active_nicks/nick_counts уже посчитаны — не пересчитываем их ещё раз
+        self._sync_multistart_ui_impl(tab_id, rows=rows, active_nicks=active_nicks, nick_counts=nick_counts)
 
     # -----------------
     # Multi-start UI / selection (no persistence)
     # -----------------
     def _clear_multistart_selection(self, tab_id: str) -> None:
-        for rid in list(self._row_ids.get(tab_id, [])):
-            self._row_selected[rid] = False
+        # только чтение списка — копия не нужна
+        for rid in self._row_ids.get(tab_id, ()):
+            row = self._rows.get(rid)
+            if row is not None:
+                row.selected = False
+        self._selected_nicks.get(tab_id, set()).clear()
+        self._selected_logins.get(tab_id, set()).clear()
+        self._selected_count[tab_id] = 0
 
     def _sync_multistart_ui(self, tab_id: str) -> None:
+        if self._batch_depth.get(tab_id, 0) > 0:
+            # _sync_ui_state при flush вызовет и _sync_multistart_ui
+            self._batch_dirty.add(tab_id)
+            return
+        rows = self._rows_state(tab_id)
+        active_nicks = login_state.active_nicknames(rows)
+        nick_counts: dict[str, int] = {}
+        for r in rows:
+            n = r.nickname
+            if n:
+                nick_counts[n] = nick_counts.get(n, 0) + 1
+        self._sync_multistart_ui_impl(tab_id, rows=rows, active_nicks=active_nicks, nick_counts=nick_counts)
+
+    def _sync_multistart_ui_impl(
+        self,
+        tab_id: str,
+        *,
+        rows: list[login_state.LoginRowState],
+        active_nicks: set[str],
+        nick_counts: dict[str, int],
+    ) -> None:
         widget = self._widgets.get(tab_id)
         if widget is None or not hasattr(widget, "_row_widgets_by_id"):
             return
@@ -776,39 +1006,22 @@ class LauncherPlugin(PluginInterface):
         elif mode == "running":
             widget.set_multi_ui(mode="running", enabled=False)
         elif mode == "select":
-            any_selected = any(bool(self._row_selected.get(rid, False)) for rid in self._row_ids.get(tab_id, []))
-            widget.set_multi_ui(mode="ready", enabled=bool(any_selected))
+            widget.set_multi_ui(mode="ready", enabled=self._selected_count.get(tab_id, 0) > 0)
         else:
             widget.set_multi_ui(mode="arm", enabled=True)
 
         # checkboxes only in select mode, enabled only when nickname is not running
-        rows = self._rows_state(tab_id)
-        active_nicks = login_state.active_nicknames(rows)
-        nick_counts: dict[str, int] = {}
-        for r in rows:
-            n = str(r.nickname or "").strip()
-            if n:
-                nick_counts[n] = nick_counts.get(n, 0) + 1
-
-        selected_nicks: set[str] = set()
-        selected_logins: set[str] = set()
-        for rid in self._row_ids.get(tab_id, []):
-            if bool(self._row_selected.get(rid, False)):
-                nk = str(self._row_nickname.get(rid, "") or "").strip()
-                if nk:
-                    selected_nicks.add(nk)
-                lg = str(self._row_login.get(rid, "") or "").strip()
-                if lg:
-                    selected_logins.add(lg)
+        selected_nicks = self._selected_nicks.get(tab_id, set())
+        selected_logins = self._selected_logins.get(tab_id, set())
 
         row_widgets_by_id: dict[str, LaunchRowWidget] = getattr(widget, "_row_widgets_by_id")
         for rid in self._row_ids.get(tab_id, []):
             row_w = row_widgets_by_id.get(rid)
             if row_w is None:
                 continue
-            nk = str(self._row_nickname.get(rid, "") or "").strip()
-            lg = str(self._row_login.get(rid, "") or "").strip()
-            pid = int(self._row_pid.get(rid, 0) or 0)
+            nk = self._row(rid).nickname
+            lg = self._row(rid).login
+            pid = self._row(rid).pid
             is_active = pid > 0
 
             visible = monitoring_on and (mode == "select")
@@ -820,16 +1033,16 @@ class LauncherPlugin(PluginInterface):
                 and (nick_counts.get(nk, 0) <= 1)
             )
             # блокируем остальные чекбоксы с тем же ником
-            if (nk in selected_nicks) and (not bool(self._row_selected.get(rid, False))):
+            if (nk in selected_nicks) and (not self._row(rid).selected):
                 enabled = False
             # блокируем остальные чекбоксы с тем же логином
-            if lg and (lg in selected_logins) and (not bool(self._row_selected.get(rid, False))):
+            if lg and (lg in selected_logins) and (not self._row(rid).selected):
                 enabled = False
 
             try:
                 row_w.set_multistart_state(
                     visible=visible,
-                    checked=bool(self._row_selected.get(rid, False)),
+                    checked=self._row(rid).selected,
                     enabled=bool(enabled),
                 )
             except Exception:
@@ -855,7 +1068,7 @@ class LauncherPlugin(PluginInterface):
 
         if mode == "select":
             # start sequential
-            if not any(bool(self._row_selected.get(rid, False)) for rid in self._row_ids.get(tab_id, [])):
+            if self._selected_count.get(tab_id, 0) <= 0:
                 self._sync_multistart_ui(tab_id)
                 return
             self._multi_mode[tab_id] = "running"
@@ -890,8 +1103,7 @@ class LauncherPlugin(PluginInterface):
                 self._seq_stop(tab_id)
                 return True
             self._launch_new_window(tab_id, row_id)
-            ev = self._row_autologin_done.get(row_id)
-            if ev is None:
+            if self._row(row_id).autologin_done is None:
                 # relaunch failed -> treat as skipped
                 return False
             self._seq_current[tab_id] = row_id
@@ -908,7 +1120,8 @@ class LauncherPlugin(PluginInterface):
     # Row widgets
     # -----------------
     def _new_row_id(self, tab_id: str) -> str:
-        return f"{tab_id}_{int(time.time() * 1000)}_{len(self._row_ids.get(tab_id, []))}"
+        c = self._row_counter.setdefault(tab_id, itertools.count())
+        return f"{tab_id}_{next(c)}"
 
     def _ensure_row_widget(self, tab_id: str, row_id: str) -> None:
         widget = self._widgets.get(tab_id)
@@ -921,20 +1134,20 @@ class LauncherPlugin(PluginInterface):
             return
 
         row_w = LaunchRowWidget(
-            initial_login=str(self._row_login.get(row_id, "") or ""),
-            initial_password=str(self._row_password.get(row_id, "") or ""),
+            initial_login=str(self._row(row_id).login or ""),
+            initial_password=str(self._row(row_id).password or ""),
             initial_slot=int(self._row_slot_value(row_id)),
             initial_nickname=str(self._row_nickname_value(row_id)),
             initial_pin=str(self._row_pin_value(row_id)),
         )
 
         def _on_login_changed(new_login: str) -> None:
-            self._row_login[row_id] = str(new_login).strip()
+            self._rows[row_id].login = str(new_login).strip()
             self._persist_rows_to_settings(tab_id)
             self._sync_ui_state(tab_id)
 
         def _on_password_changed(new_password: str) -> None:
-            self._row_password[row_id] = str(new_password or "")
+            self._rows[row_id].password = str(new_password or "")
             self._persist_rows_to_settings(tab_id)
             self._sync_ui_state(tab_id)
 
@@ -947,22 +1160,40 @@ class LauncherPlugin(PluginInterface):
                 slot = 1
             if slot > 8:
                 slot = 8
-            self._row_slot[row_id] = slot
+            self._rows[row_id].slot = slot
             self._persist_rows_to_settings(tab_id)
             self._sync_ui_state(tab_id)
 
         def _on_nickname_changed(new_nick: str) -> None:
-            self._row_nickname[row_id] = str(new_nick or "").strip()
+            row = self._rows[row_id]
+            self._nick_index_remove(tab_id, row_id, row.nickname)
+            row.nickname = str(new_nick or "").strip()
+            self._nick_index_add(tab_id, row_id, row.nickname)
             self._persist_rows_to_settings(tab_id)
             self._sync_ui_state(tab_id)
 
         def _on_pin_changed(new_pin: str) -> None:
-            self._row_pin[row_id] = str(new_pin or "").strip()[:4]
+            self._rows[row_id].pin = str(new_pin or "").strip()[:4]
             self._persist_rows_to_settings(tab_id)
             self._sync_ui_state(tab_id)
 
         def _on_selected_changed(v: bool) -> None:
-            self._row_selected[row_id] = bool(v)
+            row = self._rows[row_id]
+            was_selected = row.selected
+            row.selected = bool(v)
+            if row.selected != was_selected:
+                delta = 1 if row.selected else -1
+                self._selected_count[tab_id] = max(0, self._selected_count.get(tab_id, 0) + delta)
+            nicks = self._selected_nicks.setdefault(tab_id, set())
+            logins = self._selected_logins.setdefault(tab_id, set())
+            if row.selected:
+                if row.nickname:
+                    nicks.add(row.nickname)
+                if row.login:
+                    logins.add(row.login)
+            else:
+                nicks.discard(row.nickname)
+                logins.discard(row.login)
             self._sync_multistart_ui(tab_id)
 
         def _on_start() -> None:
@@ -975,11 +1206,11 @@ class LauncherPlugin(PluginInterface):
             self._terminate_row_process(tab_id, row_id)
 
         def _on_check() -> None:
-            pid = int(self._row_pid.get(row_id, 0) or 0)
+            pid = self._row(row_id).pid
             self._focus_check_pid(tab_id, pid)
 
         def _on_focus_toggle() -> None:
-            pid = int(self._row_pid.get(row_id, 0) or 0)
+            pid = self._row(row_id).pid
             self._toggle_focus_pid(tab_id, pid)
 
         def _on_move_up() -> None:
@@ -1012,32 +1243,23 @@ class LauncherPlugin(PluginInterface):
     def _add_launch_row(self, tab_id: str) -> None:
         row_id = self._new_row_id(tab_id)
         self._row_ids.setdefault(tab_id, []).append(row_id)
-        self._row_login[row_id] = ""
-        self._row_password[row_id] = ""
-        self._row_slot[row_id] = 1
-        self._row_nickname[row_id] = ""
-        self._row_pin[row_id] = ""
-        self._row_selected[row_id] = False
-        self._row_pid[row_id] = 0
+        self._rows[row_id] = _LaunchRowState()
+        self._rows_mutated_since_tick.add(tab_id)
         self._ensure_row_widget(tab_id, row_id)
         self._persist_rows_to_settings(tab_id)
         self._sync_ui_state(tab_id)
 
     def _delete_launch_row(self, tab_id: str, row_id: str) -> None:
-        if int(self._row_pid.get(row_id, 0) or 0) > 0:
+        if self._row(row_id).pid > 0:
             self._console(tab_id, "[WARN] Нельзя удалить настройку с активным процессом. Сначала завершите процесс.")
             return
         self._cancel_autologin(row_id)
-        self._row_proc.pop(row_id, None)
-        self._row_pid.pop(row_id, None)
         if row_id in self._row_ids.get(tab_id, []):
             self._row_ids[tab_id] = [x for x in self._row_ids[tab_id] if x != row_id]
-        self._row_login.pop(row_id, None)
-        self._row_password.pop(row_id, None)
-        self._row_slot.pop(row_id, None)
-        self._row_nickname.pop(row_id, None)
-        self._row_pin.pop(row_id, None)
-        self._row_selected.pop(row_id, None)
+        self._nick_index_remove(tab_id, row_id, self._row(row_id).nickname)
+        self._set_row_pid(tab_id, row_id, 0)
+        self._rows.pop(row_id, None)
+        self._rows_mutated_since_tick.add(tab_id)
 
         widget = self._widgets.get(tab_id)
         if widget is not None and hasattr(widget, "_row_widgets_by_id"):
@@ -1057,7 +1279,7 @@ class LauncherPlugin(PluginInterface):
         if pid <= 0:
             self._console(tab_id, "[WARN] Проверка: PID не задан.")
             return
-        hwnd = int(find_hwnd_by_pid_and_exact_title(pid=pid, title=WINDOW_TITLE))
+        hwnd = int(_find_requiem_hwnd(pid=pid))
         if hwnd <= 0:
             self._console(tab_id, f"[WARN] Окно '{WINDOW_TITLE}' для PID={pid} не найдено.")
             return
@@ -1100,7 +1322,7 @@ class LauncherPlugin(PluginInterface):
                 self._console(tab_id, f"[ERROR] Не удалось вернуть фокус в GUI: {e}")
             return
 
-        hwnd = int(find_hwnd_by_pid_and_exact_title(pid=pid, title=WINDOW_TITLE))
+        hwnd = int(_find_requiem_hwnd(pid=pid))
         if hwnd <= 0:
             self._console(tab_id, f"[WARN] Окно '{WINDOW_TITLE}' для PID={pid} не найдено.")
             return
@@ -1110,11 +1332,12 @@ class LauncherPlugin(PluginInterface):
             self._console(tab_id, f"[ERROR] Не удалось переключить фокус на PID={pid}: {e}")
 
     def _terminate_row_process(self, tab_id: str, row_id: str) -> None:
-        pid = int(self._row_pid.get(row_id, 0) or 0)
+        pid = self._row(row_id).pid
         if pid <= 0:
             return
         self._cancel_autologin(row_id)
-        proc = self._row_proc.get(row_id)
+        self._clear_autologin_state(row_id)
+        proc = self._row(row_id).proc
         try:
             if proc is not None and proc.poll() is None:
                 proc.terminate()
@@ -1123,8 +1346,10 @@ class LauncherPlugin(PluginInterface):
         except Exception as e:
             self._console(tab_id, f"[ERROR] Не удалось завершить процесс PID={pid}: {e}")
             return
-        self._row_proc.pop(row_id, None)
-        self._row_pid[row_id] = 0
+        row = self._rows.get(row_id)
+        if row is not None:
+            row.proc = None
+            self._set_row_pid(tab_id, row_id, 0)
         self._persist_rows_to_settings(tab_id)
         self._sync_ui_state(tab_id)
         self._console(tab_id, f"[OK] Процесс PID={pid} завершён.")
@@ -1134,8 +1359,8 @@ class LauncherPlugin(PluginInterface):
         pid = int(pid or 0)
         if pid <= 0:
             return
-        login = str(self._row_login.get(row_id, "") or "").strip()
-        password = str(self._row_password.get(row_id, "") or "")
+        login = self._row(row_id).login
+        password = str(self._row(row_id).password or "")
         slot = int(self._row_slot_value(row_id))
         nickname = str(self._row_nickname_value(row_id))
         pin = str(self._row_pin_value(row_id))
@@ -1146,12 +1371,13 @@ class LauncherPlugin(PluginInterface):
 
         # cancel previous worker if any
         self._cancel_autologin(row_id)
+        row = self._rows[row_id]
         cancel = threading.Event()
-        self._row_autologin_cancel[row_id] = cancel
+        row.autologin_cancel = cancel
 
         done = threading.Event()
-        self._row_autologin_done[row_id] = done
-        self._row_autologin_ok[row_id] = False
+        row.autologin_done = done
+        row.autologin_ok = False
 
         t = threading.Thread(
             target=self._auto_login_worker,
@@ -1159,7 +1385,7 @@ class LauncherPlugin(PluginInterface):
             name=f"autologin-{pid}",
             daemon=True,
         )
-        self._row_autologin_thread[row_id] = t
+        row.autologin_thread = t
         t.start()
 
     def _auto_login_worker(
@@ -1180,77 +1406,26 @@ class LauncherPlugin(PluginInterface):
 
         ok = False
         try:
-            # Таймаут ожидания появления окна Requiem после запуска процесса
-            wait_hwnd_timeout = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_WAIT_HWND_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=90,
-                    min_v=0,
-                )
-            )
+            # Все настройки автологина читаем одним снимком (вместо 7 отдельных обращений)
+            st = self._autologin_settings_snapshot(tab_id)
             start_ts = time.time()
             hwnd = 0
-            while not cancel.is_set() and (wait_hwnd_timeout <= 0.0 or (time.time() - start_ts) < wait_hwnd_timeout):
-                hwnd = int(find_hwnd_by_pid_and_exact_title(pid=pid, title=WINDOW_TITLE))
+            while not cancel.is_set() and (
+                st.wait_hwnd_timeout_s <= 0.0 or (time.time() - start_ts) < st.wait_hwnd_timeout_s
+            ):
+                hwnd = int(_find_requiem_hwnd(pid=pid))
                 if hwnd > 0:
                     break
-                time.sleep(0.2)
+                # wait() возвращает True при отмене — выходим сразу, не досыпая
+                if cancel.wait(0.2):
+                    return
             if cancel.is_set():
                 return
             if hwnd <= 0:
                 self._console(tab_id, f"[WARN] Автологин: окно '{WINDOW_TITLE}' для PID={pid} не найдено (timeout).")
                 return
 
-            login_timeout_s = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_LOGIN_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=int(LOGIN_TIMEOUT_S_DEFAULT),
-                    min_v=0,
-                )
-            )
-            select_server_timeout_s = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_SELECT_SERVER_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=int(SELECT_SERVER_TIMEOUT_S_DEFAULT),
-                    min_v=0,
-                )
-            )
-            enter_char_timeout_s = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_ENTER_CHAR_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=int(ENTER_CHAR_TIMEOUT_S_DEFAULT),
-                    min_v=0,
-                )
-            )
-            pin_block_timeout_s = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_PIN_BLOCK_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=int(PIN_BLOCK_TIMEOUT_S_DEFAULT),
-                    min_v=0,
-                )
-            )
-            pin_digit_timeout_s = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_PIN_DIGIT_TIMEOUT_SECONDS_SETTING_KEY,
-                    default_v=int(PIN_DIGIT_TIMEOUT_S_DEFAULT),
-                    min_v=0,
-                )
-            )
-            pin_delay_ms = float(
-                self._get_tab_int_setting(
-                    tab_id,
-                    key=AUTOLOGIN_PIN_DELAY_MS_SETTING_KEY,
-                    default_v=int(float(PIN_AFTER_DIGIT_MOVE_DELAY_S) * 1000.0),
-                    min_v=0,
-                )
-            )
-            pin_delay_s = max(0.0, pin_delay_ms / 1000.0)
+            pin_delay_s = max(0.0, st.pin_delay_ms / 1000.0)
 
             # Логика поиска шаблонов/ввода вынесена в `requiem_auto_click.modules.login.auto_login`.
             ok = bool(
@@ -1262,11 +1437,11 @@ class LauncherPlugin(PluginInterface):
                     character_nickname=str(nickname or ""),
                     pin_code=str(pin or ""),
                     delay_before_enter_s=float(self._get_login_enter_delay_seconds(tab_id)),
-                    timeout_s=float(login_timeout_s),
-                    select_server_timeout_s=float(select_server_timeout_s),
-                    enter_char_timeout_s=float(enter_char_timeout_s),
-                    pin_block_timeout_s=float(pin_block_timeout_s),
-                    pin_digit_timeout_s=float(pin_digit_timeout_s),
+                    timeout_s=float(st.login_timeout_s),
+                    select_server_timeout_s=float(st.select_server_timeout_s),
+                    enter_char_timeout_s=float(st.enter_char_timeout_s),
+                    pin_block_timeout_s=float(st.pin_block_timeout_s),
+                    pin_digit_timeout_s=float(st.pin_digit_timeout_s),
                     pin_delay_s=float(pin_delay_s),
                     cancel=cancel,
                     log=lambda s: self._console(tab_id, str(s)),
@@ -1276,32 +1451,32 @@ class LauncherPlugin(PluginInterface):
             self._console(tab_id, f"[ERROR] Автологин: исключение: {e}")
             ok = False
         finally:
-            self._row_autologin_ok[row_id] = bool(ok)
-            ev = self._row_autologin_done.get(row_id)
-            if ev is not None:
-                ev.set()
+            row = self._rows.get(row_id)
+            if row is not None:
+                row.autologin_ok = bool(ok)
+                if row.autologin_done is not None:
+                    row.autologin_done.set()
 
 
     # -----------------
     # Ordering
     # -----------------
     def _move_row(self, tab_id: str, row_id: str, delta: int) -> None:
-        ids = list(self._row_ids.get(tab_id, []))
-        if row_id not in ids:
+        ids = self._row_ids.get(tab_id)
+        if not ids or row_id not in ids:
             return
         i = ids.index(row_id)
         j = i + int(delta)
         if j < 0 or j >= len(ids):
             return
+        # переставляем на месте, без копии и переприсваивания списка
         ids[i], ids[j] = ids[j], ids[i]
-        self._row_ids[tab_id] = ids
         self._persist_rows_to_settings(tab_id)
 
         widget = self._widgets.get(tab_id)
-        if widget is not None and hasattr(widget, "_row_widgets_by_id"):
-            row_widgets_by_id: dict[str, LaunchRowWidget] = getattr(widget, "_row_widgets_by_id")
-            ordered_widgets = [row_widgets_by_id[rid] for rid in ids if rid in row_widgets_by_id]
-            widget.set_launch_rows_order(ordered_widgets)
+        if widget is not None:
+            # меняем местами только две затронутые строки (без пересбора всего списка)
+            widget.swap_launch_rows(i, j)
         self._sync_ui_state(tab_id)
 
     # -----------------
@@ -1312,29 +1487,25 @@ class LauncherPlugin(PluginInterface):
         if tab_context is None:
             return
 
-        login = str(self._row_login.get(row_id, "") or "").strip()
+        login = self._row(row_id).login
         if not login:
             self._set_error(tab_id, "Укажите логин перед запуском.")
             return
-        if not str(self._row_password.get(row_id, "") or ""):
+        if not str(self._row(row_id).password or ""):
             self._set_error(tab_id, "Укажите пароль перед запуском.")
             return
         nick = str(self._row_nickname_value(row_id) or "").strip()
         if not nick:
             self._set_error(tab_id, "Укажите ник персонажа перед запуском.")
             return
-        # Ник должен быть уникальным среди всех настроек
-        nick_count = 0
-        for rid in self._row_ids.get(tab_id, []):
-            if str(self._row_nickname_value(rid) or "").strip() == nick:
-                nick_count += 1
-        if nick_count > 1:
+        # Ник должен быть уникальным среди всех настроек (O(1) через индекс)
+        if len(self._nick_index.get(tab_id, {}).get(nick, ())) > 1:
             self._set_error(tab_id, f"Ник {nick!r} должен быть уникальным.")
             return
         if len(self._row_pin_value(row_id)) != 4:
             self._set_error(tab_id, "Укажите PIN (4 цифры) перед запуском.")
             return
-        if int(self._row_pid.get(row_id, 0) or 0) > 0:
+        if self._row(row_id).pid > 0:
             self._set_error(tab_id, "Процесс уже привязан к этой настройке.")
             return
 
@@ -1355,27 +1526,34 @@ class LauncherPlugin(PluginInterface):
             )
             return
 
-        try:
-            argv = self._parse_command(cmd)
-        except Exception as e:
-            self._set_error(tab_id, f"Не удалось разобрать команду запуска: {e}")
-            return
-        if not argv:
-            self._set_error(tab_id, "Команда запуска пуста после разбора. Проверьте значение в настройках.")
-            return
+        cached = self._cmd_cache.get(tab_id)
+        if cached is not None and cached[0] == cmd:
+            # команда не менялась — переиспользуем разбор и не трогаем диск повторно
+            _, argv, exe_path = cached
+            argv = list(argv)
+        else:
+            try:
+                argv = self._parse_command(cmd)
+            except Exception as e:
+                self._set_error(tab_id, f"Не удалось разобрать команду запуска: {e}")
+                return
+            if not argv:
+                self._set_error(tab_id, "Команда запуска пуста после разбора. Проверьте значение в настройках.")
+                return
 
-        exe_raw = os.path.expandvars(argv[0])
-        exe_path = Path(exe_raw).expanduser()
-        if not exe_path.is_absolute():
-            exe_path = (Path.cwd() / exe_path).resolve()
-        if not exe_path.exists() or not exe_path.is_file():
-            self._set_error(tab_id, f"Неверный путь к exe: {str(exe_path)!r}")
-            return
-        if exe_path.name.lower() == "requiem.exe":
-            self._set_error(tab_id, "Нельзя указывать оригинальный Requiem.exe. Используйте копию/переименование.")
-            return
+            exe_raw = os.path.expandvars(argv[0])
+            exe_path = Path(exe_raw).expanduser()
+            if not exe_path.is_absolute():
+                exe_path = (Path.cwd() / exe_path).resolve()
+            if not exe_path.exists() or not exe_path.is_file():
+                self._set_error(tab_id, f"Неверный путь к exe: {str(exe_path)!r}")
+                return
+            if exe_path.name.lower() == "requiem.exe":
+                self._set_error(tab_id, "Нельзя указывать оригинальный Requiem.exe. Используйте копию/переименование.")
+                return
 
-        argv = [str(exe_path)] + argv[1:]
+            argv = [str(exe_path)] + argv[1:]
+            self._cmd_cache[tab_id] = (cmd, list(argv), exe_path)
         try:
             self._console(tab_id, f"[RUN] Запуск: {cmd}")
             creationflags = 0
@@ -1394,8 +1572,9 @@ class LauncherPlugin(PluginInterface):
             self._set_error(tab_id, f"Не удалось запустить процесс: {e}")
             return
 
-        self._row_proc[row_id] = proc
-        self._row_pid[row_id] = int(proc.pid)
+        row = self._rows[row_id]
+        row.proc = proc
+        self._set_row_pid(tab_id, row_id, int(proc.pid))
         self._persist_rows_to_settings(tab_id)
         self._sync_ui_state(tab_id)
         self._console(tab_id, f"[OK] Процесс запущен. PID={proc.pid}")
@@ -1421,7 +1600,7 @@ class LauncherPlugin(PluginInterface):
             self._set_error(tab_id, f"Не найдена настройка запуска для ника {nickname!r}.")
             return
 
-        self._row_pid[target_row_id] = pid
+        self._set_row_pid(tab_id, target_row_id, pid)
         self._persist_rows_to_settings(tab_id)
         self._sync_ui_state(tab_id)
         self._console(tab_id, f"[OK] Процесс переопределён: nick={nickname!r} -> PID={pid}")
@@ -1429,6 +1608,16 @@ class LauncherPlugin(PluginInterface):
     # -----------------
     # Main loop
     # -----------------
+    def _on_visibility_changed(self, tab_id: str, visible: bool) -> None:
+        """Вкладка скрыта — опрос замедляем; показана — будим цикл немедленно."""
+        self._widget_visible[tab_id] = bool(visible)
+        if visible:
+            base = float(self._refresh_interval_seconds_cache.get(tab_id, 10) or 10)
+            self._current_interval[tab_id] = max(base, 1.0)
+            ev = self._monitor_wake.get(tab_id)
+            if ev is not None:
+                ev.set()
+
     def execute(self, tab_context, console_output_fn, stop_flag=None):
         tab_id = str(getattr(tab_context, "tab_id", ""))
         self._console_out[tab_id] = console_output_fn
@@ -1454,83 +1643,135 @@ class LauncherPlugin(PluginInterface):
                 return True
 
         interval_s = self._get_refresh_interval_seconds_cached(tab_id)
+        self._current_interval[tab_id] = float(interval_s)
+        # при рестарте мониторинга UI-список пуст — подписи прошлой сессии не валидны
+        self._last_windows_sig.pop(tab_id, None)
+        self._last_items_sig.pop(tab_id, None)
         self._console(tab_id, f"[RUN] Мониторинг окон '{WINDOW_TITLE}' запущен (каждые {interval_s} сек).")
 
+        wake = self._monitor_wake.setdefault(tab_id, threading.Event())
+        wake.clear()
+
+        # Путь доставки в UI-поток выбираем один раз (пробный no-op вызов),
+        # чтобы не платить за try/except в каждом тике.
+        def _dispatch_fallback(update, _w=widget):
+            if _w is None:
+                return
+            items = update.get("windows")
+            if items is not None:
+                _w.windows_changed.emit(items)
+
+        dispatch = _dispatch_fallback
+        if bridge is not None:
+            try:
+                QMetaObject.invokeMethod(bridge, "apply_tick_update", Qt.QueuedConnection, Q_ARG(object, {}))
+
+                def _dispatch_bridge(update, _b=bridge):
+                    QMetaObject.invokeMethod(_b, "apply_tick_update", Qt.QueuedConnection, Q_ARG(object, update))
+
+                dispatch = _dispatch_bridge
+            except Exception:
+                pass
+
         try:
+            # горячий цикл: читаем интервал напрямую из кэша, без вызова-обёртки
+            interval_cache_get = self._refresh_interval_seconds_cache.get
             while not stopped():
+                base_s = float(interval_cache_get(tab_id, 10) or 10)
+                if base_s < 1.0:
+                    base_s = 1.0
                 try:
                     windows: list[WindowInfo] = list_visible_windows_with_exact_title(WINDOW_TITLE)
-                    all_pids = {int(w.pid) for w in windows if int(w.pid) > 0}
+
+                    sig = hash(tuple(sorted((int(w.pid), int(w.hwnd), str(w.title)) for w in windows)))
+                    windows_unchanged = sig == self._last_windows_sig.get(tab_id)
+                    rows_mutated = tab_id in self._rows_mutated_since_tick
+                    self._rows_mutated_since_tick.discard(tab_id)
+
+                    # Все изменения тика собираем в один queued-вызов моста.
+                    update: dict = {}
 
                     # Снимок активных окон (для других вкладок/плагинов).
+                    # Сериализуем только если набор окон изменился.
                     try:
-                        snap = {
-                            "ts": float(time.time()),
-                            "windows": [{"pid": int(w.pid), "hwnd": int(w.hwnd), "title": str(w.title)} for w in windows],
-                        }
-                        payload = json.dumps(snap, ensure_ascii=False)
-                        # Важно: QSettings/global values обновляем только в UI-потоке.
-                        if bridge is not None:
-                            QMetaObject.invokeMethod(
-                                bridge,
-                                "save_windows_snapshot_json",
-                                Qt.QueuedConnection,
-                                Q_ARG(str, payload),
-                            )
+                        if not windows_unchanged:
+                            self._last_windows_sig[tab_id] = sig
+                            snap = {
+                                "ts": float(time.time()),
+                                "windows": [{"pid": int(w.pid), "hwnd": int(w.hwnd), "title": str(w.title)} for w in windows],
+                            }
+                            update["snapshot_json"] = _dumps(snap)
                     except Exception:
                         pass
 
-                    # если pid сохранён, но окна больше нет -> сброс
+                    # если pid сохранён, но окна больше нет -> сброс.
+                    # В стационарном состоянии (окна и строки не менялись) сверка не нужна.
                     changed = False
-                    for rid in self._row_ids.get(tab_id, []):
-                        pid = int(self._row_pid.get(rid, 0) or 0)
-                        if pid > 0 and pid not in all_pids:
-                            login = str(self._row_login.get(rid, "") or "").strip()
-                            self._console(
-                                tab_id,
-                                f"[WARN] PID={pid} (login={login!r}) не найден среди окон '{WINDOW_TITLE}' -> сброс.",
-                            )
-                            self._row_pid[rid] = 0
-                            self._row_proc.pop(rid, None)
-                            changed = True
+                    if not windows_unchanged or rows_mutated:
+                        all_pids = {int(w.pid) for w in windows if int(w.pid) > 0}
+                        for rid in self._row_ids.get(tab_id, []):
+                            pid = self._row(rid).pid
+                            if pid > 0 and pid not in all_pids:
+                                login = self._row(rid).login
+                                self._console(
+                                    tab_id,
+                                    f"[WARN] PID={pid} (login={login!r}) не найден среди окон '{WINDOW_TITLE}' -> сброс.",
+                                )
+                                row = self._rows.get(rid)
+                                if row is not None:
+                                    self._set_row_pid(tab_id, rid, 0)
+                                    row.proc = None
+                                changed = True
                     if changed:
                         # Важно: QSettings/tab-local values обновляем только в UI-потоке.
-                        if bridge is not None:
-                            QMetaObject.invokeMethod(bridge, "persist_rows", Qt.QueuedConnection)
+                        update["persist"] = True
                         # UI сам подхватит изменение через свой periodic sync / on_sync_state
                         # (не трогаем UI из рабочего потока).
 
-                    managed_pids = {int(self._row_pid.get(rid, 0) or 0) for rid in self._row_ids.get(tab_id, [])}
-                    managed_pids.discard(0)
-                    items = [
-                        {"pid": w.pid, "hwnd": w.hwnd, "title": w.title}
+                    # _pid_to_row поддерживается инкрементально в _set_row_pid:
+                    # используем его напрямую, без копии set на каждый тик
+                    managed_pids = self._pid_to_row.get(tab_id) or ()
+                    # кортежи вместо dict'ов: ~N аллокаций на тик вместо ~4N
+                    items = tuple(
+                        (int(w.pid), int(w.hwnd), str(w.title))
                         for w in windows
                         if int(w.pid) not in managed_pids
-                    ]
-                    if widget is not None:
-                        # Обновление UI-списка окон строго в UI-потоке.
-                        try:
-                            QMetaObject.invokeMethod(
-                                widget,
-                                "_set_windows",
-                                Qt.QueuedConnection,
-                                Q_ARG(object, items),
-                            )
-                        except Exception:
-                            # fallback через сигнал
-                            try:
-                                widget.windows_changed.emit(items)
-                            except Exception:
-                                pass
+                    )
+                    # не будим UI-поток, если список не изменился с прошлой отправки
+                    items_sig = hash(tuple(sorted(items)))
+                    if items_sig != self._last_items_sig.get(tab_id):
+                        self._last_items_sig[tab_id] = items_sig
+                        update["windows"] = items
+
+                    # Обновления QSettings/UI строго в UI-потоке, одним сообщением.
+                    if update:
+                        dispatch(update)
+                    # Адаптивный backoff: в простое интервал растёт до 10x базового,
+                    # любое изменение набора окон сбрасывает его к базовому.
+                    if windows_unchanged:
+                        self._current_interval[tab_id] = min(
+                            self._current_interval.get(tab_id, base_s) * 1.5, base_s * 10.0
+                        )
+                    else:
+                        self._current_interval[tab_id] = base_s
                 except Exception as e:
                     self._console(tab_id, f"[ERROR] Ошибка при поиске окон: {e}")
-
-                interval_s = self._get_refresh_interval_seconds_cached(tab_id)
-                steps = max(1, int(interval_s * 10))
-                for _ in range(steps):
-                    if stopped():
+                    self._current_interval[tab_id] = base_s
+
+                # Ждём на Event вместо time.sleep: wake.set() будит цикл мгновенно.
+                # stop_flag — callable от хоста, поэтому его всё же проверяем раз в 100 мс.
+                interval_s = self._current_interval.get(tab_id, base_s)
+                if not self._widget_visible.get(tab_id, True):
+                    # пользователь всё равно не видит обновлений
+                    interval_s *= 5.0
+                end_ts = time.monotonic() + interval_s
+                while not stopped():
+                    remaining = end_ts - time.monotonic()
+                    if remaining <= 0.0:
+                        break
+                    if wake.wait(min(0.1, remaining)):
+                        wake.clear()
                         break
-                    time.sleep(0.1)
         finally:
             self._monitoring_active[tab_id] = False
             self._seq_stop(tab_id)
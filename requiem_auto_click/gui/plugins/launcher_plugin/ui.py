@@ -2,7 +2,9 @@ from __future__ import annotations
 
 # pylint: disable=broad-exception-caught
 # pylint: disable=import-error,no-name-in-module
-from PySide6.QtCore import QRegularExpression, QTimer, Signal, Slot
+from dataclasses import dataclass
+
+from PySide6.QtCore import QRegularExpression, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -20,9 +22,70 @@ from PySide6.QtWidgets import (
 )
 
 
+# таблица для str.translate: удаляет всё, кроме ASCII-цифр
+_NON_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+
+@dataclass(slots=True, frozen=True)
+class RowState:
+    """Полное состояние строки запуска: считается один раз на стороне плагина."""
+
+    select_visible: bool
+    selected: bool
+    select_enabled: bool
+    nickname_ok: bool
+    pid: int
+    is_active: bool
+    start_enabled: bool
+    terminate_enabled: bool
+    check_enabled: bool
+    focus_toggle_enabled: bool
+    allow_edit: bool
+    allow_delete: bool
+    move_up_enabled: bool
+    move_down_enabled: bool
+
+
 class LaunchRowWidget(QWidget):
     """Строка настроек запуска + состояние процесса."""
 
+    __slots__ = (
+        "select_cb",
+        "up_btn",
+        "down_btn",
+        "indicator",
+        "login_edit",
+        "password_edit",
+        "slot_combo",
+        "_slot_index",
+        "nickname_edit",
+        "pin_edit",
+        "pid_label",
+        "start_btn",
+        "terminate_btn",
+        "check_btn",
+        "focus_toggle_btn",
+        "delete_btn",
+        "delete_sep",
+        "_last_indicator_active",
+        "_last_nick_ok",
+        "_last_pid",
+        "_last_state",
+    )
+
+    # один общий валидатор PIN на все строки (создаётся лениво: нужен QApplication)
+    _PIN_VALIDATOR = None
+
+    # один QSS на строку + динамические свойства вместо setStyleSheet на каждый апдейт:
+    # Qt перепарсивает таблицу стилей при каждом присваивании строки
+    _ROW_QSS = (
+        'QLineEdit[nickBad="true"] { border: 1px solid #b00020; }\n'
+        'QLabel#rowIndicator[indicator="active"] { background-color: #2e7d32; border-radius: 2px; }\n'
+        'QLabel#rowIndicator[indicator="idle"] { background-color: #808080; border-radius: 2px; }\n'
+        'QLabel#rowPid { color: #333; }\n'
+        'QPushButton#rowDelete { color: #b00020; }'
+    )
+
     login_changed = Signal(str)  # login
     password_changed = Signal(str)  # password (plain text, not persisted by default)
     slot_changed = Signal(int)  # 1..8
@@ -48,6 +111,7 @@ class LaunchRowWidget(QWidget):
         parent=None,
     ):
         super().__init__(parent)
+        self.setStyleSheet(self._ROW_QSS)
         row = QHBoxLayout(self)
         row.setContentsMargins(0, 0, 0, 0)
         row.setSpacing(3)
@@ -69,7 +133,14 @@ class LaunchRowWidget(QWidget):
         arrows.addWidget(self.up_btn)
         arrows.addWidget(self.down_btn)
 
+        # кэш последнего применённого состояния: не дёргаем стили/тексты без изменений
+        self._last_indicator_active: bool | None = None
+        self._last_nick_ok: bool | None = None
+        self._last_pid: int | None = None
+        self._last_state: RowState | None = None
+
         self.indicator = QLabel()
+        self.indicator.setObjectName("rowIndicator")
         self.indicator.setFixedSize(12, 12)
         self._set_indicator(active=False)
 
@@ -87,8 +158,11 @@ class LaunchRowWidget(QWidget):
 
         self.slot_combo = QComboBox()
         self.slot_combo.setToolTip("Слот персонажа (1–8)")
+        # data -> index, чтобы не звать O(N) findData
+        self._slot_index: dict[int, int] = {}
         for i in range(1, 9):
             self.slot_combo.addItem(str(i), i)
+            self._slot_index[i] = self.slot_combo.count() - 1
         try:
             initial_slot_i = int(initial_slot)
         except Exception:
@@ -97,7 +171,7 @@ class LaunchRowWidget(QWidget):
             initial_slot_i = 1
         if initial_slot_i > 8:
             initial_slot_i = 8
-        idx = self.slot_combo.findData(initial_slot_i)
+        idx = self._slot_index.get(initial_slot_i, -1)
         if idx >= 0:
             self.slot_combo.setCurrentIndex(idx)
 
@@ -112,11 +186,13 @@ class LaunchRowWidget(QWidget):
         self.pin_edit.setEchoMode(QLineEdit.Password)
         self.pin_edit.setMaxLength(4)
         self.pin_edit.setFixedWidth(60)
-        self.pin_edit.setValidator(QRegularExpressionValidator(QRegularExpression(r"^\d{0,4}$")))
+        if LaunchRowWidget._PIN_VALIDATOR is None:
+            LaunchRowWidget._PIN_VALIDATOR = QRegularExpressionValidator(QRegularExpression(r"^\d{0,4}$"))
+        self.pin_edit.setValidator(LaunchRowWidget._PIN_VALIDATOR)
 
         self.pid_label = QLabel("PID: —")
+        self.pid_label.setObjectName("rowPid")
         self.pid_label.setMinimumWidth(90)
-        self.pid_label.setStyleSheet("color: #333;")
 
         self.start_btn = QPushButton("▶")
         self.start_btn.setToolTip("Запустить")
@@ -127,8 +203,8 @@ class LaunchRowWidget(QWidget):
         self.focus_toggle_btn = QPushButton("🚶")
         self.focus_toggle_btn.setToolTip("Переключить фокус")
         self.delete_btn = QPushButton("🗑️")
+        self.delete_btn.setObjectName("rowDelete")
         self.delete_btn.setToolTip("Удалить")
-        self.delete_btn.setStyleSheet("QPushButton { color: #b00020; }")
 
         # компактные кнопки (иконки)
         for b in (self.start_btn, self.terminate_btn, self.check_btn, self.focus_toggle_btn, self.delete_btn):
@@ -164,78 +240,78 @@ class LaunchRowWidget(QWidget):
         row.addWidget(self.delete_sep, 0)
         row.addWidget(self.delete_btn, 0)
 
-        self.login_edit.textChanged.connect(lambda t: self.login_changed.emit(str(t)))
-        self.password_edit.textChanged.connect(lambda t: self.password_changed.emit(str(t)))
-        self.slot_combo.currentIndexChanged.connect(lambda _: self.slot_changed.emit(int(self.slot_combo.currentData())))
-        self.nickname_edit.textChanged.connect(lambda t: self.nickname_changed.emit(str(t)))
-        self.pin_edit.textChanged.connect(lambda t: self.pin_changed.emit(str(t)))
-        self.select_cb.toggled.connect(lambda v: self.selected_changed.emit(bool(v)))
-        self.start_btn.clicked.connect(self.start_clicked.emit)
-        self.terminate_btn.clicked.connect(self.terminate_clicked.emit)
-        self.check_btn.clicked.connect(self.check_clicked.emit)
-        self.focus_toggle_btn.clicked.connect(self.focus_toggle_clicked.emit)
-        self.up_btn.clicked.connect(self.move_up_clicked.emit)
-        self.down_btn.clicked.connect(self.move_down_clicked.emit)
-        self.delete_btn.clicked.connect(self.delete_clicked.emit)
-
-    def set_state(
-        self,
-        *,
-        select_visible: bool,
-        selected: bool,
-        select_enabled: bool,
-        nickname_ok: bool,
-        pid: int,
-        is_active: bool,
-        start_enabled: bool,
-        terminate_enabled: bool,
-        check_enabled: bool,
-        focus_toggle_enabled: bool,
-        allow_edit: bool,
-        allow_delete: bool,
-        move_up_enabled: bool,
-        move_down_enabled: bool,
-    ) -> None:
-        pid = int(pid or 0)
+        # отправитель и получатель в одном потоке: явный DirectConnection
+        # избавляет от проверки типа соединения на каждый сигнал (каждое нажатие клавиши).
+        # textChanged/toggled уже несут нужный тип — пробрасываем сигнал в сигнал
+        # без lambda-обёртки (и без Python-фрейма на каждое нажатие клавиши).
+        self.login_edit.textChanged.connect(self.login_changed, Qt.DirectConnection)
+        self.password_edit.textChanged.connect(self.password_changed, Qt.DirectConnection)
+        self.slot_combo.currentIndexChanged.connect(self._emit_slot_changed, Qt.DirectConnection)
+        self.nickname_edit.textChanged.connect(self.nickname_changed, Qt.DirectConnection)
+        self.pin_edit.textChanged.connect(self.pin_changed, Qt.DirectConnection)
+        self.select_cb.toggled.connect(self.selected_changed, Qt.DirectConnection)
+        self.start_btn.clicked.connect(self.start_clicked.emit, Qt.DirectConnection)
+        self.terminate_btn.clicked.connect(self.terminate_clicked.emit, Qt.DirectConnection)
+        self.check_btn.clicked.connect(self.check_clicked.emit, Qt.DirectConnection)
+        self.focus_toggle_btn.clicked.connect(self.focus_toggle_clicked.emit, Qt.DirectConnection)
+        self.up_btn.clicked.connect(self.move_up_clicked.emit, Qt.DirectConnection)
+        self.down_btn.clicked.connect(self.move_down_clicked.emit, Qt.DirectConnection)
+        self.delete_btn.clicked.connect(self.delete_clicked.emit, Qt.DirectConnection)
+
+    @Slot()
+    def _emit_slot_changed(self) -> None:
+        try:
+            self.slot_changed.emit(int(self.slot_combo.currentData()))
+        except Exception:
+            pass
+
+    def set_state(self, s: RowState) -> None:
+        # состояние не изменилось — не трогаем ни один дочерний виджет
+        if s == self._last_state:
+            return
+        self._last_state = s
+
         self.set_multistart_state(
-            visible=bool(select_visible),
-            checked=bool(selected),
-            enabled=bool(select_enabled),
+            visible=s.select_visible,
+            checked=s.selected,
+            enabled=s.select_enabled,
         )
 
         # подсветка неуникального/пустого ника
-        if bool(nickname_ok):
-            self.nickname_edit.setStyleSheet("")
-        else:
-            self.nickname_edit.setStyleSheet("QLineEdit { border: 1px solid #b00020; }")
-
-        self._set_indicator(active=bool(is_active))
-        self.pid_label.setText("PID: —" if pid <= 0 else f"PID: {pid}")
-
-        self.login_edit.setEnabled(bool(allow_edit))
-        self.password_edit.setEnabled(bool(allow_edit))
-        self.slot_combo.setEnabled(bool(allow_edit))
-        self.nickname_edit.setEnabled(bool(allow_edit))
-        self.pin_edit.setEnabled(bool(allow_edit))
-        self.delete_btn.setEnabled(bool(allow_delete))
-        self.delete_btn.setVisible(bool(allow_delete))
-        self.delete_sep.setVisible(bool(allow_delete))
-
-        if bool(is_active):
+        if s.nickname_ok != self._last_nick_ok:
+            self._last_nick_ok = s.nickname_ok
+            self.nickname_edit.setProperty("nickBad", "false" if s.nickname_ok else "true")
+            self._repolish(self.nickname_edit)
+
+        self._set_indicator(active=s.is_active)
+        if s.pid != self._last_pid:
+            self._last_pid = s.pid
+            self.pid_label.setText("PID: —" if s.pid <= 0 else f"PID: {s.pid}")
+
+        self.login_edit.setEnabled(s.allow_edit)
+        self.password_edit.setEnabled(s.allow_edit)
+        self.slot_combo.setEnabled(s.allow_edit)
+        self.nickname_edit.setEnabled(s.allow_edit)
+        self.pin_edit.setEnabled(s.allow_edit)
+        self.delete_btn.setEnabled(s.allow_delete)
+        self.delete_btn.setVisible(s.allow_delete)
+        self.delete_sep.setVisible(s.allow_delete)
+
+        if s.is_active:
             self.start_btn.setVisible(False)
             self.terminate_btn.setVisible(True)
-            self.terminate_btn.setEnabled(bool(terminate_enabled))
-            self.check_btn.setEnabled(bool(check_enabled))
-            self.focus_toggle_btn.setEnabled(bool(focus_toggle_enabled))
+            self.terminate_btn.setEnabled(s.terminate_enabled)
+            self.check_btn.setEnabled(s.check_enabled)
+            self.focus_toggle_btn.setEnabled(s.focus_toggle_enabled)
         else:
             self.start_btn.setVisible(True)
-            self.start_btn.setEnabled(bool(start_enabled))
+            self.start_btn.setEnabled(s.start_enabled)
             self.terminate_btn.setVisible(False)
             self.check_btn.setEnabled(False)
             self.focus_toggle_btn.setEnabled(False)
 
-        self.up_btn.setEnabled(bool(move_up_enabled))
-        self.down_btn.setEnabled(bool(move_down_enabled))
+        self.up_btn.setEnabled(s.move_up_enabled)
+        self.down_btn.setEnabled(s.move_down_enabled)
 
     def set_multistart_state(self, *, visible: bool, checked: bool, enabled: bool) -> None:
         self.select_cb.setVisible(bool(visible))
@@ -268,20 +344,55 @@ class LaunchRowWidget(QWidget):
 
     def get_pin(self) -> str:
         # only digits, max 4
-        raw = str(self.pin_edit.text() or "")
-        digits = "".join([c for c in raw if c.isdigit()])
-        return digits[:4]
+        return str(self.pin_edit.text() or "").translate(_NON_DIGITS)[:4]
 
     def _set_indicator(self, *, active: bool) -> None:
-        if active:
-            self.indicator.setStyleSheet("background-color: #2e7d32; border-radius: 2px;")
+        active = bool(active)
+        if active == self._last_indicator_active:
+            return
+        self._last_indicator_active = active
+        self.indicator.setProperty("indicator", "active" if active else "idle")
+        self._repolish(self.indicator)
+
+    @staticmethod
+    def _repolish(w) -> None:
+        # применяет изменившееся динамическое свойство без переназначения QSS
+        st = w.style()
+        st.unpolish(w)
+        st.polish(w)
+
+
+def _normalize_logins(logins) -> list[tuple[str, str]]:
+    """(label, nickname) из list[str] (старый формат) или list[{"nickname":..,"login":..}]."""
+    out: list[tuple[str, str]] = []
+    for it in (logins or []):
+        if isinstance(it, dict):
+            nickname = str(it.get("nickname", "") or "").strip()
+            login = str(it.get("login", "") or "").strip()
         else:
-            self.indicator.setStyleSheet("background-color: #808080; border-radius: 2px;")
+            nickname = str(it or "").strip()
+            login = ""
+        if not nickname:
+            continue
+        label = f"{nickname} ({login})" if login else nickname
+        out.append((label, nickname))
+    return out
 
 
 class WindowRowWidget(QWidget):
     """Строка мониторинга: PID + выбор логина + переопределить + проверить."""
 
+    __slots__ = (
+        "pid",
+        "title",
+        "pid_label",
+        "title_label",
+        "login_combo",
+        "_login_index",
+        "override_btn",
+        "check_btn",
+    )
+
     override_clicked = Signal(int, str)  # pid, login
     check_clicked = Signal(int)  # pid
 
@@ -303,6 +414,8 @@ class WindowRowWidget(QWidget):
 
         self.login_combo = QComboBox()
         self.login_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        # nickname (itemData) -> index; обновляется при пересборке списка
+        self._login_index: dict[str, int] = {}
 
         self.override_btn = QPushButton("Переопределить")
         self.check_btn = QPushButton("Проверить")
@@ -317,7 +430,8 @@ class WindowRowWidget(QWidget):
         self.override_btn.clicked.connect(self._emit_override)
         self.check_btn.clicked.connect(lambda: self.check_clicked.emit(self.pid))
 
-        self.set_available_logins(available_logins)
+        # available_logins — уже нормализованный список (label, nickname)
+        self.set_available_logins_pre(available_logins)
 
     def _emit_override(self) -> None:
         nick = ""
@@ -330,32 +444,40 @@ class WindowRowWidget(QWidget):
         self.override_clicked.emit(self.pid, nick)
 
     def set_available_logins(self, logins: list[str]) -> None:
+        self.set_available_logins_pre(_normalize_logins(logins))
+
+    def set_available_logins_pre(self, new_items: list[tuple[str, str]]) -> None:
+        """То же, но с уже нормализованным списком — без повторной работы per-row."""
+        new_items = list(new_items or [])
         # current selection is stored as nickname in itemData
         current = ""
         try:
             current = str(self.login_combo.currentData() or "").strip()
         except Exception:
             current = str(self.login_combo.currentText() or "").strip()
+
+        # содержимое не изменилось — не пересобираем модель комбобокса
+        cur_items = [
+            (self.login_combo.itemText(i), self.login_combo.itemData(i))
+            for i in range(self.login_combo.count())
+        ]
+        if new_items == cur_items:
+            return
+
         self.login_combo.blockSignals(True)
+        self.login_combo.setUpdatesEnabled(False)
         try:
             self.login_combo.clear()
-            # logins может быть list[str] (старый формат) или list[{"nickname":..,"login":..}]
-            for it in (logins or []):
-                if isinstance(it, dict):
-                    nickname = str(it.get("nickname", "") or "").strip()
-                    login = str(it.get("login", "") or "").strip()
-                else:
-                    nickname = str(it or "").strip()
-                    login = ""
-                if not nickname:
-                    continue
-                label = f"{nickname} ({login})" if login else nickname
+            self._login_index = {}
+            for pos, (label, nickname) in enumerate(new_items):
                 self.login_combo.addItem(label, nickname)
+                self._login_index.setdefault(nickname, pos)
             if current:
-                idx = self.login_combo.findData(current)
+                idx = self._login_index.get(current, -1)
                 if idx >= 0:
                     self.login_combo.setCurrentIndex(idx)
         finally:
+            self.login_combo.setUpdatesEnabled(True)
             self.login_combo.blockSignals(False)
         self.override_btn.setEnabled(self.login_combo.count() > 0)
 
@@ -364,6 +486,7 @@ class LauncherWidget(QWidget):
     monitoring_changed = Signal(bool)
     windows_changed = Signal(object)  # list[dict]
     logins_changed = Signal(object)  # list[str]
+    visibility_changed = Signal(bool)  # виджет показан/скрыт (для троттлинга опроса)
 
     def __init__(self, *, on_add_row, on_multi_clicked, on_focus_check, on_override_login, on_sync_state, parent=None):
         super().__init__(parent)
@@ -378,6 +501,8 @@ class LauncherWidget(QWidget):
         self._launch_rows: list[LaunchRowWidget] = []
         self._window_rows_by_pid: dict[int, WindowRowWidget] = {}
         self._available_logins: list[str] = []
+        # подпись последнего принятого списка окон (для раннего выхода)
+        self._last_windows_sig: int | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -474,9 +599,19 @@ class LauncherWidget(QWidget):
 
         # Важно: не запускаем периодический "полный sync", чтобы UI не лагал.
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
     @Slot(bool)
     def _set_monitoring(self, enabled: bool) -> None:
         self._monitoring_enabled = bool(enabled)
+        # смена режима меняет и подсказку, и набор строк — подпись не валидна
+        self._last_windows_sig = None
         if enabled:
             self.monitor_hint.setText("")
             self.monitor_hint.setVisible(False)
@@ -505,15 +640,30 @@ class LauncherWidget(QWidget):
         self._refresh_launch_buttons()
 
     def set_launch_rows_order(self, ordered: list[LaunchRowWidget]) -> None:
-        while self.launch_rows_layout.count():
-            item = self.launch_rows_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                self.launch_rows_layout.removeWidget(w)
-        self._launch_rows = []
-        for w in ordered:
-            self._launch_rows.append(w)
-            self.launch_rows_layout.addWidget(w)
+        # insertWidget перемещает уже лежащие в layout виджеты без пересоздания;
+        # setUpdatesEnabled подавляет перерисовку на каждую перестановку
+        self.launch_rows_container.setUpdatesEnabled(False)
+        try:
+            self._launch_rows = list(ordered)
+            for i, w in enumerate(self._launch_rows):
+                self.launch_rows_layout.insertWidget(i, w)
+        finally:
+            self.launch_rows_container.setUpdatesEnabled(True)
+            self.launch_rows_container.updateGeometry()
+
+    def swap_launch_rows(self, i: int, j: int) -> None:
+        """Меняет местами две строки запуска без полного пересбора layout."""
+        n = len(self._launch_rows)
+        if i == j or not (0 <= i < n) or not (0 <= j < n):
+            return
+        if i > j:
+            i, j = j, i
+        wi, wj = self._launch_rows[i], self._launch_rows[j]
+        self._launch_rows[i], self._launch_rows[j] = wj, wi
+        self.launch_rows_layout.removeWidget(wj)
+        self.launch_rows_layout.insertWidget(i, wj)
+        self.launch_rows_layout.removeWidget(wi)
+        self.launch_rows_layout.insertWidget(j, wi)
 
     def set_multi_start_enabled(self, enabled: bool) -> None:
         self.multi_btn.setEnabled(bool(enabled))
@@ -555,22 +705,27 @@ class LauncherWidget(QWidget):
 
     @Slot(object)
     def _set_available_logins(self, logins) -> None:
-        # logins может быть list[str] (старый формат) или list[{"nickname":..,"login":..}]
-        self._available_logins = list(logins or [])
-        for pid, wrow in self._window_rows_by_pid.items():
-            _ = pid
-            wrow.set_available_logins(self._available_logins)
+        # нормализуем один раз, а не в каждой строке окна
+        self._available_logins = _normalize_logins(logins)
+        for wrow in self._window_rows_by_pid.values():
+            wrow.set_available_logins_pre(self._available_logins)
 
     @Slot(object)
     def _set_windows(self, windows) -> None:
-        windows = windows or []
+        # windows — последовательность кортежей (pid, hwnd, title)
+        windows = windows or ()
+        try:
+            sig = hash(tuple(sorted(windows)))
+        except Exception:
+            sig = None
+        if sig is not None and sig == self._last_windows_sig:
+            return
+        self._last_windows_sig = sig
         new_pids = set()
         self._hwnd_by_pid = {}
         for w in windows:
             try:
-                pid = int(w.get("pid", 0))
-                hwnd = int(w.get("hwnd", 0))
-                title = str(w.get("title", ""))
+                pid, hwnd, title = int(w[0]), int(w[1]), str(w[2])
             except Exception:
                 continue
             if pid <= 0 or hwnd <= 0:
@@ -1,37 +1,153 @@
 from __future__ import annotations
 
 # pylint: disable=import-error,no-name-in-module,broad-exception-caught
-import json
+import functools
+import threading
 import time
 
-from sa_ui_operations import IntegerSetting, PluginInterface
+try:
+    # orjson (C-расширение) заметно быстрее stdlib json; зависимость необязательная
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    _loads = orjson.loads
+except Exception:
+    import json
 
-# pylint: disable=import-error,no-name-in-module
-from PySide6.QtCore import QMetaObject, Qt, Q_ARG
+    _loads = json.loads
+
+from sa_ui_operations import IntegerSetting, PluginInterface
 
 from ...constants import LAUNCHER_WINDOWS_JSON_GLOBAL_KEY
-from ..utils import login_state
 from ..utils.launcher_rows import LauncherRow, load_launcher_rows_raw_anywhere, parse_launcher_rows_json
 from .ui import MailboxWidget, ClientItem
 
 
 WINDOW_TITLE = "Requiem"
 
+
+def _noop_log(_s: str) -> None:
+    """Лог-заглушка, пока execute() не зарегистрировал консоль вкладки."""
+
+
+def _snap_int(snap: dict, key: str, default_v: int) -> int:
+    """int из снимка настроек с дефолтом (QSettings может вернуть строку)."""
+    v = snap.get(key)
+    try:
+        return int(v) if v is not None else int(default_v)
+    except Exception:
+        return int(default_v)
+
+# (key, label, default, description) — тайминги и ROI храним как настройки вкладки.
+# Метаданные вынесены в константу: IntegerSetting'и строятся один раз, а не на каждое
+# открытие диалога настроек.
+_MAILBOX_SETTINGS_SPECS = (
+    ("mailbox_click_settle_ms", "Почта: задержка после клика (мс)", 50, "Небольшая стабилизация после любого клика."),
+    ("mailbox_double_click_gap_ms", "Почта: пауза между двойным кликом (мс)", 50, "Между двумя кликами открытия письма."),
+    ("mailbox_open_mail_wait_ms", "Почта: ждать открытия письма (мс)", 1000, "После двойного клика по письму."),
+    ("mailbox_after_get_content_ms", "Почта: пауза после 'получить содержимое' (мс)", 200, "Пауза перед ожиданием окна удаления."),
+    ("mailbox_after_delete_click_ms", "Почта: пауза после 'удалить' (мс)", 100, "Пауза перед ожиданием окна удаления."),
+    ("mailbox_wait_confirm_poll_ms", "Почта: poll окна подтверждения (мс)", 100, "Частота проверки появления окна подтверждения."),
+    ("mailbox_poll_initial_ms", "Почта: начальный poll подтверждения (мс)", 5, "Старт адаптивного poll; удваивается до настроенного максимума."),
+    ("mailbox_wait_confirm_poll_get_content_ms", "Почта: poll подтверждения (получить содержимое) (мс)", 100, "Частота проверки появления подтверждения auto-delete после 'получить содержимое'."),
+    ("mailbox_wait_confirm_poll_delete_ms", "Почта: poll подтверждения (удалить письмо) (мс)", 100, "Частота проверки появления подтверждения после клика 'удалить'."),
+    ("mailbox_wait_confirm_timeout_ms", "Почта: ждать подтверждение после 'получить содержимое' (мс)", 1000, "Если не появилось — retry."),
+    ("mailbox_wait_confirm_timeout_delete_ms", "Почта: ждать подтверждение после 'удалить' (мс)", 2000, "Если не появилось — ошибка."),
+    ("mailbox_confirm_close_delay_ms", "Почта: пауза после клика подтверждения (мс)", 200, "Перед проверкой, что окно подтверждения исчезло."),
+    ("mailbox_confirm_close_timeout_ms", "Почта: ждать исчезновение окна подтверждения (мс)", 1000, "Если окно остаётся — ошибка."),
+    ("mailbox_confirm_close_poll_ms", "Почта: poll исчезновения окна подтверждения (мс)", 100, "Частота проверки исчезновения подтверждения после клика."),
+    ("mailbox_auto_confirm_roi_x", "Почта: auto-delete confirm ROI x", 395, "ROI подтверждения auto-delete (x)."),
+    ("mailbox_auto_confirm_roi_y", "Почта: auto-delete confirm ROI y", 324, "ROI подтверждения auto-delete (y)."),
+    ("mailbox_auto_confirm_roi_w", "Почта: auto-delete confirm ROI w", 97, "ROI подтверждения auto-delete (w)."),
+    ("mailbox_auto_confirm_roi_h", "Почта: auto-delete confirm ROI h", 20, "ROI подтверждения auto-delete (h)."),
+    ("mailbox_auto_confirm_click_x", "Почта: auto-delete confirm click x", 444, "Клик подтверждения auto-delete (client x)."),
+    ("mailbox_auto_confirm_click_y", "Почта: auto-delete confirm click y", 333, "Клик подтверждения auto-delete (client y)."),
+    ("mailbox_manual_confirm_roi_x", "Почта: manual-delete confirm ROI x", 395, "ROI подтверждения manual-delete (x)."),
+    ("mailbox_manual_confirm_roi_y", "Почта: manual-delete confirm ROI y", 292, "ROI подтверждения manual-delete (y)."),
+    ("mailbox_manual_confirm_roi_w", "Почта: manual-delete confirm ROI w", 97, "ROI подтверждения manual-delete (w)."),
+    ("mailbox_manual_confirm_roi_h", "Почта: manual-delete confirm ROI h", 20, "ROI подтверждения manual-delete (h)."),
+    ("mailbox_manual_confirm_click_x", "Почта: manual-delete confirm click x", 444, "Клик подтверждения manual-delete (client x)."),
+    ("mailbox_manual_confirm_click_y", "Почта: manual-delete confirm click y", 300, "Клик подтверждения manual-delete (client y)."),
+)
+
+
+# (поле MailboxTimings, ключ настройки, дефолт в мс);
+# None вместо дефолта = подставляется старый общий poll-ключ (backward compat)
+_TIMINGS_FIELDS: tuple[tuple[str, str, int | None], ...] = (
+    ("click_settle_s", "mailbox_click_settle_ms", 50),
+    ("double_click_gap_s", "mailbox_double_click_gap_ms", 50),
+    ("open_first_mail_wait_s", "mailbox_open_mail_wait_ms", 1000),
+    ("after_click_get_content_before_wait_s", "mailbox_after_get_content_ms", 200),
+    ("after_click_delete_before_wait_s", "mailbox_after_delete_click_ms", 100),
+    ("wait_deletion_confirm_timeout_s", "mailbox_wait_confirm_timeout_ms", 1000),
+    ("wait_deletion_confirm_timeout_delete_s", "mailbox_wait_confirm_timeout_delete_ms", 2000),
+    ("wait_deletion_confirm_poll_get_content_s", "mailbox_wait_confirm_poll_get_content_ms", None),
+    ("wait_deletion_confirm_poll_delete_s", "mailbox_wait_confirm_poll_delete_ms", None),
+    ("deletion_confirm_post_click_delay_s", "mailbox_confirm_close_delay_ms", 200),
+    ("deletion_confirm_disappear_timeout_s", "mailbox_confirm_close_timeout_ms", 1000),
+    ("deletion_confirm_disappear_poll_s", "mailbox_confirm_close_poll_ms", 100),
+    ("poll_initial_s", "mailbox_poll_initial_ms", 5),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_settings() -> tuple[IntegerSetting, ...]:
+    return tuple(
+        IntegerSetting(key=k, label=label, default_value=d, description=desc)
+        for k, label, d, desc in _MAILBOX_SETTINGS_SPECS
+    )
+
+
 class MailboxPlugin(PluginInterface):
     """Плагин: проверка наличия окна почтового ящика по шаблону."""
 
     def __init__(self) -> None:
         self._widgets: dict[str, MailboxWidget] = {}
         self._tab_contexts: dict[str, object] = {}
-        self._console_out: dict[str, object] = {}
-
-    def _console(self, tab_id: str, text: str) -> None:
-        fn = self._console_out.get(tab_id)
-        if fn is not None:
+        # лог-функция per tab: либо console_output_fn из execute(), либо _noop_log —
+        # вызывающий код дергает её напрямую, без dict.get и try/except на строку лога
+        self._log_fns: dict[str, object] = {}
+        # событие пробуждения цикла ожидания execute() per tab
+        self._exec_wake: dict[str, threading.Event] = {}
+        # кэш разобранных таймингов/спеков подтверждений per tab:
+        # (monotonic ts, value); иначе каждый вызов — ~25 обращений к QSettings
+        self._timings_cache: dict[str, tuple[float, object]] = {}
+        self._specs_cache: dict[str, tuple[float, tuple]] = {}
+        # полный путь группы settings/ per tab (ctx.key не вызывается повторно)
+        self._settings_group: dict[str, str] = {}
+        # разобранный снимок окон Launcher: (raw json, pid -> hwnd);
+        # переразбираем только когда строка снимка реально изменилась
+        self._snap_cache: dict[str, tuple[str, dict[int, int]]] = {}
+        # готовый список клиентов per tab: (hash rows, hash snapshot, clients) —
+        # в стационарном состоянии пересборка не нужна вовсе
+        self._clients_cache: dict[str, tuple[int, int, list[ClientItem]]] = {}
+
+    # настройки перечитываем не чаще раза в секунду: правка в UI подхватится,
+    # а горячий путь удаления писем не платит за QSettings на каждую операцию
+    _SETTINGS_CACHE_TTL_S = 1.0
+
+    def _snapshot_settings(self, tab_id: str, ctx) -> dict[str, object]:
+        """Разовое чтение всей группы settings/ вкладки в обычный dict.
+
+        Вместо пары contains()+value() на каждый ключ (~50 обращений к бэкенду
+        QSettings за один разбор таймингов) — один beginGroup/allKeys проход.
+        Полный путь группы вычисляется через ctx.key один раз на вкладку.
+        """
+        snap: dict[str, object] = {}
+        try:
+            group = self._settings_group.get(tab_id)
+            if group is None:
+                group = str(ctx.key("settings"))
+                self._settings_group[tab_id] = group
+            settings = ctx.settings
+            settings.beginGroup(group)
             try:
-                fn(str(text))
-            except Exception:
-                pass
+                for k in settings.allKeys():
+                    snap[str(k)] = settings.value(k)
+            finally:
+                settings.endGroup()
+        except Exception:
+            pass
+        return snap
 
     def get_key(self) -> str:
         return "mailbox_plugin"
@@ -40,191 +156,45 @@ class MailboxPlugin(PluginInterface):
         return "Requiem: Почта"
 
     def get_settings(self):
-        # Тайминги (в миллисекундах) — храним как настройки вкладки (tab-local).
-        return [
-            IntegerSetting(
-                key="mailbox_click_settle_ms",
-                label="Почта: задержка после клика (мс)",
-                default_value=50,
-                description="Небольшая стабилизация после любого клика.",
-            ),
-            IntegerSetting(
-                key="mailbox_double_click_gap_ms",
-                label="Почта: пауза между двойным кликом (мс)",
-                default_value=50,
-                description="Между двумя кликами открытия письма.",
-            ),
-            IntegerSetting(
-                key="mailbox_open_mail_wait_ms",
-                label="Почта: ждать открытия письма (мс)",
-                default_value=1000,
-                description="После двойного клика по письму.",
-            ),
-            IntegerSetting(
-                key="mailbox_after_get_content_ms",
-                label="Почта: пауза после 'получить содержимое' (мс)",
-                default_value=200,
-                description="Пауза перед ожиданием окна удаления.",
-            ),
-            IntegerSetting(
-                key="mailbox_after_delete_click_ms",
-                label="Почта: пауза после 'удалить' (мс)",
-                default_value=100,
-                description="Пауза перед ожиданием окна удаления.",
-            ),
-            IntegerSetting(
-                key="mailbox_wait_confirm_poll_ms",
-                label="Почта: poll окна подтверждения (мс)",
-                default_value=100,
-                description="Частота проверки появления окна подтверждения.",
-            ),
-            IntegerSetting(
-                key="mailbox_wait_confirm_poll_get_content_ms",
-                label="Почта: poll подтверждения (получить содержимое) (мс)",
-                default_value=100,
-                description="Частота проверки появления подтверждения auto-delete после 'получить содержимое'.",
-            ),
-            IntegerSetting(
-                key="mailbox_wait_confirm_poll_delete_ms",
-                label="Почта: poll подтверждения (удалить письмо) (мс)",
-                default_value=100,
-                description="Частота проверки появления подтверждения после клика 'удалить'.",
-            ),
-            IntegerSetting(
-                key="mailbox_wait_confirm_timeout_ms",
-                label="Почта: ждать подтверждение после 'получить содержимое' (мс)",
-                default_value=1000,
-                description="Если не появилось — retry.",
-            ),
-            IntegerSetting(
-                key="mailbox_wait_confirm_timeout_delete_ms",
-                label="Почта: ждать подтверждение после 'удалить' (мс)",
-                default_value=2000,
-                description="Если не появилось — ошибка.",
-            ),
-            IntegerSetting(
-                key="mailbox_confirm_close_delay_ms",
-                label="Почта: пауза после клика подтверждения (мс)",
-                default_value=200,
-                description="Перед проверкой, что окно подтверждения исчезло.",
-            ),
-            IntegerSetting(
-                key="mailbox_confirm_close_timeout_ms",
-                label="Почта: ждать исчезновение окна подтверждения (мс)",
-                default_value=1000,
-                description="Если окно остаётся — ошибка.",
-            ),
-            IntegerSetting(
-                key="mailbox_confirm_close_poll_ms",
-                label="Почта: poll исчезновения окна подтверждения (мс)",
-                default_value=100,
-                description="Частота проверки исчезновения подтверждения после клика.",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_roi_x",
-                label="Почта: auto-delete confirm ROI x",
-                default_value=395,
-                description="ROI подтверждения auto-delete (x).",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_roi_y",
-                label="Почта: auto-delete confirm ROI y",
-                default_value=324,
-                description="ROI подтверждения auto-delete (y).",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_roi_w",
-                label="Почта: auto-delete confirm ROI w",
-                default_value=97,
-                description="ROI подтверждения auto-delete (w).",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_roi_h",
-                label="Почта: auto-delete confirm ROI h",
-                default_value=20,
-                description="ROI подтверждения auto-delete (h).",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_click_x",
-                label="Почта: auto-delete confirm click x",
-                default_value=444,
-                description="Клик подтверждения auto-delete (client x).",
-            ),
-            IntegerSetting(
-                key="mailbox_auto_confirm_click_y",
-                label="Почта: auto-delete confirm click y",
-                default_value=333,
-                description="Клик подтверждения auto-delete (client y).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_roi_x",
-                label="Почта: manual-delete confirm ROI x",
-                default_value=395,
-                description="ROI подтверждения manual-delete (x).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_roi_y",
-                label="Почта: manual-delete confirm ROI y",
-                default_value=292,
-                description="ROI подтверждения manual-delete (y).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_roi_w",
-                label="Почта: manual-delete confirm ROI w",
-                default_value=97,
-                description="ROI подтверждения manual-delete (w).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_roi_h",
-                label="Почта: manual-delete confirm ROI h",
-                default_value=20,
-                description="ROI подтверждения manual-delete (h).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_click_x",
-                label="Почта: manual-delete confirm click x",
-                default_value=444,
-                description="Клик подтверждения manual-delete (client x).",
-            ),
-            IntegerSetting(
-                key="mailbox_manual_confirm_click_y",
-                label="Почта: manual-delete confirm click y",
-                default_value=300,
-                description="Клик подтверждения manual-delete (client y).",
-            ),
-        ]
+        return list(_build_settings())
 
     def _confirm_specs_for_tab(self, tab_id: str):
+        # mailbox_manager импортируется лениво (см. ui.py): не грузим его при старте
         from ....modules.mailbox_manager import MailboxConfirmSpec
 
         ctx = self._tab_contexts.get(tab_id)
         if ctx is None:
             return (
-                MailboxConfirmSpec((395, 324), (97, 20), (444, 333), "auto-delete"),
-                MailboxConfirmSpec((395, 292), (97, 20), (444, 300), "manual-delete"),
+                MailboxConfirmSpec(395, 324, 97, 20, 444, 333, "auto-delete"),
+                MailboxConfirmSpec(395, 292, 97, 20, 444, 300, "manual-delete"),
             )
 
-        def _get_ms(key: str, default_v: int) -> int:
-            try:
-                settings_key = ctx.key(f"settings/{key}")
-                if ctx.settings.contains(settings_key):
-                    return int(ctx.settings.value(settings_key, default_v, type=int))
-            except Exception:
-                pass
-            return int(default_v)
+        now = time.monotonic()
+        cached = self._specs_cache.get(tab_id)
+        if cached is not None and (now - cached[0]) < self._SETTINGS_CACHE_TTL_S:
+            return cached[1]
+
+        _get_ms = functools.partial(_snap_int, self._snapshot_settings(tab_id, ctx))
 
         auto = MailboxConfirmSpec(
-            (int(_get_ms("mailbox_auto_confirm_roi_x", 395)), int(_get_ms("mailbox_auto_confirm_roi_y", 292))),
-            (int(_get_ms("mailbox_auto_confirm_roi_w", 97)), int(_get_ms("mailbox_auto_confirm_roi_h", 20))),
-            (int(_get_ms("mailbox_auto_confirm_click_x", 444)), int(_get_ms("mailbox_auto_confirm_click_y", 300))),
-            "auto-delete",
+            roi_x=_get_ms("mailbox_auto_confirm_roi_x", 395),
+            roi_y=_get_ms("mailbox_auto_confirm_roi_y", 324),
+            roi_w=_get_ms("mailbox_auto_confirm_roi_w", 97),
+            roi_h=_get_ms("mailbox_auto_confirm_roi_h", 20),
+            click_x=_get_ms("mailbox_auto_confirm_click_x", 444),
+            click_y=_get_ms("mailbox_auto_confirm_click_y", 333),
+            label="auto-delete",
         )
         manual = MailboxConfirmSpec(
-            (int(_get_ms("mailbox_manual_confirm_roi_x", 395)), int(_get_ms("mailbox_manual_confirm_roi_y", 292))),
-            (int(_get_ms("mailbox_manual_confirm_roi_w", 97)), int(_get_ms("mailbox_manual_confirm_roi_h", 20))),
-            (int(_get_ms("mailbox_manual_confirm_click_x", 444)), int(_get_ms("mailbox_manual_confirm_click_y", 300))),
-            "manual-delete",
+            roi_x=_get_ms("mailbox_manual_confirm_roi_x", 395),
+            roi_y=_get_ms("mailbox_manual_confirm_roi_y", 292),
+            roi_w=_get_ms("mailbox_manual_confirm_roi_w", 97),
+            roi_h=_get_ms("mailbox_manual_confirm_roi_h", 20),
+            click_x=_get_ms("mailbox_manual_confirm_click_x", 444),
+            click_y=_get_ms("mailbox_manual_confirm_click_y", 300),
+            label="manual-delete",
         )
+        self._specs_cache[tab_id] = (now, (auto, manual))
         return (auto, manual)
 
     def _timings_for_tab(self, tab_id: str):
@@ -234,41 +204,30 @@ class MailboxPlugin(PluginInterface):
         if ctx is None:
             return MailboxTimings()
 
-        def _get_ms(key: str, default_v: int) -> int:
-            try:
-                settings_key = ctx.key(f"settings/{key}")
-                if ctx.settings.contains(settings_key):
-                    return int(ctx.settings.value(settings_key, default_v, type=int))
-            except Exception:
-                pass
-            return int(default_v)
-
-        # backward compat: старый ключ poll
-        poll_fallback_ms = _get_ms("mailbox_wait_confirm_poll_ms", 100)
-
-        return MailboxTimings(
-            click_settle_s=float(_get_ms("mailbox_click_settle_ms", 50)) / 1000.0,
-            double_click_gap_s=float(_get_ms("mailbox_double_click_gap_ms", 50)) / 1000.0,
-            open_first_mail_wait_s=float(_get_ms("mailbox_open_mail_wait_ms", 1000)) / 1000.0,
-            after_click_get_content_before_wait_s=float(_get_ms("mailbox_after_get_content_ms", 200)) / 1000.0,
-            after_click_delete_before_wait_s=float(_get_ms("mailbox_after_delete_click_ms", 100)) / 1000.0,
-            wait_deletion_confirm_timeout_s=float(_get_ms("mailbox_wait_confirm_timeout_ms", 1000)) / 1000.0,
-            wait_deletion_confirm_timeout_delete_s=float(_get_ms("mailbox_wait_confirm_timeout_delete_ms", 2000)) / 1000.0,
-            wait_deletion_confirm_poll_get_content_s=float(_get_ms("mailbox_wait_confirm_poll_get_content_ms", poll_fallback_ms)) / 1000.0,
-            wait_deletion_confirm_poll_delete_s=float(_get_ms("mailbox_wait_confirm_poll_delete_ms", poll_fallback_ms)) / 1000.0,
-            deletion_confirm_post_click_delay_s=float(_get_ms("mailbox_confirm_close_delay_ms", 200)) / 1000.0,
-            deletion_confirm_disappear_timeout_s=float(_get_ms("mailbox_confirm_close_timeout_ms", 1000)) / 1000.0,
-            deletion_confirm_disappear_poll_s=float(_get_ms("mailbox_confirm_close_poll_ms", 100)) / 1000.0,
-        )
+        now = time.monotonic()
+        cached = self._timings_cache.get(tab_id)
+        if cached is not None and (now - cached[0]) < self._SETTINGS_CACHE_TTL_S:
+            return cached[1]
+
+        snap = self._snapshot_settings(tab_id, ctx)
+        # backward compat: старый общий ключ poll — дефолт для обоих poll-полей
+        poll_fallback_ms = _snap_int(snap, "mailbox_wait_confirm_poll_ms", 100)
+        timings = MailboxTimings(**{
+            field: _snap_int(snap, key, poll_fallback_ms if default_ms is None else default_ms) / 1000.0
+            for field, key, default_ms in _TIMINGS_FIELDS
+        })
+        self._timings_cache[tab_id] = (now, timings)
+        return timings
 
     def create_widget(self, tab_context):
         tab_id = str(getattr(tab_context, "tab_id", ""))
         self._tab_contexts[tab_id] = tab_context
+        self._log_fns.setdefault(tab_id, _noop_log)
 
         w = MailboxWidget(
             window_title=WINDOW_TITLE,
             on_get_clients=lambda: self._get_active_clients_for_tab(tab_id),
-            on_log=lambda s, tid=tab_id: self._console(tid, s),
+            on_log=lambda s, tid=tab_id, fns=self._log_fns: fns[tid](s),
             on_get_timings=lambda tid=tab_id: self._timings_for_tab(tid),
             on_get_confirm_specs=lambda tid=tab_id: self._confirm_specs_for_tab(tid),
         )
@@ -278,69 +237,94 @@ class MailboxPlugin(PluginInterface):
     def _get_active_clients_for_tab(self, tab_id: str) -> list[ClientItem]:
         ctx = self._tab_contexts.get(tab_id)
 
-        # 1) launcher rows (nick/login/pid mapping)
+        # сырьё читаем сразу: если ни строки Launcher, ни снимок окон не менялись,
+        # возвращаем закэшированный список без разбора и пересборки
         raw = load_launcher_rows_raw_anywhere(ctx)
-        rows: list[LauncherRow] = parse_launcher_rows_json(raw)
+        try:
+            snap_raw = str(ctx.get_global_value(LAUNCHER_WINDOWS_JSON_GLOBAL_KEY, "", value_type=str) or "")
+        except Exception:
+            snap_raw = ""
 
-        states: list[login_state.LoginRowState] = [
-            login_state.LoginRowState(row_id=f"r{i}", login=r.login, nickname=r.nickname, pid=r.pid)
-            for i, r in enumerate(rows)
-        ]
+        raw_sig = hash(raw or "")
+        snap_sig = hash(snap_raw)
+        cached_clients = self._clients_cache.get(tab_id)
+        if cached_clients is not None and cached_clients[0] == raw_sig and cached_clients[1] == snap_sig:
+            # потребители список только читают — отдаём тот же объект
+            return cached_clients[2]
+
+        # 1) launcher windows snapshot (pid -> hwnd), обновляется LauncherPlugin'ом с общей частотой.
+        # Снимок разбираем первым: без окон клиентов нет, и строки Launcher можно не трогать вовсе
+        pid_to_hwnd: dict[int, int] = {}
+        if snap_raw.strip():
+            cached = self._snap_cache.get(tab_id)
+            if cached is not None and cached[0] == snap_raw:
+                pid_to_hwnd = cached[1]
+            else:
+                try:
+                    snap = _loads(snap_raw)
+                except Exception:
+                    snap = {}
+                wins = snap.get("windows", []) if isinstance(snap, dict) else []
+                if isinstance(wins, list):
+                    for w in wins:
+                        if not isinstance(w, dict):
+                            continue
+                        try:
+                            pid = int(w.get("pid", 0) or 0)
+                            hwnd = int(w.get("hwnd", 0) or 0)
+                        except Exception:
+                            continue
+                        if pid > 0 and hwnd > 0:
+                            pid_to_hwnd[pid] = hwnd
+                self._snap_cache[tab_id] = (snap_raw, pid_to_hwnd)
+        if not pid_to_hwnd:
+            # Launcher ещё не публиковал окна — итог и так был бы пуст
+            out_empty: list[ClientItem] = []
+            self._clients_cache[tab_id] = (raw_sig, snap_sig, out_empty)
+            return out_empty
+
+        # 2) launcher rows (nick/login/pid mapping) — один проход вместо четырёх:
+        # порядок ников, логин и активный PID собираются за одну итерацию по rows
+        rows: list[LauncherRow] = parse_launcher_rows_json(raw)
 
-        nicknames = login_state.unique_nicknames_in_order(states)
+        nicknames: list[str] = []
         nick_to_login: dict[str, str] = {}
+        nick_to_pid: dict[str, int] = {}
         for r in rows:
             nk = str(r.nickname or "").strip()
-            if nk and nk not in nick_to_login:
+            if not nk:
+                continue
+            if nk not in nick_to_login:
+                nicknames.append(nk)
                 nick_to_login[nk] = str(r.login or "").strip()
+            # правило login_state.active_pid_for_nickname: первый активный PID для ника
+            pid = int(r.pid or 0)
+            if pid > 0 and not nick_to_pid.get(nk):
+                nick_to_pid[nk] = pid
 
-        # 2) launcher windows snapshot (pid -> hwnd), обновляется LauncherPlugin'ом с общей частотой
-        pid_to_hwnd: dict[int, int] = {}
-        try:
-            snap_raw = str(ctx.get_global_value(LAUNCHER_WINDOWS_JSON_GLOBAL_KEY, "", value_type=str) or "")
-        except Exception:
-            snap_raw = ""
-        if snap_raw.strip():
-            try:
-                snap = json.loads(snap_raw)
-            except Exception:
-                snap = {}
-            wins = snap.get("windows", []) if isinstance(snap, dict) else []
-            if isinstance(wins, list):
-                for w in wins:
-                    if not isinstance(w, dict):
-                        continue
-                    try:
-                        pid = int(w.get("pid", 0) or 0)
-                        hwnd = int(w.get("hwnd", 0) or 0)
-                    except Exception:
-                        continue
-                    if pid > 0 and hwnd > 0:
-                        pid_to_hwnd[pid] = hwnd
-
+        # значения в nick_to_pid/pid_to_hwnd уже int, ники уже strip-нуты:
+        # в цикле остаются только lookup'ы и конструктор
         out: list[ClientItem] = []
+        out_append = out.append
+        get_pid = nick_to_pid.get
+        get_hwnd = pid_to_hwnd.get
+        get_login = nick_to_login.get
         for nick in nicknames:
-            pid = int(login_state.active_pid_for_nickname(states, nick))
+            pid = get_pid(nick, 0)
             if pid <= 0:
                 continue  # показываем только активные
-            hwnd = int(pid_to_hwnd.get(pid, 0) or 0)
-            if hwnd <= 0:
+            hwnd = get_hwnd(pid, 0)
+            if not hwnd:
                 # берём только окна, которые есть в снимке Launcher (чтобы не делать свой поиск окон)
                 continue
-            out.append(
-                ClientItem(
-                    nickname=str(nick).strip(),
-                    login=str(nick_to_login.get(str(nick).strip(), "") or "").strip(),
-                    pid=pid,
-                    hwnd=hwnd,
-                )
-            )
+            out_append(ClientItem(nickname=nick, login=get_login(nick, ""), pid=pid, hwnd=hwnd))
+        self._clients_cache[tab_id] = (raw_sig, snap_sig, out)
         return out
 
     def execute(self, tab_context, console_output_fn, stop_flag=None):
         # Этот плагин не требует фоновой логики, но поддерживаем Run/Stop для совместимости.
         tab_id = str(getattr(tab_context, "tab_id", ""))
-        self._console_out[tab_id] = console_output_fn
+        self._log_fns[tab_id] = console_output_fn
 
         def stopped() -> bool:
             try:
@@ -348,16 +332,22 @@ class MailboxPlugin(PluginInterface):
             except Exception:
                 return True
 
+        wake = self._exec_wake.setdefault(tab_id, threading.Event())
+        wake.clear()
+
         try:
             console_output_fn("[RUN] Плагин 'Почта' активен.")
             w = self._widgets.get(tab_id)
             if w is not None:
-                QMetaObject.invokeMethod(w, "set_run_active", Qt.QueuedConnection, Q_ARG(bool, True))
+                w.run_active_changed.emit(True)
+            # Ждём на Event, а не в time.sleep: wake.set() будит поток мгновенно.
+            # stop_flag хост отдаёт только как callable, поэтому опрос остаётся.
             while not stopped():
-                time.sleep(0.2)
+                if wake.wait(0.2):
+                    wake.clear()
         finally:
             w = self._widgets.get(tab_id)
             if w is not None:
-                QMetaObject.invokeMethod(w, "set_run_active", Qt.QueuedConnection, Q_ARG(bool, False))
-            self._console_out.pop(tab_id, None)
+                w.run_active_changed.emit(False)
+            self._log_fns[tab_id] = _noop_log
 
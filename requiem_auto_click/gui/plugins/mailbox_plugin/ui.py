@@ -1,11 +1,15 @@
 # pylint: disable=import-error,no-name-in-module,broad-exception-caught
 from __future__ import annotations
 
+import functools
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from PySide6.QtCore import QTimer, Signal, Slot
+from PySide6.QtCore import QCoreApplication, QMetaObject, Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -19,15 +23,32 @@ from PySide6.QtWidgets import (
 )
 
 from ..utils.windows import pid_exists
-from ....modules.mailbox_manager import (
-    MailboxCancelledError,
-    MailboxConfirmSpec,
-    MailboxManager,
-    MailboxTimings,
-)
+
+if TYPE_CHECKING:
+    from ....modules.mailbox_manager import MailboxConfirmSpec, MailboxTimings
+
+
+# mailbox_manager тянет за собой image-finder и прочие тяжёлые зависимости —
+# импортируем его лениво, чтобы не тормозить открытие главного окна.
+# Дефолты замороженные, поэтому один экземпляр безопасно разделяется между вызовами.
+@functools.lru_cache(maxsize=1)
+def _default_timings() -> MailboxTimings:
+    from ....modules.mailbox_manager import MailboxTimings
+
+    return MailboxTimings()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_confirm_specs() -> tuple[MailboxConfirmSpec, MailboxConfirmSpec]:
+    from ....modules.mailbox_manager import MailboxConfirmSpec
+
+    return (
+        MailboxConfirmSpec(395, 324, 97, 20, 444, 333, "auto-delete"),
+        MailboxConfirmSpec(395, 292, 97, 20, 444, 300, "manual-delete"),
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ClientItem:
     nickname: str
     login: str
@@ -47,6 +68,12 @@ class MailboxWidget(QWidget):
 
     check_finished = Signal(bool, str)  # ok, message
     get_mail_finished = Signal(bool, str)  # ok, message
+    # потокобезопасный вход для Run/Stop из execute() (queued через AutoConnection)
+    run_active_changed = Signal(bool)
+
+    # poll статуса клиента: базовый интервал и потолок backoff'а
+    _STATUS_POLL_BASE_MS = 800
+    _STATUS_POLL_MAX_MS = 10_000
 
     def __init__(
         self,
@@ -66,11 +93,29 @@ class MailboxWidget(QWidget):
         self._on_get_confirm_specs = on_get_confirm_specs
         self._run_active: bool = False
         self._busy: bool = False
-        self._cancel = threading.Event()
+        # advisory-флаг отмены: атомарные чтение/запись bool в CPython,
+        # без захвата внутреннего лока threading.Event на каждую проверку cancel
+        self._cancel_flag: bool = False
 
         self._clients: list[ClientItem] = []
-        self._check_lock = threading.Lock()
-        self._get_mail_lock = threading.Lock()
+        # индекс ник -> клиент: строится в _refresh_clients, lookup без скана списка
+        self._clients_by_nick: dict[str, ClientItem] = {}
+        # снимок последнего списка клиентов: combo не перестраиваем без изменений
+        self._clients_key: tuple | None = None
+        # короткий TTL-кэш pid_exists: всплеск событий UI -> один OpenProcess
+        self._pid_cache: dict[int, tuple[float, bool]] = {}
+        # busy-флаги вместо Lock.acquire(blocking=False): клики сериализованы
+        # UI-потоком, полноценный примитив синхронизации здесь не нужен
+        self._check_running: bool = False
+        self._get_mail_running: bool = False
+        # общий пул для фоновых задач: клик ставит задачу в очередь,
+        # вместо создания нового потока на каждое нажатие
+        self._workers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mailbox")
+        # closeEvent для встроенного в таб виджета не приходит, а потоки пула
+        # не daemon — без остановки на выходе они блокируют завершение приложения
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_about_to_quit)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(10, 10, 10, 10)
@@ -147,69 +192,114 @@ class MailboxWidget(QWidget):
         root.addWidget(g_check, 0)
         root.addStretch(1)
 
-        self.client_combo.currentIndexChanged.connect(lambda _: self._refresh_client_status())
-        self.check_finished.connect(self._on_check_finished)
-        self.get_mail_finished.connect(self._on_get_mail_finished)
-
+        self.client_combo.currentIndexChanged.connect(self._on_client_combo_changed)
+        # сигналы результатов всегда приходят из пула воркеров — фиксируем
+        # queued-доставку явно, без проверки потока на каждый emit
+        self.check_finished.connect(self._on_check_finished, Qt.QueuedConnection)
+        self.get_mail_finished.connect(self._on_get_mail_finished, Qt.QueuedConnection)
+        self.run_active_changed.connect(self.set_run_active)
+
+        # Адаптивный poll статуса: при неизменном статусе интервал удваивается
+        # до потолка, любое взаимодействие (показ вкладки, смена клиента,
+        # завершение воркера) возвращает его к базовому значению
+        self._status_last: tuple[int, int, str] | None = None
         self._status_timer = QTimer(self)
-        self._status_timer.setInterval(800)
+        self._status_timer.setInterval(self._STATUS_POLL_BASE_MS)
         self._status_timer.timeout.connect(self._refresh_client_status)
         self._status_timer.start()
 
+        # лог-строки из воркеров коалесцируем в один вызов callback'а на кадр:
+        # каждая строка отдельно — это захват консоли и repaint на каждую запись
+        self._log_queue: deque[str] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(16)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+
         QTimer.singleShot(0, self._refresh_clients)
-        QTimer.singleShot(0, lambda: self.set_run_active(False))
+        # set_run_active(False) теперь no-op при совпадении состояния,
+        # поэтому стартовое выключение кнопок делаем напрямую
+        QTimer.singleShot(0, self._update_enabled)
 
     def _log(self, text: str) -> None:
+        if self._on_log is None:
+            return
+        self._log_queue.append(str(text))
+        # _log зовут и воркеры: таймер можно стартовать только из его потока,
+        # queued invoke безопасен отовсюду и не дублирует уже активный старт
+        if not self._log_flush_timer.isActive():
+            QMetaObject.invokeMethod(self._log_flush_timer, "start", Qt.QueuedConnection)
+
+    @Slot()
+    def _flush_logs(self) -> None:
+        q = self._log_queue
+        if not q:
+            return
+        lines: list[str] = []
+        while q:
+            try:
+                lines.append(q.popleft())
+            except IndexError:
+                break
         fn = self._on_log
         if fn is None:
             return
         try:
-            fn(str(text))
+            fn("\n".join(lines))
         except Exception:
             pass
 
     def _timings(self) -> MailboxTimings:
+        from ....modules.mailbox_manager import MailboxTimings
+
         fn = self._on_get_timings
         if fn is None:
-            return MailboxTimings()
+            return _default_timings()
         try:
             t = fn()
-            return t if isinstance(t, MailboxTimings) else MailboxTimings()
+            return t if isinstance(t, MailboxTimings) else _default_timings()
         except Exception:
-            return MailboxTimings()
+            return _default_timings()
 
     def _confirm_specs(self) -> tuple[MailboxConfirmSpec, MailboxConfirmSpec]:
+        from ....modules.mailbox_manager import MailboxConfirmSpec
+
         fn = self._on_get_confirm_specs
         if fn is None:
-            return (
-                MailboxConfirmSpec((395, 324), (97, 20), (444, 333), "auto-delete"),
-                MailboxConfirmSpec((395, 292), (97, 20), (444, 300), "manual-delete"),
-            )
+            return _default_confirm_specs()
         try:
             auto, manual = fn()
+            # точное совпадение типа — частый случай, без обхода MRO;
+            # isinstance остаётся только для возможных подклассов
+            if type(auto) is MailboxConfirmSpec and type(manual) is MailboxConfirmSpec:
+                return (auto, manual)
             if not isinstance(auto, MailboxConfirmSpec) or not isinstance(manual, MailboxConfirmSpec):
                 raise TypeError("invalid confirm specs")
             return (auto, manual)
         except Exception:
-            return (
-                MailboxConfirmSpec((395, 324), (97, 20), (444, 333), "auto-delete"),
-                MailboxConfirmSpec((395, 292), (97, 20), (444, 300), "manual-delete"),
-            )
+            return _default_confirm_specs()
 
     @Slot(bool)
     def set_run_active(self, active: bool) -> None:
-        self._run_active = bool(active)
-        if self._run_active:
-            self._cancel.clear()
+        active = bool(active)
+        if active == self._run_active:
+            # повторный Run/Stop с тем же состоянием — не трогаем setEnabled'ы
+            return
+        self._run_active = active
+        if active:
+            self._cancel_flag = False
         else:
             # при Stop просим остановить все текущие потоки/скрипты
-            self._cancel.set()
+            self._cancel_flag = True
             self._busy = False
         self._update_enabled()
         self._log(f"[MAILBOX] UI: run_active={self._run_active}")
 
     def _set_busy(self, busy: bool) -> None:
-        self._busy = bool(busy)
+        busy = bool(busy)
+        if busy == self._busy:
+            return
+        self._busy = busy
         self._update_enabled()
 
     def _bring_focus_back_to_gui(self) -> None:
@@ -269,6 +359,17 @@ class MailboxWidget(QWidget):
             self._clients = list(self._on_get_clients() or [])
         except Exception:
             self._clients = []
+        new_key = tuple(self._clients)
+        if new_key == self._clients_key:
+            # список не изменился — combo перестраивать незачем
+            self._refresh_client_status()
+            self._update_enabled()
+            return
+        self._clients_key = new_key
+        # ники в ClientItem уже strip-нуты плагином, но не полагаемся на это
+        self._clients_by_nick = {
+            nick: c for c in self._clients if (nick := str(c.nickname or "").strip())
+        }
 
         current_text = str(self.client_combo.currentText() or "")
         self.client_combo.blockSignals(True)
@@ -299,72 +400,133 @@ class MailboxWidget(QWidget):
             return str(self.client_combo.currentText() or "").strip()
 
     def _resolve_client(self, nickname: str) -> ClientItem | None:
-        nickname = str(nickname or "").strip()
-        if not nickname:
-            return None
-        for c in self._clients:
-            if str(c.nickname or "").strip() == nickname:
-                return c
-        return None
+        return self._clients_by_nick.get(str(nickname or "").strip())
+
+    def _pid_exists_cached(self, pid: int) -> bool:
+        """pid_exists с TTL 0.5с — чтобы UI-поток не ходил в ядро на каждый тик."""
+        pid = int(pid)
+        now = time.monotonic()
+        cached = self._pid_cache.get(pid)
+        if cached is not None and (now - cached[0]) < 0.5:
+            return cached[1]
+        alive = pid_exists(pid)
+        # заодно выбрасываем давно не спрашивавшиеся PID'ы
+        if len(self._pid_cache) > 8:
+            self._pid_cache = {k: v for k, v in self._pid_cache.items() if (now - v[0]) < 5.0}
+        self._pid_cache[pid] = (now, alive)
+        return alive
+
+    def _reset_status_poll(self) -> None:
+        """Вернуть poll статуса к базовому интервалу (после взаимодействия)."""
+        self._status_timer.setInterval(self._STATUS_POLL_BASE_MS)
+
+    @Slot(int)
+    def _on_client_combo_changed(self, _index: int) -> None:
+        self._reset_status_poll()
+        self._refresh_client_status()
+
+    @Slot()
+    def _on_about_to_quit(self) -> None:
+        self._cancel_flag = True
+        self._workers.shutdown(wait=False)
+
+    def closeEvent(self, event) -> None:
+        self._workers.shutdown(wait=False)
+        super().closeEvent(event)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._status_timer.start()
+        self._reset_status_poll()
+        self._refresh_client_status()
+
+    def hideEvent(self, event) -> None:
+        # вкладка скрыта — poll статуса не нужен вовсе
+        self._status_timer.stop()
+        super().hideEvent(event)
 
     def _refresh_client_status(self) -> None:
+        if not self.isVisible():
+            return
         nick = self._selected_nickname()
+        pid = 0
+        hwnd = 0
         if not nick:
-            self.client_status.setText("Статус: клиент не выбран.")
-            return
-        c = self._resolve_client(nick)
-        pid = int(getattr(c, "pid", 0) or 0) if c is not None else 0
-        hwnd = int(getattr(c, "hwnd", 0) or 0) if c is not None else 0
-        if pid <= 0 or hwnd <= 0:
-            self.client_status.setText(f"Статус: выключен (ник={nick!r}).")
-            return
-        if not pid_exists(pid):
-            self.client_status.setText(f"Статус: процесс PID={pid} не существует (ник={nick!r}).")
-            return
-        self.client_status.setText(f"Статус: активно (ник={nick!r}, PID={pid}, HWND={hwnd}).")
+            text = "Статус: клиент не выбран."
+        else:
+            c = self._resolve_client(nick)
+            pid = c.pid if c is not None else 0
+            hwnd = c.hwnd if c is not None else 0
+            if pid <= 0 or hwnd <= 0:
+                text = f"Статус: выключен (ник={nick!r})."
+            elif not self._pid_exists_cached(pid):
+                text = f"Статус: процесс PID={pid} не существует (ник={nick!r})."
+            else:
+                text = f"Статус: активно (ник={nick!r}, PID={pid}, HWND={hwnd})."
 
-    def _check_clicked(self) -> None:
-        if not self._run_active:
-            self._set_result_error("Сначала нажмите Run")
+        if (pid, hwnd, text) == self._status_last:
+            # ничего не изменилось — реже дергаем таймер и не трогаем label
+            self._status_timer.setInterval(
+                min(self._status_timer.interval() * 2, self._STATUS_POLL_MAX_MS)
+            )
             return
+        self._status_last = (pid, hwnd, text)
+        self._reset_status_poll()
+        self.client_status.setText(text)
+
+    def _validated_target(self) -> tuple[str, int, int, str]:
+        """(nickname, pid, hwnd, error): при непустом error остальное невалидно."""
         nickname = self._selected_nickname()
         if not nickname:
-            self._set_result_error("Выберите клиента")
-            return
-
+            return ("", 0, 0, "Клиент не выбран")
         c = self._resolve_client(nickname)
-        pid = int(getattr(c, "pid", 0) or 0) if c is not None else 0
-        hwnd = int(getattr(c, "hwnd", 0) or 0) if c is not None else 0
+        pid = c.pid if c is not None else 0
+        hwnd = c.hwnd if c is not None else 0
         if pid <= 0 or hwnd <= 0:
-            self._set_result_error("Клиент не активен")
-            return
+            return (nickname, 0, 0, "Клиент не активен")
+        if not self._pid_exists_cached(pid):
+            return (nickname, 0, 0, "Процесс не существует")
+        return (nickname, pid, hwnd, "")
 
-        if not pid_exists(pid):
-            self._set_result_error("Процесс не существует")
+    def _check_clicked(self) -> None:
+        if not self._run_active:
+            self._set_result_error("Сначала нажмите Run")
+            return
+        nickname, pid, hwnd, err = self._validated_target()
+        if err:
+            self._set_result_error(err)
             return
 
         # prevent concurrent checks
-        if not self._check_lock.acquire(blocking=False):
+        if self._check_running:
             return
+        self._check_running = True
 
         self._set_busy(True)
         self._set_result_busy("Проверяю…")
         self._log(f"[MAILBOX] Проверка окна почты: nick={nickname!r}, pid={pid}, hwnd={hwnd}")
 
+        # настройки читаем один раз на клик, а не по разу на каждый spec
+        timings = self._timings()
+        auto_spec, manual_spec = self._confirm_specs()
+
         def _worker() -> None:
+            # импорт в воркере: первая загрузка mailbox_manager уходит с UI-потока
+            from ....modules.mailbox_manager import MailboxCancelledError, MailboxManager
+
             ok = False
             msg = ""
             try:
-                if self._cancel.is_set():
+                if self._cancel_flag:
                     raise MailboxCancelledError("Остановлено (плагин выключен)")
                 mgr = MailboxManager.for_hwnd(
                     hwnd=int(hwnd),
                     window_title_substring=self._window_title,
                     log=self._log,
-                    cancel=lambda: bool(self._cancel.is_set() or (not self._run_active)),
-                    timings=self._timings(),
-                    confirm_auto_delete=self._confirm_specs()[0],
-                    confirm_manual_delete=self._confirm_specs()[1],
+                    cancel=lambda: self._cancel_flag or (not self._run_active),
+                    timings=timings,
+                    confirm_auto_delete=auto_spec,
+                    confirm_manual_delete=manual_spec,
                 )
                 hit = mgr.check_mailbox_window(timeout_s=0.8)
                 ok = hit is not None
@@ -380,38 +542,34 @@ class MailboxWidget(QWidget):
             finally:
                 self.check_finished.emit(bool(ok), str(msg))
 
-        threading.Thread(target=_worker, name="mailbox-check", daemon=True).start()
+        self._workers.submit(_worker)
 
     def _get_mail_clicked(self) -> None:
         if not self._run_active:
             self._set_get_mail_result_fail("Сначала нажмите Run")
             return
-        nickname = self._selected_nickname()
-        if not nickname:
-            self._set_get_mail_result_fail("Клиент не выбран")
-            return
-
-        c = self._resolve_client(nickname)
-        pid = int(getattr(c, "pid", 0) or 0) if c is not None else 0
-        hwnd = int(getattr(c, "hwnd", 0) or 0) if c is not None else 0
-        if pid <= 0 or hwnd <= 0:
-            self._set_get_mail_result_fail("Клиент не активен")
-            return
-
-        if not pid_exists(pid):
-            self._set_get_mail_result_fail("Процесс не существует")
+        nickname, pid, hwnd, err = self._validated_target()
+        if err:
+            self._set_get_mail_result_fail(err)
             return
 
         # prevent concurrent run
-        if not self._get_mail_lock.acquire(blocking=False):
+        if self._get_mail_running:
             return
+        self._get_mail_running = True
 
         self._set_busy(True)
         self._set_get_mail_result_busy("Работаю…")
         mail_limit = int(self.mail_count_spin.value())
         self._log(f"[MAILBOX] Получить письма: старт nick={nickname!r}, pid={pid}, hwnd={hwnd}, limit={mail_limit}")
 
+        # настройки читаем один раз на клик, а не по разу на каждый spec
+        timings = self._timings()
+        auto_spec, manual_spec = self._confirm_specs()
+
         def _worker() -> None:
+            from ....modules.mailbox_manager import MailboxCancelledError, MailboxManager
+
             ok = False
             msg = ""
             try:
@@ -419,10 +577,10 @@ class MailboxWidget(QWidget):
                     hwnd=int(hwnd),
                     window_title_substring=self._window_title,
                     log=self._log,
-                    cancel=lambda: bool(self._cancel.is_set() or (not self._run_active)),
-                    timings=self._timings(),
-                    confirm_auto_delete=self._confirm_specs()[0],
-                    confirm_manual_delete=self._confirm_specs()[1],
+                    cancel=lambda: self._cancel_flag or (not self._run_active),
+                    timings=timings,
+                    confirm_auto_delete=auto_spec,
+                    confirm_manual_delete=manual_spec,
                 )
                 mgr.prepare_get_mails(mail_limit=int(mail_limit))
                 ok = True
@@ -439,7 +597,7 @@ class MailboxWidget(QWidget):
             finally:
                 self.get_mail_finished.emit(bool(ok), str(msg))
 
-        threading.Thread(target=_worker, name="mailbox-get-mails", daemon=True).start()
+        self._workers.submit(_worker)
 
     @Slot(bool, str)
     def _on_check_finished(self, ok: bool, msg: str) -> None:
@@ -450,10 +608,9 @@ class MailboxWidget(QWidget):
                 self._set_result_error(msg or "Окно почтового ящика ненайдено")
         finally:
             self._set_busy(False)
-            try:
-                self._check_lock.release()
-            except Exception:
-                pass
+            self._check_running = False
+            self._reset_status_poll()
+            self._refresh_client_status()
             # вернуть фокус обратно в GUI
             QTimer.singleShot(50, self._bring_focus_back_to_gui)
 
@@ -466,9 +623,8 @@ class MailboxWidget(QWidget):
                 self._set_get_mail_result_fail(msg or "Ошибка")
         finally:
             self._set_busy(False)
-            try:
-                self._get_mail_lock.release()
-            except Exception:
-                pass
+            self._get_mail_running = False
+            self._reset_status_poll()
+            self._refresh_client_status()
             QTimer.singleShot(50, self._bring_focus_back_to_gui)
 
@@ -5,14 +5,29 @@ import time
 import threading
 import json
 import ctypes
+import ctypes.wintypes
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+try:
+    # orjson (C-расширение) заметно быстрее stdlib json; зависимость необязательная
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
 from sa_ui_operations import IntegerSetting, PluginInterface
 
 # pylint: disable=import-error,no-name-in-module
-from PySide6.QtCore import QMetaObject, Qt, Q_ARG
+from PySide6.QtCore import QCoreApplication, QMetaObject, QObject, Qt, QTimer, Q_ARG, Slot
 
-from ..utils import login_state
 from ..utils.launcher_rows import LauncherRow, load_launcher_rows_raw_anywhere, parse_launcher_rows_json
 from ..utils.windows import find_hwnd_by_pid_and_exact_title, focus_hwnd, pid_exists
 from .ui import ClientItem, SharpeningWidget
@@ -26,6 +41,32 @@ from ....modules.windows_mouse_client import WindowsMouseClient
 
 WINDOW_TITLE = "Requiem"
 
+# user32 биндим один раз на модуль; прототип GetAsyncKeyState задаём явно,
+# чтобы fallback-опрос Backspace не платил __getattr__ по WinDLL на каждой итерации
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_GetAsyncKeyState = _user32.GetAsyncKeyState
+_GetAsyncKeyState.argtypes = [ctypes.c_int]
+_GetAsyncKeyState.restype = ctypes.c_short
+
+
+@lru_cache(maxsize=256)
+def _profile_keys(nickname: str) -> dict[str, str]:
+    """Все ключи QSettings профиля, собранные один раз на ник (lru_cache)."""
+    nick = str(nickname or "").strip()
+    # Keep keys stable and safe for QSettings
+    base = f"sharpening/profiles/{nick}" if nick else "sharpening/profiles/__none__"
+    return {
+        "blob": f"{base}/profile_json",
+        "collapsed_mask": f"{base}/collapsed_mask",
+        "targets_json": f"{base}/targets_json",
+        "groups_json": f"{base}/groups_json",
+        "mode": f"{base}/mode",
+        "skip_xeon": f"{base}/skip_xeon",
+        "safe_first": f"{base}/safe_first",
+        "group_need_max30": f"{base}/group_need_max30",
+        "group_configs_json": f"{base}/group_configs_json",
+    }
+
 
 @dataclass(frozen=True)
 class _ItemRead:
@@ -35,6 +76,92 @@ class _ItemRead:
     reason: str  # empty|reject_ok|unreadable|ok
 
 
+@dataclass(frozen=True, slots=True)
+class _Timings:
+    """Снимок таймингов воркера: прямой доступ к атрибутам вместо dict.get с дефолтами."""
+
+    after_drag_ms: int
+    after_reject_close_ms: int
+    after_repeat_ready_ms: int
+    after_click_auto_ms: int
+    after_click_ok_ms: int
+    after_click_map_ms: int
+    poll_ms: int
+
+
+@dataclass
+class _ProfileLazy:
+    """
+    Профиль ника: скаляры читаются сразу (дёшево), матрицы хранятся
+    сырыми JSON-строками и парсятся только при первом обращении.
+    """
+
+    collapsed_mask: int
+    mode: str
+    skip_xeon: bool
+    safe_first: bool
+    targets_raw: str = ""
+    groups_raw: str = ""
+    group_configs_raw: str = ""
+
+    @cached_property
+    def targets(self) -> list[list[list[int]]] | None:
+        if self.targets_raw:
+            try:
+                v = _loads(self.targets_raw)
+                return v if isinstance(v, list) else None
+            except Exception:
+                return None
+        return None
+
+    @cached_property
+    def groups(self) -> list[list[list[int]]] | None:
+        if self.groups_raw:
+            try:
+                v = _loads(self.groups_raw)
+                return v if isinstance(v, list) else None
+            except Exception:
+                return None
+        return None
+
+    @cached_property
+    def group_configs(self) -> list[dict]:
+        if self.group_configs_raw:
+            try:
+                v = _loads(self.group_configs_raw)
+                if isinstance(v, list):
+                    return v
+            except Exception:
+                pass
+        return [{"group_id": 1, "max_level": 30, "need_count": 2}]
+
+    @classmethod
+    def from_values(
+        cls,
+        *,
+        targets: list | None,
+        groups: list | None,
+        collapsed_mask: int,
+        mode: str,
+        skip_xeon: bool,
+        safe_first: bool,
+        group_configs: list | None,
+    ) -> "_ProfileLazy":
+        """Профиль из уже разобранных значений (persist/legacy): парсить нечего."""
+        p = cls(
+            collapsed_mask=int(collapsed_mask),
+            mode=str(mode or ""),
+            skip_xeon=bool(skip_xeon),
+            safe_first=bool(safe_first),
+        )
+        p.__dict__["targets"] = targets
+        p.__dict__["groups"] = groups
+        p.__dict__["group_configs"] = group_configs if isinstance(group_configs, list) else [
+            {"group_id": 1, "max_level": 30, "need_count": 2}
+        ]
+        return p
+
+
 class SharpeningPlugin(PluginInterface):
     """
     Плагин: настройка заточки (матрица 5x5 по ячейкам рюкзака).
@@ -50,6 +177,35 @@ class SharpeningPlugin(PluginInterface):
         self._console_out: dict[str, object] = {}
         self._worker_stop: dict[str, threading.Event] = {}
         self._worker_thread: dict[str, threading.Thread] = {}
+        # событие пробуждения цикла ожидания execute() per tab
+        self._exec_wake: dict[str, threading.Event] = {}
+        # debounce-таймеры записи профиля per tab: серия config_changed
+        # схлопывается в одну запись в QSettings
+        self._persist_timers: dict[str, QTimer] = {}
+        # хэш последнего записанного содержимого per (tab, nick):
+        # повторный persist без реальных изменений не пишет в QSettings вовсе
+        self._last_persisted: dict[tuple[str, str], int] = {}
+        # отложенная запись профилей: сериализация и setValue уходят в один
+        # фоновый writer-поток, очередь "последний вариант побеждает" per (tab, nick)
+        self._writer_lock = threading.Lock()
+        self._writer_pending: dict[tuple[str, str], tuple[object, str, _ProfileLazy]] = {}
+        self._writer_wake = threading.Event()
+        self._writer_thread: threading.Thread | None = None
+        # UI-thread мосты per tab: финальный setValue отложенной записи
+        # выполняется только в UI-потоке (QSettings не потокобезопасен per-instance)
+        self._ui_bridge: dict[str, QObject] = {}
+        # кэш списка клиентов per tab (ts, items): парсинг launcher-строк
+        # не повторяется чаще, чем раз в 500 мс
+        self._clients_cache: dict[str, tuple[float, list[ClientItem]]] = {}
+        # последнее отправленное в виджет состояние (run_active, busy) per tab:
+        # no-op переходы не кладут событие в очередь Qt
+        self._ui_state: dict[str, tuple[bool, bool]] = {}
+        # aboutToQuit-хук ставится один раз на плагин (см. _flush_pending_persists)
+        self._quit_hook_installed: bool = False
+        # кэш профилей (tab_id, nick) -> _ProfileLazy:
+        # повторное переключение на ник не ходит в QSettings вовсе,
+        # _persist_profile обновляет кэш write-through
+        self._profile_cache: dict[tuple[str, str], _ProfileLazy] = {}
 
     def get_key(self) -> str:
         return "sharpening_plugin"
@@ -107,62 +263,22 @@ class SharpeningPlugin(PluginInterface):
     def _get_tab_int_setting(self, tab_id: str, *, key: str, default_v: int, min_v: int = 0) -> int:
         ctx = self._tab_contexts.get(tab_id)
         if ctx is None:
-            return int(max(int(min_v), int(default_v)))
+            return max(min_v, default_v)
         key_local = f"settings/{key}"
         try:
             settings_key = ctx.key(key_local)
             if ctx.settings.contains(settings_key):
                 v = int(ctx.settings.value(settings_key, default_v, type=int))
             else:
-                v = int(default_v)
+                v = default_v
         except Exception:
-            v = int(default_v)
-        if v < int(min_v):
-            return int(min_v)
-        return int(v)
+            v = default_v
+        return v if v >= min_v else min_v
 
     @staticmethod
     def _settings_key_selected_nickname() -> str:
         return "sharpening/selected_nickname"
 
-    @staticmethod
-    def _profile_base(nickname: str) -> str:
-        nick = str(nickname or "").strip()
-        # Keep keys stable and safe for QSettings
-        return f"sharpening/profiles/{nick}" if nick else "sharpening/profiles/__none__"
-
-    @classmethod
-    def _settings_key_profile_collapsed_mask(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/collapsed_mask"
-
-    @classmethod
-    def _settings_key_profile_targets_json(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/targets_json"
-
-    @classmethod
-    def _settings_key_profile_groups_json(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/groups_json"
-
-    @classmethod
-    def _settings_key_profile_mode(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/mode"
-
-    @classmethod
-    def _settings_key_profile_skip_xeon(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/skip_xeon"
-
-    @classmethod
-    def _settings_key_profile_safe_first(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/safe_first"
-
-    @classmethod
-    def _settings_key_profile_group_need_max30(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/group_need_max30"
-
-    @classmethod
-    def _settings_key_profile_group_configs_json(cls, nickname: str) -> str:
-        return f"{cls._profile_base(nickname)}/group_configs_json"
-
     def create_widget(self, tab_context):
         tab_id = str(getattr(tab_context, "tab_id", ""))
         self._tab_contexts[tab_id] = tab_context
@@ -181,88 +297,97 @@ class SharpeningPlugin(PluginInterface):
         except Exception:
             initial_nick = ""
 
-        (
-            initial_targets,
-            initial_groups,
-            initial_mask,
-            initial_mode,
-            initial_skip_xeon,
-            initial_safe_first,
-            initial_group_configs,
-        ) = self._load_profile(tab_context, initial_nick)
+        initial_profile = self._load_profile(tab_context, initial_nick)
 
         w = SharpeningWidget(
             window_title=WINDOW_TITLE,
             on_get_clients=lambda: self._get_clients_for_tab(tab_id),
             initial_selected_nickname=initial_nick,
-            initial_collapsed_mask=initial_mask,
+            initial_collapsed_mask=initial_profile.collapsed_mask,
         )
         w.start_sharpening_clicked.connect(lambda tid=tab_id: self._start_worker(tid))
         w.stop_sharpening_clicked.connect(lambda tid=tab_id: self._stop_worker(tid))
         w.selected_nickname_changed.connect(lambda nick, ctx=tab_context, wid=w: self._on_selected_nickname(ctx, wid, str(nick)))
         w.collapsed_mask_changed.connect(lambda mask, ctx=tab_context, wid=w: self._persist_profile(ctx, wid, mask_only=True))
-        w.config_changed.connect(lambda ctx=tab_context, wid=w: self._persist_profile(ctx, wid, mask_only=False))
+        # полная запись профиля дебаунсится: пока пользователь кликает по матрице,
+        # пишем в QSettings один раз после паузы, а не на каждый клик
+        persist_timer = QTimer(w)
+        persist_timer.setSingleShot(True)
+        persist_timer.setInterval(200)
+        persist_timer.timeout.connect(lambda ctx=tab_context, wid=w: self._persist_profile(ctx, wid, mask_only=False))
+        self._persist_timers[tab_id] = persist_timer
+        w.config_changed.connect(persist_timer.start)
         self._widgets[tab_id] = w
 
+        # UI-thread bridge (как в launcher): writer-поток сериализует payload,
+        # но save_value делает только этот слот в UI-потоке.
+        ctx = tab_context
+
+        class _UiBridge(QObject):
+            @Slot(str, str)
+            def save_profile_blob(self, key: str, payload: str) -> None:
+                try:
+                    ctx.save_value(str(key), str(payload))
+                except Exception:
+                    pass
+
+        self._ui_bridge[tab_id] = _UiBridge(parent=w)
+
+        # финальный сброс на выходе: дебаунс и очередь writer-потока не должны
+        # молча терять правки, сделанные за 200 мс до закрытия приложения
+        if not self._quit_hook_installed:
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._flush_pending_persists)
+                self._quit_hook_installed = True
+
         # apply initial profile (targets + collapsed) right away
         try:
             w.apply_profile(
-                targets=initial_targets,
-                collapsed_mask=int(initial_mask),
-                mode_key=str(initial_mode or "").strip() or None,
-                skip_xeon=bool(initial_skip_xeon),
-                safe_first=bool(initial_safe_first),
-                group_configs=initial_group_configs,
+                targets=initial_profile.targets,
+                collapsed_mask=int(initial_profile.collapsed_mask),
+                mode_key=str(initial_profile.mode or "").strip() or None,
+                skip_xeon=bool(initial_profile.skip_xeon),
+                safe_first=bool(initial_profile.safe_first),
+                group_configs=initial_profile.group_configs,
             )
         except Exception:
             pass
         try:
-            if initial_groups is not None:
-                self._apply_groups_to_widget(w, initial_groups)
+            if initial_profile.groups is not None:
+                w.set_groups(initial_profile.groups)
         except Exception:
             pass
         return w
 
-    @staticmethod
-    def _apply_groups_to_widget(widget: SharpeningWidget, groups: list) -> None:
-        for bi in range(min(8, len(groups))):
-            bag = groups[bi] if isinstance(groups[bi], list) else []
-            for r in range(min(5, len(bag))):
-                row = bag[r] if isinstance(bag[r], list) else []
-                for c in range(min(5, len(row))):
-                    try:
-                        v = int(row[c] or 0)
-                    except Exception:
-                        v = 0
-                    widget.set_group(backpack_index=int(bi), row=int(r), col=int(c), group_id=(v if v > 0 else None))
-
     def _persist_selected_nickname(self, tab_context, nickname: str) -> None:
         try:
             tab_context.save_value(self._settings_key_selected_nickname(), str(nickname or "").strip())
         except Exception:
             pass
 
-    def _load_profile(
-        self, tab_context, nickname: str
-    ) -> tuple[list[list[list[int]]] | None, list[list[list[int]]] | None, int, str, bool, bool, list[dict] | None]:
+    def _invalidate_profile_cache(self, tab_context, nickname: str) -> None:
+        """Сброс кэша профиля (для явной перечитки из QSettings)."""
+        tab_id = str(getattr(tab_context, "tab_id", ""))
+        self._profile_cache.pop((tab_id, str(nickname or "").strip()), None)
+
+    def _load_profile(self, tab_context, nickname: str) -> _ProfileLazy:
         nick = str(nickname or "").strip()
-        # collapsed
-        try:
-            mask = int(
-                tab_context.settings.value(
-                    tab_context.key(self._settings_key_profile_collapsed_mask(nick)),
-                    0,
-                    type=int,
-                )
-                or 0
-            )
-        except Exception:
-            mask = 0
-        # targets
+        tab_id = str(getattr(tab_context, "tab_id", ""))
+        cached = self._profile_cache.get((tab_id, nick))
+        if cached is not None:
+            return cached
+        profile = self._read_profile(tab_context, nick)
+        self._profile_cache[(tab_id, nick)] = profile
+        return profile
+
+    def _read_profile(self, tab_context, nick: str) -> _ProfileLazy:
+        # Весь профиль лежит одним JSON-блобом: одно чтение QSettings + один parse
+        # (матрицы внутри блоба — вложенные JSON-строки, их парсит _ProfileLazy лениво).
         try:
             raw = str(
                 tab_context.settings.value(
-                    tab_context.key(self._settings_key_profile_targets_json(nick)),
+                    tab_context.key(_profile_keys(nick)["blob"]),
                     "",
                     type=str,
                 )
@@ -270,192 +395,291 @@ class SharpeningPlugin(PluginInterface):
             ).strip()
         except Exception:
             raw = ""
+        if raw:
+            try:
+                data = _loads(raw)
+                if isinstance(data, dict):
+                    return self._profile_from_blob(data)
+            except Exception:
+                pass
+        # Блоба нет (или битый) -> читаем старые раздельные ключи и,
+        # если профиль там был, один раз мигрируем его в блоб.
+        targets, groups, mask, mode, skip_xeon, safe_first, group_configs = self._read_profile_legacy(tab_context, nick)
+        profile = _ProfileLazy.from_values(
+            targets=targets,
+            groups=groups,
+            collapsed_mask=int(mask),
+            mode=mode,
+            skip_xeon=bool(skip_xeon),
+            safe_first=bool(safe_first),
+            group_configs=group_configs,
+        )
+        try:
+            has_legacy = bool(
+                tab_context.settings.contains(tab_context.key(_profile_keys(nick)["targets_json"]))
+            )
+        except Exception:
+            has_legacy = False
+        if has_legacy:
+            self._write_profile_blob(tab_context, nick, profile)
+        return profile
 
-        # groups
+    @staticmethod
+    def _profile_from_blob(data: dict) -> _ProfileLazy:
         try:
-            groups_raw = str(
-                tab_context.settings.value(
-                    tab_context.key(self._settings_key_profile_groups_json(nick)),
-                    "",
-                    type=str,
+            mask = int(data.get("collapsed_mask", 0) or 0)
+        except Exception:
+            mask = 0
+        profile = _ProfileLazy(
+            collapsed_mask=int(mask),
+            mode=str(data.get("mode", "") or "").strip(),
+            skip_xeon=bool(data.get("skip_xeon", 0)),
+            safe_first=bool(data.get("safe_first", 0)),
+            targets_raw=str(data.get("targets_json", "") or ""),
+            groups_raw=str(data.get("groups_json", "") or ""),
+            group_configs_raw=str(data.get("group_configs_json", "") or ""),
+        )
+        # совместимость с ранним форматом блоба, где матрицы лежали вложенными списками
+        if not profile.targets_raw and isinstance(data.get("targets"), list):
+            profile.__dict__["targets"] = data["targets"]
+        if not profile.groups_raw and isinstance(data.get("groups"), list):
+            profile.__dict__["groups"] = data["groups"]
+        if not profile.group_configs_raw and isinstance(data.get("group_configs"), list):
+            profile.__dict__["group_configs"] = data["group_configs"]
+        return profile
+
+    @staticmethod
+    def _profile_content_key(profile: _ProfileLazy) -> int:
+        """Хэш содержимого профиля (вложенные списки замораживаются в кортежи)."""
+
+        def freeze(v):
+            if isinstance(v, list):
+                return tuple(freeze(x) for x in v)
+            if isinstance(v, dict):
+                return tuple(sorted((k, freeze(x)) for k, x in v.items()))
+            return v
+
+        return hash(
+            (
+                int(profile.collapsed_mask),
+                str(profile.mode or ""),
+                bool(profile.skip_xeon),
+                bool(profile.safe_first),
+                freeze(profile.targets),
+                freeze(profile.groups),
+                freeze(profile.group_configs),
+            )
+        )
+
+    def _queue_profile_write(self, tab_context, nick: str, profile: _ProfileLazy) -> None:
+        """
+        Запись профиля без блокировки UI-потока: json.dumps больших матриц делает
+        writer-поток, готовая строка возвращается queued-вызовом в UI-поток
+        (_UiBridge.save_profile_blob). Повторная запись того же (tab, nick)
+        до того, как writer успел её забрать, просто заменяет отложенный payload.
+        """
+        tab_id = str(getattr(tab_context, "tab_id", ""))
+        with self._writer_lock:
+            self._writer_pending[(tab_id, nick)] = (tab_context, nick, profile)
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._profile_writer_loop, name="sharpening-profile-writer", daemon=True
                 )
-                or ""
-            ).strip()
+                self._writer_thread.start()
+        self._writer_wake.set()
+
+    def _profile_writer_loop(self) -> None:
+        # writer только сериализует; сам setValue уезжает queued-вызовом в UI-поток,
+        # т.к. один инстанс QSettings нельзя трогать из двух потоков одновременно
+        while True:
+            self._writer_wake.wait()
+            self._writer_wake.clear()
+            while True:
+                with self._writer_lock:
+                    if not self._writer_pending:
+                        break
+                    (tab_id, nick), (_ctx, _nick, profile) = self._writer_pending.popitem()
+                payload = self._serialize_profile_blob(profile)
+                bridge = self._ui_bridge.get(tab_id)
+                if payload is None or bridge is None:
+                    continue
+                QMetaObject.invokeMethod(
+                    bridge,
+                    "save_profile_blob",
+                    Qt.QueuedConnection,
+                    Q_ARG(str, _profile_keys(nick)["blob"]),
+                    Q_ARG(str, payload),
+                )
+
+    @staticmethod
+    def _serialize_profile_blob(profile: _ProfileLazy) -> str | None:
+        try:
+            blob = {
+                "collapsed_mask": int(profile.collapsed_mask),
+                "mode": str(profile.mode or ""),
+                "skip_xeon": 1 if profile.skip_xeon else 0,
+                "safe_first": 1 if profile.safe_first else 0,
+                # матрицы храним вложенными JSON-строками: читатель парсит их лениво
+                "targets_json": profile.targets_raw or _dumps(profile.targets),
+                "groups_json": profile.groups_raw or _dumps(profile.groups),
+                "group_configs_json": profile.group_configs_raw or _dumps(profile.group_configs),
+            }
+            return _dumps(blob)
         except Exception:
-            groups_raw = ""
+            return None
+
+    def _write_profile_blob(self, tab_context, nick: str, profile: _ProfileLazy) -> None:
+        """Синхронная запись из UI-потока (миграция legacy-ключей, сброс на выходе)."""
+        payload = self._serialize_profile_blob(profile)
+        if payload is None:
+            return
+        try:
+            tab_context.save_value(_profile_keys(nick)["blob"], payload)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _get_profile_value(tab_context, key: str, default, type_):
+        """Одно чтение QSettings с дефолтом при любой ошибке."""
+        try:
+            return tab_context.settings.value(tab_context.key(key), default, type=type_)
+        except Exception:
+            return default
+
+    def _read_profile_flags(self, tab_context, nick: str) -> tuple[str, bool, bool]:
+        """Скалярные флаги профиля (mode, skip_xeon, safe_first) одним блоком."""
+        keys = _profile_keys(nick)
+        mode = str(self._get_profile_value(tab_context, keys["mode"], "", str) or "").strip()
+        skip_xeon = bool(self._get_profile_value(tab_context, keys["skip_xeon"], 0, int) or 0)
+        safe_first = bool(self._get_profile_value(tab_context, keys["safe_first"], 0, int) or 0)
+        return (mode, skip_xeon, safe_first)
+
+    def _read_profile_legacy(
+        self, tab_context, nick: str
+    ) -> tuple[list[list[list[int]]] | None, list[list[list[int]]] | None, int, str, bool, bool, list[dict] | None]:
+        keys = _profile_keys(nick)
+        # collapsed
+        mask = int(self._get_profile_value(tab_context, keys["collapsed_mask"], 0, int) or 0)
+        # targets
+        raw = str(self._get_profile_value(tab_context, keys["targets_json"], "", str) or "").strip()
+        # groups
+        groups_raw = str(self._get_profile_value(tab_context, keys["groups_json"], "", str) or "").strip()
         groups_data = None
         if groups_raw:
             try:
-                gd = json.loads(groups_raw)
+                gd = _loads(groups_raw)
                 groups_data = gd if isinstance(gd, list) else None
             except Exception:
                 groups_data = None
         # group configs (per-group settings)
         group_configs = None
-        try:
-            raw_cfg = str(
-                tab_context.settings.value(
-                    tab_context.key(self._settings_key_profile_group_configs_json(nick)),
-                    "",
-                    type=str,
-                )
-                or ""
-            ).strip()
-        except Exception:
-            raw_cfg = ""
+        raw_cfg = str(
+            self._get_profile_value(tab_context, keys["group_configs_json"], "", str) or ""
+        ).strip()
         if raw_cfg:
             try:
-                v = json.loads(raw_cfg)
+                v = _loads(raw_cfg)
                 group_configs = v if isinstance(v, list) else None
             except Exception:
                 group_configs = None
         # backward compatibility: old single K -> create one row for G1
         if group_configs is None:
-            try:
-                old_need = int(
-                    tab_context.settings.value(
-                        tab_context.key(self._settings_key_profile_group_need_max30(nick)),
-                        2,
-                        type=int,
-                    )
-                    or 2
-                )
-            except Exception:
-                old_need = 2
+            old_need = int(self._get_profile_value(tab_context, keys["group_need_max30"], 2, int) or 2)
             old_need = max(1, min(25, int(old_need)))
             group_configs = [{"group_id": 1, "max_level": 30, "need_count": int(old_need)}]
 
+        mode, skip_xeon, safe_first = self._read_profile_flags(tab_context, nick)
+
         if not raw:
-            # mode + skip
-            mode = ""
-            skip_xeon = False
-            safe_first = False
-            try:
-                mode = str(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_mode(nick)), "", type=str) or ""
-                ).strip()
-            except Exception:
-                mode = ""
-            try:
-                skip_xeon = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_skip_xeon(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                skip_xeon = False
-            try:
-                safe_first = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_safe_first(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                safe_first = False
-            return (None, groups_data, int(mask), mode, bool(skip_xeon), bool(safe_first), group_configs)
+            return (None, groups_data, int(mask), mode, skip_xeon, safe_first, group_configs)
         try:
-            data = json.loads(raw)
+            data = _loads(raw)
             if not isinstance(data, list):
                 data = None
-            mode = ""
-            skip_xeon = False
-            safe_first = False
-            try:
-                mode = str(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_mode(nick)), "", type=str) or ""
-                ).strip()
-            except Exception:
-                mode = ""
-            try:
-                skip_xeon = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_skip_xeon(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                skip_xeon = False
-            try:
-                safe_first = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_safe_first(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                safe_first = False
-            return (data, groups_data, int(mask), mode, bool(skip_xeon), bool(safe_first), group_configs)
+            return (data, groups_data, int(mask), mode, skip_xeon, safe_first, group_configs)
         except Exception:
-            mode = ""
-            skip_xeon = False
-            safe_first = False
-            try:
-                mode = str(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_mode(nick)), "", type=str) or ""
-                ).strip()
-            except Exception:
-                mode = ""
-            try:
-                skip_xeon = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_skip_xeon(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                skip_xeon = False
-            try:
-                safe_first = bool(
-                    tab_context.settings.value(tab_context.key(self._settings_key_profile_safe_first(nick)), 0, type=int) or 0
-                )
-            except Exception:
-                safe_first = False
-            return (None, groups_data, int(mask), mode, bool(skip_xeon), bool(safe_first), group_configs)
+            return (None, groups_data, int(mask), mode, skip_xeon, safe_first, group_configs)
 
     def _persist_profile(self, tab_context, widget: SharpeningWidget, *, mask_only: bool) -> None:
         nick = str(widget.get_selected_nickname() or "").strip()
         if not nick:
             return
-        try:
-            tab_context.save_value(self._settings_key_profile_collapsed_mask(nick), int(widget.get_collapsed_mask()))
-        except Exception:
-            # fallback: не критично
-            pass
+        tab_id = str(getattr(tab_context, "tab_id", ""))
+        mask = int(widget.get_collapsed_mask())
         if mask_only:
+            profile = self._load_profile(tab_context, nick)
+            if profile.collapsed_mask == mask:
+                return
+            profile.collapsed_mask = mask
+            # маска меняет содержимое: сохранённый хэш полного профиля устарел
+            self._last_persisted.pop((tab_id, nick), None)
+            self._queue_profile_write(tab_context, nick, profile)
+            self._profile_cache[(tab_id, nick)] = profile
             return
-        try:
-            payload = json.dumps(widget.export_targets(), ensure_ascii=False)
-            tab_context.save_value(self._settings_key_profile_targets_json(nick), payload)
-        except Exception:
-            pass
-        try:
-            g_payload = json.dumps(widget.export_groups(), ensure_ascii=False)
-            tab_context.save_value(self._settings_key_profile_groups_json(nick), g_payload)
-        except Exception:
-            pass
-        try:
-            tab_context.save_value(self._settings_key_profile_mode(nick), str(widget.get_mode_key() or "to_target"))
-        except Exception:
-            pass
-        try:
-            tab_context.save_value(self._settings_key_profile_skip_xeon(nick), 1 if bool(widget.get_skip_xeon()) else 0)
-        except Exception:
-            pass
-        try:
-            tab_context.save_value(self._settings_key_profile_safe_first(nick), 1 if bool(widget.get_safe_first()) else 0)
-        except Exception:
-            pass
-        try:
-            cfg_payload = json.dumps(widget.export_group_configs(), ensure_ascii=False)
-            tab_context.save_value(self._settings_key_profile_group_configs_json(nick), cfg_payload)
-        except Exception:
-            pass
+        profile = _ProfileLazy.from_values(
+            targets=widget.export_targets(),
+            groups=widget.export_groups(),
+            collapsed_mask=int(mask),
+            mode=str(widget.get_mode_key() or "to_target"),
+            skip_xeon=bool(widget.get_skip_xeon()),
+            safe_first=bool(widget.get_safe_first()),
+            group_configs=widget.export_group_configs(),
+        )
+        # "записывать только при реальном изменении": тоггл туда-обратно не трогает QSettings
+        content_key = self._profile_content_key(profile)
+        if self._last_persisted.get((tab_id, nick)) == content_key:
+            return
+        self._last_persisted[(tab_id, nick)] = content_key
+        self._queue_profile_write(tab_context, nick, profile)
+        # write-through: следующий _load_profile вернёт ровно то, что сохранили
+        self._profile_cache[(tab_id, nick)] = profile
+
+    @Slot()
+    def _flush_pending_persists(self) -> None:
+        """
+        Сброс отложенных записей на aboutToQuit: активные debounce-таймеры
+        дозаписываются сразу, а очередь writer-потока пишется синхронно —
+        queued-вызовы в UI-поток после остановки event loop уже не доставляются.
+        """
+        for tab_id, timer in self._persist_timers.items():
+            try:
+                if not timer.isActive():
+                    continue
+                timer.stop()
+            except Exception:
+                continue
+            ctx = self._tab_contexts.get(tab_id)
+            w = self._widgets.get(tab_id)
+            if ctx is None or w is None:
+                continue
+            try:
+                self._persist_profile(ctx, w, mask_only=False)
+            except Exception:
+                pass
+        with self._writer_lock:
+            pending = list(self._writer_pending.values())
+            self._writer_pending.clear()
+        for tab_context, nick, profile in pending:
+            self._write_profile_blob(tab_context, nick, profile)
 
     def _on_selected_nickname(self, tab_context, widget: SharpeningWidget, nickname: str) -> None:
         nick = str(nickname or "").strip()
         self._persist_selected_nickname(tab_context, nick)
-        targets, groups, mask, mode, skip_xeon, safe_first, group_configs = self._load_profile(tab_context, nick)
+        profile = self._load_profile(tab_context, nick)
         try:
             widget.apply_profile(
-                targets=targets,
-                collapsed_mask=int(mask),
-                mode_key=str(mode or "").strip() or None,
-                skip_xeon=bool(skip_xeon),
-                safe_first=bool(safe_first),
-                group_configs=group_configs,
+                targets=profile.targets,
+                collapsed_mask=int(profile.collapsed_mask),
+                mode_key=str(profile.mode or "").strip() or None,
+                skip_xeon=bool(profile.skip_xeon),
+                safe_first=bool(profile.safe_first),
+                group_configs=profile.group_configs,
             )
         except Exception:
             pass
         try:
-            if groups is not None:
-                self._apply_groups_to_widget(widget, groups)
+            if profile.groups is not None:
+                widget.set_groups(profile.groups)
         except Exception:
             pass
 
@@ -463,46 +687,56 @@ class SharpeningPlugin(PluginInterface):
     # Launcher clients -> combo model (как в CaptureRoiPlugin)
     # -----------------
     def _get_clients_for_tab(self, tab_id: str) -> list[ClientItem]:
+        now = time.monotonic()
+        cached = self._clients_cache.get(tab_id)
+        if cached is not None and (now - cached[0]) < 0.5:
+            return cached[1]
         ctx = self._tab_contexts.get(tab_id)
         raw = load_launcher_rows_raw_anywhere(ctx)
         rows: list[LauncherRow] = parse_launcher_rows_json(raw)
 
-        states: list[login_state.LoginRowState] = [
-            login_state.LoginRowState(
-                row_id=f"r{i}",
-                login=r.login,
-                nickname=r.nickname,
-                pid=r.pid,
-            )
-            for i, r in enumerate(rows)
-        ]
-
-        nicknames = login_state.unique_nicknames_in_order(states)
+        # один проход по строкам: порядок ников, логин и первый активный PID каждого
+        order: list[str] = []
         nick_to_login: dict[str, str] = {}
+        nick_to_pid: dict[str, int] = {}
         for r in rows:
-            nk = str(r.nickname or "").strip()
-            if nk and nk not in nick_to_login:
-                nick_to_login[nk] = str(r.login or "").strip()
-
-        out: list[ClientItem] = []
-        for nick in nicknames:
-            pid = int(login_state.active_pid_for_nickname(states, nick))
-            out.append(
-                ClientItem(
-                    nickname=str(nick).strip(),
-                    login=str(nick_to_login.get(str(nick).strip(), "") or "").strip(),
-                    pid=pid,
-                )
-            )
+            nick = str(r.nickname or "").strip()
+            if not nick:
+                continue
+            if nick not in nick_to_login:
+                order.append(nick)
+                nick_to_login[nick] = str(r.login or "").strip()
+            pid = int(r.pid or 0)
+            if pid > 0 and nick_to_pid.get(nick, 0) <= 0:
+                nick_to_pid[nick] = pid
+
+        out = [
+            ClientItem(nickname=nick, login=nick_to_login[nick], pid=nick_to_pid.get(nick, 0))
+            for nick in order
+        ]
+        self._clients_cache[tab_id] = (now, out)
         return out
 
+    def _set_ui_state(self, tab_id: str, *, run_active: bool | None = None, busy: bool | None = None) -> None:
+        """Одно queued-событие set_state(run_active, busy) вместо пары отдельных."""
+        w = self._widgets.get(tab_id)
+        if w is None:
+            return
+        cur = self._ui_state.get(tab_id, (False, False))
+        new = (
+            cur[0] if run_active is None else bool(run_active),
+            cur[1] if busy is None else bool(busy),
+        )
+        if new == cur:
+            return
+        self._ui_state[tab_id] = new
+        QMetaObject.invokeMethod(w, "set_state", Qt.QueuedConnection, Q_ARG(bool, new[0]), Q_ARG(bool, new[1]))
+
     def execute(self, tab_context, console_output_fn, stop_flag=None):
         tab_id = str(getattr(tab_context, "tab_id", ""))
         self._console_out[tab_id] = console_output_fn
 
-        w = self._widgets.get(tab_id)
-        if w is not None:
-            QMetaObject.invokeMethod(w, "set_run_active", Qt.QueuedConnection, Q_ARG(bool, True))
+        self._set_ui_state(tab_id, run_active=True, busy=False)
 
         def stopped() -> bool:
             try:
@@ -510,16 +744,20 @@ class SharpeningPlugin(PluginInterface):
             except Exception:
                 return True
 
+        wake = self._exec_wake.setdefault(tab_id, threading.Event())
+        wake.clear()
+
         try:
             console_output_fn("[RUN] Плагин 'Заточка' активен (пока только настройка матрицы).")
+            # Ждём на Event, а не в time.sleep: _stop_worker будит поток мгновенно.
+            # stop_flag хост отдаёт только как callable, поэтому опрос остаётся.
             while not stopped():
-                time.sleep(0.2)
+                if wake.wait(0.2):
+                    wake.clear()
         finally:
             # если вкладка/скрипт выключается — останавливаем воркер и прячем лоадер
             self._stop_worker(tab_id)
-            w2 = self._widgets.get(tab_id)
-            if w2 is not None:
-                QMetaObject.invokeMethod(w2, "set_run_active", Qt.QueuedConnection, Q_ARG(bool, False))
+            self._set_ui_state(tab_id, run_active=False, busy=False)
             self._console_out.pop(tab_id, None)
 
     def _start_worker(self, tab_id: str) -> None:
@@ -531,6 +769,9 @@ class SharpeningPlugin(PluginInterface):
             return
 
         stop.clear()
+        # Виджет уже показал лоадер в _start_clicked — фиксируем это в кэше состояния.
+        cur = self._ui_state.get(tab_id, (True, False))
+        self._ui_state[tab_id] = (cur[0], True)
 
         # Snapshot UI state in UI thread before starting background worker.
         w0 = self._widgets.get(tab_id)
@@ -543,32 +784,29 @@ class SharpeningPlugin(PluginInterface):
         skip_xeon = bool(w0.get_skip_xeon())
         safe_first = bool(w0.get_safe_first())
         group_configs = w0.export_group_configs()
+        # Снимок nickname->pid здесь же: воркер не перечитывает launcher-строки.
+        pid = self._pid_for_nickname(tab_id, nickname) if nickname else 0
         # Snapshot timings from UI thread (не читаем QSettings из воркера).
-        timings_ms = {
-            "after_drag_ms": int(self._get_tab_int_setting(tab_id, key="sharpen_after_drag_ms", default_v=100, min_v=0)),
-            "after_reject_close_ms": int(
-                self._get_tab_int_setting(tab_id, key="sharpen_after_reject_close_ms", default_v=350, min_v=0)
-            ),
-            "after_repeat_ready_ms": int(
-                self._get_tab_int_setting(tab_id, key="sharpen_after_repeat_ready_ms", default_v=250, min_v=0)
-            ),
-            "after_click_auto_ms": int(
-                self._get_tab_int_setting(tab_id, key="sharpen_after_click_auto_ms", default_v=100, min_v=0)
-            ),
-            "after_click_ok_ms": int(self._get_tab_int_setting(tab_id, key="sharpen_after_click_ok_ms", default_v=500, min_v=0)),
-            "after_click_map_ms": int(self._get_tab_int_setting(tab_id, key="sharpen_after_click_map_ms", default_v=800, min_v=0)),
-            "poll_ms": int(self._get_tab_int_setting(tab_id, key="sharpen_worker_poll_ms", default_v=10, min_v=1)),
-        }
+        timings = _Timings(
+            after_drag_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_drag_ms", default_v=100, min_v=0),
+            after_reject_close_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_reject_close_ms", default_v=350, min_v=0),
+            after_repeat_ready_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_repeat_ready_ms", default_v=250, min_v=0),
+            after_click_auto_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_click_auto_ms", default_v=100, min_v=0),
+            after_click_ok_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_click_ok_ms", default_v=500, min_v=0),
+            after_click_map_ms=self._get_tab_int_setting(tab_id, key="sharpen_after_click_map_ms", default_v=800, min_v=0),
+            poll_ms=self._get_tab_int_setting(tab_id, key="sharpen_worker_poll_ms", default_v=10, min_v=1),
+        )
 
         def _worker() -> None:
             try:
                 self._run_sharpening_worker(
                     tab_id,
                     nickname=nickname,
+                    pid=pid,
                     targets=targets,
                     groups=groups,
                     stop=stop,
-                    timings_ms=timings_ms,
+                    timings=timings,
                     mode_key=mode_key,
                     skip_xeon=skip_xeon,
                     safe_first=safe_first,
@@ -578,9 +816,7 @@ class SharpeningPlugin(PluginInterface):
                 self._log(tab_id, f"[ERROR] Заточка: исключение: {e}")
             finally:
                 # hide loader when stopped/finished
-                w = self._widgets.get(tab_id)
-                if w is not None:
-                    QMetaObject.invokeMethod(w, "set_busy", Qt.QueuedConnection, Q_ARG(bool, False))
+                self._set_ui_state(tab_id, busy=False)
 
         t = threading.Thread(target=_worker, name=f"sharpening-worker-{tab_id}", daemon=True)
         self._worker_thread[tab_id] = t
@@ -590,9 +826,10 @@ class SharpeningPlugin(PluginInterface):
         ev = self._worker_stop.get(tab_id)
         if ev is not None:
             ev.set()
-        w = self._widgets.get(tab_id)
-        if w is not None:
-            QMetaObject.invokeMethod(w, "set_busy", Qt.QueuedConnection, Q_ARG(bool, False))
+        wake = self._exec_wake.get(tab_id)
+        if wake is not None:
+            wake.set()
+        self._set_ui_state(tab_id, busy=False)
 
     def _log(self, tab_id: str, text: str) -> None:
         fn = self._console_out.get(tab_id)
@@ -616,24 +853,19 @@ class SharpeningPlugin(PluginInterface):
     # Common worker actions (shared between modes)
     # -----------------
     @staticmethod
-    def _sleep_ms(stop: threading.Event, timings_ms: dict[str, int], ms: int) -> None:
+    def _sleep_ms(stop: threading.Event, ms: int) -> None:
+        # Event.wait выходит мгновенно по stop.set() — чанковать sleep по poll_ms
+        # незачем: пауза 800 мс будила поток ~80 раз впустую
         ms_i = int(ms or 0)
         if ms_i <= 0:
             return
-        poll = max(1, int(timings_ms.get("poll_ms", 10) or 10))
-        remaining = ms_i
-        while remaining > 0:
-            if stop.is_set():
-                return
-            chunk = min(remaining, poll)
-            time.sleep(float(chunk) / 1000.0)
-            remaining -= chunk
+        stop.wait(float(ms_i) / 1000.0)
 
     def _reset_to_backpack(
         self,
         *,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         backpacks: BackpackManager,
         sharpening: SharpeningManager,
         backpack_index: int,
@@ -641,7 +873,7 @@ class SharpeningPlugin(PluginInterface):
         if stop.is_set():
             return
         sharpening.click_repeat(reset_window_top_left=True)
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_repeat_ready_ms", 250)))
+        self._sleep_ms(stop, timings.after_repeat_ready_ms)
         backpacks.ensure_backpack_window_available(int(backpack_index))
 
     def _drag_and_read_item(
@@ -649,7 +881,7 @@ class SharpeningPlugin(PluginInterface):
         tab_id: str,
         *,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         backpacks: BackpackManager,
         sharpening: SharpeningManager,
         backpack_index: int,
@@ -663,56 +895,59 @@ class SharpeningPlugin(PluginInterface):
         bi = int(backpack_index)
         r = int(row)
         c = int(col)
+        attempts = int(max_attempts)
 
         # сначала убеждаемся, что окно рюкзака доступно
         try:
-            backpacks.ensure_backpack_window_available(int(bi))
+            backpacks.ensure_backpack_window_available(bi)
         except Exception:
             pass
 
-        moved = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(backpack_index=int(bi), row=int(r), col=int(c))
+        moved = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(backpack_index=bi, row=r, col=c)
         if not moved:
             # попробуем один раз "починить" рюкзак и повторить drag
             try:
-                backpacks.ensure_backpack_window_available(int(bi))
+                backpacks.ensure_backpack_window_available(bi)
             except Exception:
                 pass
-            moved = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(
-                backpack_index=int(bi), row=int(r), col=int(c)
-            )
+            moved = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(backpack_index=bi, row=r, col=c)
         if not moved:
             return _ItemRead(present=False, variant="", level=-1, reason="empty")
 
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_drag_ms", 100)))
+        self._sleep_ms(stop, timings.after_drag_ms)
 
         if sharpening.check_reject_ok_popup_and_close():
-            self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_reject_close_ms", 350)))
+            self._sleep_ms(stop, timings.after_reject_close_ms)
             try:
-                backpacks.ensure_backpack_window_available(int(bi))
+                backpacks.ensure_backpack_window_available(bi)
             except Exception:
                 pass
             return _ItemRead(present=False, variant="", level=-1, reason="reject_ok")
 
         variant = ""
         lvl = -1
-        for attempt in range(1, int(max_attempts) + 1):
+        for attempt in range(1, attempts + 1):
             if stop.is_set():
-                return _ItemRead(present=False, variant=str(variant or ""), level=int(lvl), reason="stopped")
+                return _ItemRead(present=False, variant=variant or "", level=lvl, reason="stopped")
             try:
                 variant = sharpening.ensure_item_is_sharpenable()
                 lvl = int(sharpening.get_current_sharpening_value(variant=variant))
                 if lvl > 30:
                     raise RuntimeError(f"Некорректный уровень заточки: {lvl} (>30)")
-                return _ItemRead(present=True, variant=str(variant or ""), level=int(lvl), reason="ok")
+                return _ItemRead(present=True, variant=variant or "", level=lvl, reason="ok")
             except Exception as e:
+                if stop.is_set():
+                    # не тратимся на форматирование лога, если уже останавливаемся
+                    return _ItemRead(present=False, variant="", level=-1, reason="stopped")
                 self._log(
                     tab_id,
-                    f"[WARN] Распознавание уровня не удалось (попытка {attempt}/{int(max_attempts)}): {e} -> повторный drag",
+                    f"[WARN] Распознавание уровня не удалось (попытка {attempt}/{attempts}): {e} -> повторный drag",
                 )
-                _ = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(
-                    backpack_index=int(bi), row=int(r), col=int(c)
-                )
-                self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_drag_ms", 100)))
+                _ = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(backpack_index=bi, row=r, col=c)
+                # растущий backoff между повторами: подряд идущие сбои OCR
+                # не прибивают паузу к фиксированным after_drag_ms
+                base = timings.after_drag_ms or 100
+                stop.wait(min(base * (1 << (attempt - 1)), 500) / 1000.0)
                 variant = ""
                 lvl = -1
                 continue
@@ -724,7 +959,7 @@ class SharpeningPlugin(PluginInterface):
         tab_id: str,
         *,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         sharpening: SharpeningManager,
         variant: str,
         skip_xeon: bool,
@@ -733,13 +968,13 @@ class SharpeningPlugin(PluginInterface):
         if stop.is_set():
             return False
         sharpening.click_auto()
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_click_auto_ms", 100)))
+        self._sleep_ms(stop, timings.after_click_auto_ms)
         try:
             sharpening.ensure_auto_button_active()
         except Exception as e:
-            if bool(skip_xeon):
+            if skip_xeon:
                 if variant:
-                    blocked_variants.add(str(variant))
+                    blocked_variants.add(variant)
                     self._log(tab_id, f"[WARN] Ксеоны закончились на {variant} -> блокируем все {variant}: {e}")
                 else:
                     self._log(tab_id, f"[WARN] Ксеоны закончились -> пропуск предмета: {e}")
@@ -747,11 +982,11 @@ class SharpeningPlugin(PluginInterface):
             raise
 
         sharpening.click_ok()
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_click_ok_ms", 500)))
+        self._sleep_ms(stop, timings.after_click_ok_ms)
         sharpening.click_map()
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_click_map_ms", 800)))
+        self._sleep_ms(stop, timings.after_click_map_ms)
         sharpening.click_repeat(reset_window_top_left=True)
-        self._sleep_ms(stop, timings_ms, int(timings_ms.get("after_repeat_ready_ms", 250)))
+        self._sleep_ms(stop, timings.after_repeat_ready_ms)
         return True
 
     def _run_sharpening_worker(
@@ -759,25 +994,25 @@ class SharpeningPlugin(PluginInterface):
         tab_id: str,
         *,
         nickname: str,
+        pid: int,
         targets: list,
         groups: list,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         mode_key: str,
         skip_xeon: bool,
         safe_first: bool,
         group_configs: list,
     ) -> None:
-        user32 = ctypes.windll.user32
         VK_BACKSPACE = 0x08
 
         # Backspace может нажиматься во время "блокирующих" операций (template matching и т.п.).
         # Чтобы не пропускать короткое нажатие, запускаем отдельный watcher, который выставляет stop.
-        def _backspace_watcher() -> None:
+        def _backspace_watcher_polling() -> None:
             last_state = False
             while not stop.is_set():
                 try:
-                    state = (user32.GetAsyncKeyState(VK_BACKSPACE) & 0x8000) != 0
+                    state = (_GetAsyncKeyState(VK_BACKSPACE) & 0x8000) != 0
                 except Exception:
                     state = False
                 # фронт нажатия
@@ -788,6 +1023,37 @@ class SharpeningPlugin(PluginInterface):
                 last_state = bool(state)
                 time.sleep(0.02)
 
+        def _backspace_watcher() -> None:
+            # RegisterHotKey привязан к вызвавшему потоку, поэтому регистрируем
+            # и слушаем очередь сообщений прямо в watcher-потоке.
+            try:
+                registered = bool(_user32.RegisterHotKey(None, 1, 0, VK_BACKSPACE))
+            except Exception:
+                registered = False
+            if not registered:
+                # Хоткей мог быть занят (другая вкладка/процесс) -> старый опрос.
+                _backspace_watcher_polling()
+                return
+            WM_HOTKEY = 0x0312
+            PM_REMOVE = 0x0001
+            QS_ALLINPUT = 0x04FF
+            msg = ctypes.wintypes.MSG()
+            try:
+                while not stop.is_set():
+                    # Чистый GetMessageW блокировал бы поток после внешней
+                    # остановки, поэтому ждём сообщений с таймаутом.
+                    _user32.MsgWaitForMultipleObjects(0, None, False, 250, QS_ALLINPUT)
+                    while _user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                        if int(msg.message) == WM_HOTKEY:
+                            self._log(tab_id, "[STOP] Заточка: остановлено (Backspace).")
+                            stop.set()
+                            return
+            finally:
+                try:
+                    _user32.UnregisterHotKey(None, 1)
+                except Exception:
+                    pass
+
         threading.Thread(target=_backspace_watcher, name=f"sharpening-backspace-{tab_id}", daemon=True).start()
 
         nickname = str(nickname or "").strip()
@@ -795,7 +1061,7 @@ class SharpeningPlugin(PluginInterface):
             self._log(tab_id, "[WARN] Заточка: клиент не выбран.")
             return
 
-        pid = int(self._pid_for_nickname(tab_id, nickname))
+        pid = int(pid or 0)
         if pid <= 0 or (not pid_exists(pid)):
             self._log(tab_id, f"[WARN] Заточка: клиент не активен (ник={nickname!r}).")
             return
@@ -829,9 +1095,6 @@ class SharpeningPlugin(PluginInterface):
                 return True
             return False
 
-        def sleep_ms(ms: int) -> None:
-            self._sleep_ms(stop, timings_ms, ms)
-
         total = sum(
             1
             for bag in (targets or [])
@@ -849,7 +1112,7 @@ class SharpeningPlugin(PluginInterface):
                 tab_id,
                 targets=targets,
                 stop=stop,
-                timings_ms=timings_ms,
+                timings=timings,
                 backpacks=backpacks,
                 sharpening=sharpening,
                 skip_xeon=bool(skip_xeon),
@@ -866,7 +1129,7 @@ class SharpeningPlugin(PluginInterface):
                 groups=groups,
                 group_configs=group_configs,
                 stop=stop,
-                timings_ms=timings_ms,
+                timings=timings,
                 backpacks=backpacks,
                 sharpening=sharpening,
                 skip_xeon=True,
@@ -907,7 +1170,7 @@ class SharpeningPlugin(PluginInterface):
                         read = self._drag_and_read_item(
                             tab_id,
                             stop=stop,
-                            timings_ms=timings_ms,
+                            timings=timings,
                             backpacks=backpacks,
                             sharpening=sharpening,
                             backpack_index=int(backpack_index),
@@ -934,7 +1197,7 @@ class SharpeningPlugin(PluginInterface):
                                 )
                             self._reset_to_backpack(
                                 stop=stop,
-                                timings_ms=timings_ms,
+                                timings=timings,
                                 backpacks=backpacks,
                                 sharpening=sharpening,
                                 backpack_index=int(backpack_index),
@@ -954,7 +1217,7 @@ class SharpeningPlugin(PluginInterface):
                             )
                             self._reset_to_backpack(
                                 stop=stop,
-                                timings_ms=timings_ms,
+                                timings=timings,
                                 backpacks=backpacks,
                                 sharpening=sharpening,
                                 backpack_index=int(backpack_index),
@@ -964,7 +1227,7 @@ class SharpeningPlugin(PluginInterface):
                         if current_level >= target_level:
                             self._reset_to_backpack(
                                 stop=stop,
-                                timings_ms=timings_ms,
+                                timings=timings,
                                 backpacks=backpacks,
                                 sharpening=sharpening,
                                 backpack_index=int(backpack_index),
@@ -989,7 +1252,7 @@ class SharpeningPlugin(PluginInterface):
                         ok_xeon = self._click_sharpen_cycle(
                             tab_id,
                             stop=stop,
-                            timings_ms=timings_ms,
+                            timings=timings,
                             sharpening=sharpening,
                             variant=str(variant),
                             skip_xeon=bool(skip_xeon),
@@ -998,7 +1261,7 @@ class SharpeningPlugin(PluginInterface):
                         if not ok_xeon and bool(skip_xeon):
                             self._reset_to_backpack(
                                 stop=stop,
-                                timings_ms=timings_ms,
+                                timings=timings,
                                 backpacks=backpacks,
                                 sharpening=sharpening,
                                 backpack_index=int(backpack_index),
@@ -1014,7 +1277,7 @@ class SharpeningPlugin(PluginInterface):
         *,
         targets: list,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         backpacks: BackpackManager,
         sharpening: SharpeningManager,
         skip_xeon: bool,
@@ -1034,7 +1297,7 @@ class SharpeningPlugin(PluginInterface):
             ms_i = int(ms or 0)
             if ms_i <= 0:
                 return
-            poll = max(1, int(timings_ms.get("poll_ms", 10) or 10))
+            poll = max(1, timings.poll_ms)
             remaining = ms_i
             while remaining > 0:
                 if stopped():
@@ -1073,10 +1336,10 @@ class SharpeningPlugin(PluginInterface):
                     self._log(tab_id, f"[OK] Итерация {iteration}: пусто -> исключаем ({bi+1}:{r+1},{c+1})")
                     continue
 
-                sleep_ms(int(timings_ms.get("after_drag_ms", 100)))
+                sleep_ms(timings.after_drag_ms)
 
                 if sharpening.check_reject_ok_popup_and_close():
-                    sleep_ms(int(timings_ms.get("after_reject_close_ms", 350)))
+                    sleep_ms(timings.after_reject_close_ms)
                     backpacks.ensure_backpack_window_available(int(bi))
                     self._log(tab_id, f"[OK] Итерация {iteration}: reject_ok -> исключаем ({bi+1}:{r+1},{c+1})")
                     continue
@@ -1100,21 +1363,21 @@ class SharpeningPlugin(PluginInterface):
                             row=int(r),
                             col=int(c),
                         )
-                        sleep_ms(int(timings_ms.get("after_drag_ms", 100)))
+                        sleep_ms(timings.after_drag_ms)
                         variant = ""
                         current_level = -1
                         continue
                 if current_level < 0:
                     self._log(tab_id, f"[WARN] Не удалось распознать уровень после 5 попыток -> исключаем ({bi+1}:{r+1},{c+1})")
                     sharpening.click_repeat(reset_window_top_left=True)
-                    sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                    sleep_ms(timings.after_repeat_ready_ms)
                     backpacks.ensure_backpack_window_available(int(bi))
                     continue
 
                 # Если вариант уже "заблокирован по ксеонам" — исключаем предмет из следующих итераций.
                 if bool(skip_xeon) and variant and (str(variant) in blocked):
                     sharpening.click_repeat(reset_window_top_left=True)
-                    sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                    sleep_ms(timings.after_repeat_ready_ms)
                     backpacks.ensure_backpack_window_available(int(bi))
                     self._log(tab_id, f"[WARN] Вариант {variant} заблокирован -> исключаем ({bi+1}:{r+1},{c+1})")
                     continue
@@ -1122,7 +1385,7 @@ class SharpeningPlugin(PluginInterface):
                 # 2) if already done -> exclude
                 if current_level >= int(target_level):
                     sharpening.click_repeat(reset_window_top_left=True)
-                    sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                    sleep_ms(timings.after_repeat_ready_ms)
                     backpacks.ensure_backpack_window_available(int(bi))
                     self._log(tab_id, f"[OK] Итерация {iteration}: готово {current_level}>={target_level} -> исключаем ({bi+1}:{r+1},{c+1})")
                     continue
@@ -1148,7 +1411,7 @@ class SharpeningPlugin(PluginInterface):
                             f"[RUN] Итерация {iteration}: safe {current_level}>{current_level+1}({target_level}) ({bi+1}:{r+1},{c+1})",
                         )
                         sharpening.click_auto()
-                        sleep_ms(int(timings_ms.get("after_click_auto_ms", 100)))
+                        sleep_ms(timings.after_click_auto_ms)
                         try:
                             sharpening.ensure_auto_button_active()
                         except Exception as e:
@@ -1162,17 +1425,17 @@ class SharpeningPlugin(PluginInterface):
                                 else:
                                     self._log(tab_id, f"[WARN] Ксеоны закончились -> исключаем ({bi+1}:{r+1},{c+1}): {e}")
                                 sharpening.click_repeat(reset_window_top_left=True)
-                                sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                                sleep_ms(timings.after_repeat_ready_ms)
                                 backpacks.ensure_backpack_window_available(int(bi))
                                 current_level = int(target_level)  # force exclude
                                 break
                             raise
                         sharpening.click_ok()
-                        sleep_ms(int(timings_ms.get("after_click_ok_ms", 500)))
+                        sleep_ms(timings.after_click_ok_ms)
                         sharpening.click_map()
-                        sleep_ms(int(timings_ms.get("after_click_map_ms", 800)))
+                        sleep_ms(timings.after_click_map_ms)
                         sharpening.click_repeat(reset_window_top_left=True)
-                        sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                        sleep_ms(timings.after_repeat_ready_ms)
 
                         for attempt in range(1, 6):
                             _ = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(
@@ -1180,7 +1443,7 @@ class SharpeningPlugin(PluginInterface):
                                 row=int(r),
                                 col=int(c),
                             )
-                            sleep_ms(int(timings_ms.get("after_drag_ms", 100)))
+                            sleep_ms(timings.after_drag_ms)
                             try:
                                 variant2 = sharpening.ensure_item_is_sharpenable()
                                 current_level = int(sharpening.get_current_sharpening_value(variant=variant2))
@@ -1216,7 +1479,7 @@ class SharpeningPlugin(PluginInterface):
                     f"{'safe' if is_safe_now else 'unsafe'} {variant} ({bi+1}:{r+1},{c+1})",
                 )
                 sharpening.click_auto()
-                sleep_ms(int(timings_ms.get("after_click_auto_ms", 100)))
+                sleep_ms(timings.after_click_auto_ms)
                 try:
                     sharpening.ensure_auto_button_active()
                 except Exception as e:
@@ -1230,17 +1493,17 @@ class SharpeningPlugin(PluginInterface):
                         else:
                             self._log(tab_id, f"[WARN] Ксеоны закончились -> исключаем ({bi+1}:{r+1},{c+1}): {e}")
                         sharpening.click_repeat(reset_window_top_left=True)
-                        sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                        sleep_ms(timings.after_repeat_ready_ms)
                         backpacks.ensure_backpack_window_available(int(bi))
                         continue
                     raise
 
                 sharpening.click_ok()
-                sleep_ms(int(timings_ms.get("after_click_ok_ms", 500)))
+                sleep_ms(timings.after_click_ok_ms)
                 sharpening.click_map()
-                sleep_ms(int(timings_ms.get("after_click_map_ms", 800)))
+                sleep_ms(timings.after_click_map_ms)
                 sharpening.click_repeat(reset_window_top_left=True)
-                sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+                sleep_ms(timings.after_repeat_ready_ms)
 
                 # 4) keep for next iteration
                 next_active.append((int(bi), int(r), int(c), int(target_level)))
@@ -1254,7 +1517,7 @@ class SharpeningPlugin(PluginInterface):
         groups: list,
         group_configs: list,
         stop: threading.Event,
-        timings_ms: dict[str, int],
+        timings: _Timings,
         backpacks: BackpackManager,
         sharpening: SharpeningManager,
         skip_xeon: bool,
@@ -1289,7 +1552,7 @@ class SharpeningPlugin(PluginInterface):
             ms_i = int(ms or 0)
             if ms_i <= 0:
                 return
-            poll = max(1, int(timings_ms.get("poll_ms", 10) or 10))
+            poll = max(1, timings.poll_ms)
             remaining = ms_i
             while remaining > 0:
                 if stopped():
@@ -1347,9 +1610,9 @@ class SharpeningPlugin(PluginInterface):
             )
             if not moved:
                 return (False, "", -1)
-            sleep_ms(int(timings_ms.get("after_drag_ms", 100)))
+            sleep_ms(timings.after_drag_ms)
             if sharpening.check_reject_ok_popup_and_close():
-                sleep_ms(int(timings_ms.get("after_reject_close_ms", 350)))
+                sleep_ms(timings.after_reject_close_ms)
                 backpacks.ensure_backpack_window_available(int(bi))
                 return (False, "", -1)
 
@@ -1370,7 +1633,7 @@ class SharpeningPlugin(PluginInterface):
                     _ = sharpening.drag_item_from_backpack_cell_to_sharpening_cell(
                         backpack_index=int(bi), row=int(r), col=int(c)
                     )
-                    sleep_ms(int(timings_ms.get("after_drag_ms", 100)))
+                    sleep_ms(timings.after_drag_ms)
                     variant = ""
                     current_level = -1
                     continue
@@ -1378,12 +1641,12 @@ class SharpeningPlugin(PluginInterface):
 
         def finalize_and_back(bi: int) -> None:
             sharpening.click_repeat(reset_window_top_left=True)
-            sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+            sleep_ms(timings.after_repeat_ready_ms)
             backpacks.ensure_backpack_window_available(int(bi))
 
         def do_one_attempt(variant: str) -> bool:
             sharpening.click_auto()
-            sleep_ms(int(timings_ms.get("after_click_auto_ms", 100)))
+            sleep_ms(timings.after_click_auto_ms)
             try:
                 sharpening.ensure_auto_button_active()
             except Exception as e:
@@ -1396,11 +1659,11 @@ class SharpeningPlugin(PluginInterface):
                     return False
                 raise
             sharpening.click_ok()
-            sleep_ms(int(timings_ms.get("after_click_ok_ms", 500)))
+            sleep_ms(timings.after_click_ok_ms)
             sharpening.click_map()
-            sleep_ms(int(timings_ms.get("after_click_map_ms", 800)))
+            sleep_ms(timings.after_click_map_ms)
             sharpening.click_repeat(reset_window_top_left=True)
-            sleep_ms(int(timings_ms.get("after_repeat_ready_ms", 250)))
+            sleep_ms(timings.after_repeat_ready_ms)
             return True
 
         def _read_inserted_item() -> tuple[bool, str, int]:
@@ -630,6 +630,17 @@ class SharpeningWidget(QWidget):
         self.start_btn.setVisible(not busy)
         self._update_start_enabled()
 
+    @Slot(bool, bool)
+    def set_state(self, run_active: bool, busy: bool) -> None:
+        """Объединённое обновление run_active и busy одним событием очереди."""
+        self._run_active = bool(run_active)
+        if not self._run_active:
+            try:
+                self.stop_sharpening_clicked.emit()
+            except Exception:
+                pass
+        self.set_busy(bool(busy) and self._run_active)
+
     def _update_start_enabled(self) -> None:
         can = bool(self._run_active) and bool(self._selected_nickname_is_active())
         self.start_btn.setEnabled(bool(can))
@@ -872,6 +883,28 @@ class SharpeningWidget(QWidget):
         if not self._profile_loading:
             self.config_changed.emit()
 
+    def set_groups(self, groups: list[list[list[int]]]) -> None:
+        """
+        Применяет всю 8×5×5 матрицу групп (формат export_groups) одним проходом:
+        модель заполняется целиком, вид обновляется один раз, а не на каждую ячейку.
+        """
+        for bi in range(8):
+            model = self._groups.get(bi)
+            if model is None:
+                continue
+            bag = (groups[bi] if bi < len(groups or []) else None) or []
+            for r in range(5):
+                row = (bag[r] if r < len(bag) else None) or []
+                for c in range(5):
+                    try:
+                        g = int(row[c] or 0) if c < len(row) else 0
+                    except Exception:
+                        g = 0
+                    model[r][c] = g if g > 0 else None
+        self._apply_view_from_model_all()
+        if not self._profile_loading:
+            self.config_changed.emit()
+
     def get_mode_key(self) -> str:
         try:
             v = str(self.mode_combo.currentData() or "").strip()
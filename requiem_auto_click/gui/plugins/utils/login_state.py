@@ -109,3 +109,16 @@ def active_pid_for_nickname(rows: list[LoginRowState], nickname: str) -> int:
             return int(r.pid)
     return 0
 
+
+def active_pids_by_nickname(rows: list[LoginRowState]) -> dict[str, int]:
+    """Активные PID по никам за один проход (первый активный PID для ника)."""
+    out: dict[str, int] = {}
+    for r in rows:
+        if not r.is_active:
+            continue
+        nick = str(r.nickname or "").strip()
+        if not nick or nick in out:
+            continue
+        out[nick] = int(r.pid)
+    return out
+
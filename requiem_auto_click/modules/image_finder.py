@@ -158,6 +158,7 @@ class ImageFinder:
         threshold: float = 0.93,
         timeout_s: float = 2.0,
         poll_s: float = 0.1,
+        poll_initial_s: Optional[float] = None,
         alpha_threshold: int = 10,
     ) -> Optional[Dict[str, Any]]:
         """
@@ -169,7 +170,10 @@ class ImageFinder:
             roi_size: (w, h) ROI в client координатах.
             threshold: порог совпадения (score).
             timeout_s: таймаут поиска (повторные пробы).
-            poll_s: задержка между пробами.
+            poll_s: задержка между пробами (максимальная при адаптивном poll).
+            poll_initial_s: если задано — пауза стартует с этого значения и
+                удваивается после каждого промаха до poll_s (быстрая реакция
+                на раннее появление, тот же idle-CPU при долгом ожидании).
             alpha_threshold: порог альфа-канала для маски (для PNG с alpha).
 
         Returns:
@@ -185,6 +189,8 @@ class ImageFinder:
         rx, ry = roi_top_left_client
         rw, rh = roi_size
 
+        sleep_s = float(poll_initial_s) if poll_initial_s else float(poll_s)
+
         t0 = time.perf_counter()
         while (time.perf_counter() - t0) < float(timeout_s):
             # ROI в экранных координатах, учитывая текущую позицию окна
@@ -193,7 +199,8 @@ class ImageFinder:
 
             frame = self._grab_region_bgr(region)  # BGR
             if frame is None:
-                time.sleep(poll_s)
+                time.sleep(sleep_s)
+                sleep_s = min(sleep_s * 2.0, float(poll_s))
                 continue
 
             img_gray = _cv2.cvtColor(frame, _cv2.COLOR_BGR2GRAY)  # type: ignore[attr-defined]
@@ -224,7 +231,8 @@ class ImageFinder:
                 )
                 return hit.as_dict()
 
-            time.sleep(poll_s)
+            time.sleep(sleep_s)
+            sleep_s = min(sleep_s * 2.0, float(poll_s))
 
         return None
 
@@ -27,13 +27,20 @@ class MailboxCancelledError(RuntimeError):
     """Сигнализирует об остановке плагина/скрипта (cancel)."""
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class MailboxConfirmSpec:
-    """Параметры окна подтверждения для конкретного сценария."""
-
-    roi_top_left: tuple[int, int]
-    roi_size: tuple[int, int]
-    confirm_click_client: tuple[int, int]
+    """Параметры окна подтверждения для конкретного сценария.
+
+    Поля плоские (int), без вложенных кортежей: спек создаётся на каждый
+    пересчёт настроек, а читается в горячем цикле ожидания подтверждения.
+    """
+
+    roi_x: int
+    roi_y: int
+    roi_w: int
+    roi_h: int
+    click_x: int
+    click_y: int
     label: str
 
 
@@ -55,6 +62,8 @@ class MailboxTimings:
     wait_deletion_confirm_timeout_delete_s: float = 2.0
     wait_deletion_confirm_poll_get_content_s: float = 0.1
     wait_deletion_confirm_poll_delete_s: float = 0.1
+    # адаптивный poll подтверждений: старт с poll_initial_s, удвоение до poll_s
+    poll_initial_s: float = 0.005
 
     deletion_confirm_post_click_delay_s: float = 0.2
     deletion_confirm_disappear_timeout_s: float = 1.0
@@ -137,15 +146,21 @@ class MailboxManager:
         self._cancel = cancel
         self._timings = timings or MailboxTimings()
         self._confirm_auto = confirm_auto_delete or MailboxConfirmSpec(
-            roi_top_left=self.DELETION_CONFIRM_ROI_TOP_LEFT,
-            roi_size=self.DELETION_CONFIRM_ROI_SIZE,
-            confirm_click_client=self.CLICK_CONFIRM_DELETION_CLIENT,
+            roi_x=self.DELETION_CONFIRM_ROI_TOP_LEFT[0],
+            roi_y=self.DELETION_CONFIRM_ROI_TOP_LEFT[1],
+            roi_w=self.DELETION_CONFIRM_ROI_SIZE[0],
+            roi_h=self.DELETION_CONFIRM_ROI_SIZE[1],
+            click_x=self.CLICK_CONFIRM_DELETION_CLIENT[0],
+            click_y=self.CLICK_CONFIRM_DELETION_CLIENT[1],
             label="auto-delete",
         )
         self._confirm_manual = confirm_manual_delete or MailboxConfirmSpec(
-            roi_top_left=self.DELETION_CONFIRM_ROI_TOP_LEFT,
-            roi_size=self.DELETION_CONFIRM_ROI_SIZE,
-            confirm_click_client=self.CLICK_CONFIRM_DELETION_CLIENT,
+            roi_x=self.DELETION_CONFIRM_ROI_TOP_LEFT[0],
+            roi_y=self.DELETION_CONFIRM_ROI_TOP_LEFT[1],
+            roi_w=self.DELETION_CONFIRM_ROI_SIZE[0],
+            roi_h=self.DELETION_CONFIRM_ROI_SIZE[1],
+            click_x=self.CLICK_CONFIRM_DELETION_CLIENT[0],
+            click_y=self.CLICK_CONFIRM_DELETION_CLIENT[1],
             label="manual-delete",
         )
 
@@ -400,6 +415,7 @@ class MailboxManager:
         threshold: float = 0.93,
         timeout_s: float = 0.4,
         poll_s: float = 0.1,
+        poll_initial_s: float | None = None,
     ) -> dict | None:
         self._check_cancel()
         self._ensure_window_active()
@@ -410,6 +426,7 @@ class MailboxManager:
             threshold=threshold,
             timeout_s=timeout_s,
             poll_s=poll_s,
+            poll_initial_s=poll_initial_s,
         )
         self._check_cancel()
         return hit
@@ -470,10 +487,11 @@ class MailboxManager:
         self._sleep(float(initial_delay_s))
         return self._find_in_roi(
             self.TEMPLATE_WINDOW_DELETION_CONFIRMATION,
-            tuple(spec.roi_top_left),
-            tuple(spec.roi_size),
+            (spec.roi_x, spec.roi_y),
+            (spec.roi_w, spec.roi_h),
             timeout_s=float(timeout_s),
             poll_s=float(poll_s),
+            poll_initial_s=float(self._timings.poll_initial_s),
         )
 
     def _click_client(self, xy: tuple[int, int]) -> None:
@@ -511,7 +529,7 @@ class MailboxManager:
         if hit is None:
             raise RuntimeError("Окно подтверждения удаления не появилось (timeout).")
         self._emit_log(f"[MAILBOX] deletion confirmation appeared ({spec.label}) -> click confirm")
-        self._click_client(tuple(spec.confirm_click_client))
+        self._click_client((spec.click_x, spec.click_y))
         self._ensure_deletion_confirmation_closed_or_error(spec)
 
     def _delete_mail_manual(self) -> None:
@@ -542,7 +560,7 @@ class MailboxManager:
             return "retry"
 
         self._emit_log("[MAILBOX] auto-delete confirmation appeared -> click confirm")
-        self._click_client(tuple(self._confirm_auto.confirm_click_client))
+        self._click_client((self._confirm_auto.click_x, self._confirm_auto.click_y))
         self._ensure_deletion_confirmation_closed_or_error(self._confirm_auto)
         return "processed"
 